@@ -4,7 +4,10 @@ Main entry point for the Auto Trading Bot.
 """
 
 import sys
-import time
+import signal
+import asyncio
+import threading
+from typing import Optional
 from loguru import logger
 from datetime import datetime
 
@@ -12,7 +15,15 @@ from src.config.settings import get_settings
 from src.strategy.llm_strategy import LLMTradingStrategy
 from src.risk.risk_manager import RiskManager
 from src.execution.trade_executor import TradeExecutor
-from src.data.binance_client import BinanceClient
+from src.data.binance_client import BinanceClient, get_client
+from src.data.market_data import MarketData
+from src.data.kline_stream import KlineStream
+from src.config.constants import ACTION_CLOSE, TRADE_ACTIONS
+
+_BANNER = "=" * 60
+
+# Set by SIGTERM so the loop exits between frames instead of finishing a long wait
+_shutdown = threading.Event()
 
 
 def setup_logging():
@@ -28,12 +39,13 @@ def setup_logging():
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
     )
 
-    # File output
+    # File output (enqueue: writes/rotation run on loguru's worker thread, not the trading loop)
     logger.add(
         settings.log_file,
         level="DEBUG",
         rotation=f"{settings.log_max_size} MB",
         retention=settings.log_backup_count,
+        enqueue=True,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
     )
 
@@ -56,150 +68,233 @@ def run_trading_bot():
     # Initialize components
     logger.info("Initializing trading bot components...")
 
-    client = BinanceClient()
-    if not client.check_connection():
-        logger.error("Failed to connect to Binance. Exiting.")
-        return
+    trading_mode = settings.trading_mode
+    market_type = settings.market_type
+    symbol = settings.trading_symbol
+    timeframe = settings.trading_timeframe
+    quote_currency = symbol.split("/", 1)[1]
 
-    strategy = LLMTradingStrategy(
-        market_data=None,  # Will create its own
-        gemini_client=None,  # Will create its own
-    )
+    # market_type에 맞는 잔고만 조회
+    # futures: defaultType이 futures이므로 파라미터 없이 호출
+    # spot: "spot" 명시
+    balance_type = None if market_type == "futures" else "spot"
 
-    risk_manager = RiskManager()
-    executor = TradeExecutor(client=client)
+    # Connection check and initial balance are independent round trips - overlap them
+    client = get_client()
+    try:
+        connected, balance = asyncio.run(_fetch_startup_state(client, balance_type))
 
-    logger.info("✅ All components initialized successfully")
+        if connected is not True:
+            logger.error("Failed to connect to Binance. Exiting.")
+            return
+        if isinstance(balance, Exception):
+            logger.error(f"Failed to fetch {market_type} balance: {balance}")
+            return
 
-    # Get initial account balance
-    quote_currency = settings.trading_symbol.split("/")[1]
-    try:
-        # market_type에 맞는 잔고만 조회
-        # futures: defaultType이 futures이므로 파라미터 없이 호출
-        # spot: "spot" 명시
-        balance_type = None if settings.market_type == "futures" else "spot"
-        balance = client.fetch_balance(balance_type)
-        account_balance = float(balance.get("free", {}).get(quote_currency, 0))
-        logger.info(f"{settings.market_type.upper()} free balance: {account_balance:,.2f} {quote_currency}")
-    except Exception as e:
-        logger.error(f"Failed to fetch {settings.market_type} balance: {e}")
-        return
+        free_balances = balance.get("free") or {}
+        account_balance = float(free_balances.get(quote_currency) or 0)
+        logger.info(f"{market_type.upper()} free balance: {account_balance:,.2f} {quote_currency}")
 
-    if account_balance <= 0:
-        logger.error("Insufficient balance. Exiting.")
-        return
+        strategy = LLMTradingStrategy(
+            market_data=MarketData(client=client),  # Share one pooled session
+            gemini_client=None,  # Will create its own
+        )
 
-    # Main trading loop
-    logger.info("🚀 Starting trading loop...")
-    logger.info(f"Mode: {settings.trading_mode.upper()}")
-    logger.info(f"Market: {settings.market_type.upper()}")
-    logger.info(f"Symbol: {settings.trading_symbol}")
-    logger.info(f"Timeframe: {settings.trading_timeframe}")
+        risk_manager = RiskManager()
+        executor = TradeExecutor(client=client)
 
-    iteration = 0
-    while True:
-        try:
-            iteration += 1
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Iteration #{iteration} - {datetime.now()}")
-            logger.info(f"{'='*60}")
-
-            # Check stop-loss / take-profit
-            if executor.current_position:
-                sl_tp = executor.check_stop_loss_take_profit()
-                if sl_tp:
-                    logger.warning(f"{sl_tp.upper()} triggered!")
-                    result = executor._execute_close()
-                    if result["status"] == "success":
-                        risk_manager.update_daily_pnl(result["pnl"])
-                        strategy.record_trade(
-                            action="CLOSE",
-                            entry_price=result["entry_price"],
-                            exit_price=result["exit_price"],
-                            pnl=result["pnl"],
-                        )
-
-            # Get trading decision from LLM
-            decision = strategy.analyze_and_decide()
-
-            logger.info(f"\n📊 Decision: {decision.action.value}")
-            logger.info(f"   Confidence: {decision.confidence:.1%}")
-            logger.info(f"   Reasoning: {decision.reasoning}")
-
-            # Validate decision with risk manager
-            is_valid, reason = risk_manager.validate_decision(
-                decision=decision,
-                account_balance=account_balance,
-                current_position=executor.current_position,
-            )
+        logger.info("✅ All components initialized successfully")
+
+        if account_balance <= 0:
+            logger.error("Insufficient balance. Exiting.")
+            return
 
-            if not is_valid:
-                logger.warning(f"⚠️  Decision rejected: {reason}")
-                time.sleep(60)  # Wait before next iteration
-                continue
-
-            # Calculate position size
-            if decision.action.value in ["BUY", "SELL"]:
-                current_price = strategy.market_data.get_current_price()
-                position_size = risk_manager.calculate_position_size(
-                    account_balance=account_balance,
-                    entry_price=current_price,
-                    stop_loss_pct=decision.stop_loss_pct,
-                )
-
-                # Execute trade
-                logger.info(f"\n💰 Executing {decision.action.value}...")
-                result = executor.execute_decision(decision, position_size)
-
-                if result["status"] == "success":
-                    logger.success(f"✅ Trade executed successfully!")
-                    logger.info(f"   Price: ${result['price']:,.2f}")
-                    logger.info(f"   Size: {result['size']:.8f}")
-
-                    strategy.update_position(
-                        action=decision.action.value,
-                        entry_price=result["price"],
-                        size=result["size"],
-                    )
-                else:
-                    logger.error(f"❌ Trade execution failed: {result.get('message')}")
-
-            # Show current position
-            if executor.current_position:
-                pnl = executor.get_position_pnl()
-                logger.info(f"\n📍 Current Position:")
-                logger.info(f"   Type: {executor.current_position['action']}")
-                logger.info(f"   Entry: ${executor.current_position['entry_price']:,.2f}")
-                logger.info(f"   Size: {executor.current_position['size']:.8f}")
-                logger.info(f"   Unrealized P&L: ${pnl:+,.2f}")
-
-            # Show risk status
-            risk_status = risk_manager.get_risk_status()
-            logger.info(f"\n⚖️  Risk Status:")
-            logger.info(f"   Daily P&L: ${risk_status['daily_pnl']:+,.2f}")
-            logger.info(f"   Consecutive Losses: {risk_status['consecutive_losses']}")
-            logger.info(f"   Trading Halted: {risk_status['trading_halted']}")
-
-            # Wait before next iteration
-            # In real trading, this should be the timeframe duration
-            if settings.trading_mode == "backtest":
-                logger.info("\n⏸️  Backtest mode - stopping after one iteration")
-                break
-            else:
-                wait_seconds = BinanceClient._timeframe_to_seconds(settings.trading_timeframe)
-                logger.info(f"\n⏳ Waiting {wait_seconds}s ({settings.trading_timeframe}) until next analysis...")
-                time.sleep(wait_seconds)
+        # Main trading loop
+        logger.info("🚀 Starting trading loop...")
+        logger.info(f"Mode: {trading_mode.upper()}")
+        logger.info(f"Market: {market_type.upper()}")
+        logger.info(f"Symbol: {symbol}")
+        logger.info(f"Timeframe: {timeframe}")
 
+        signal.signal(signal.SIGTERM, _request_shutdown)
+        try:
+            asyncio.run(trading_loop(strategy, risk_manager, executor, account_balance))
         except KeyboardInterrupt:
             logger.info("\n⏹️  Interrupted by user. Shutting down...")
-            break
-        except Exception as e:
-            logger.exception(f"❌ Error in main loop: {e}")
-            time.sleep(60)  # Wait before retrying
+    finally:
+        # Release pooled HTTP connections
+        client.close()
 
     logger.info("🛑 Trading bot stopped")
 
 
+def _request_shutdown(signum, frame):
+    """Signal handler: ask the trading loop to stop."""
+    logger.info("\n⏹️  Received signal {}. Shutting down...", signum)
+    _shutdown.set()
+
+
+async def _fetch_startup_state(client: BinanceClient, balance_type: Optional[str]) -> list:
+    """Run the connection check and balance fetch concurrently (exceptions are returned)."""
+    return await asyncio.gather(
+        asyncio.to_thread(client.check_connection),
+        asyncio.to_thread(client.fetch_balance, balance_type),
+        return_exceptions=True,
+    )
+
+
+async def trading_loop(
+    strategy: LLMTradingStrategy,
+    risk_manager: RiskManager,
+    executor: TradeExecutor,
+    account_balance: float,
+):
+    """Run one iteration at startup, then one per closed candle from the kline stream."""
+    settings = get_settings()
+    is_backtest = settings.trading_mode == "backtest"
+    timeframe = settings.trading_timeframe
+
+    iteration = 1
+    await _run_iteration_safely(iteration, strategy, risk_manager, executor, account_balance)
+
+    if is_backtest:
+        logger.info("\n⏸️  Backtest mode - stopping after one iteration")
+        return
+
+    stream = KlineStream()
+    logger.info("\n⏳ Waiting for {} candle close...", timeframe)
+    async for _ in stream.candle_closes(stop_event=_shutdown):
+        iteration += 1
+        await _run_iteration_safely(iteration, strategy, risk_manager, executor, account_balance)
+        if _shutdown.is_set():
+            break
+        logger.info("\n⏳ Waiting for {} candle close...", timeframe)
+
+
+async def _run_iteration_safely(
+    iteration: int,
+    strategy: LLMTradingStrategy,
+    risk_manager: RiskManager,
+    executor: TradeExecutor,
+    account_balance: float,
+):
+    """Run a blocking iteration off the event loop so the WebSocket stays serviced."""
+    try:
+        await asyncio.to_thread(
+            run_iteration, iteration, strategy, risk_manager, executor, account_balance
+        )
+    except Exception as e:
+        logger.exception(f"❌ Error in main loop: {e}")
+
+
+def run_iteration(
+    iteration: int,
+    strategy: LLMTradingStrategy,
+    risk_manager: RiskManager,
+    executor: TradeExecutor,
+    account_balance: float,
+):
+    """Single analysis and execution cycle."""
+    logger.info("\n{}", _BANNER)
+    logger.opt(lazy=True).info("Iteration #{} - {}", lambda: iteration, datetime.now)
+    logger.info(_BANNER)
+
+    # Pick up a position the exchange already closed (triggered protective order)
+    closed = executor.sync_with_exchange()
+    if closed:
+        _record_close(closed, strategy, risk_manager)
+
+    # Check stop-loss / take-profit
+    if executor.current_position:
+        sl_tp = executor.check_stop_loss_take_profit()
+        if sl_tp:
+            logger.warning("{} triggered!", sl_tp.upper())
+            result = executor._execute_close()
+            if result["status"] == "success":
+                _record_close(result, strategy, risk_manager)
+
+    # Get trading decision from LLM
+    decision = strategy.analyze_and_decide()
+
+    logger.info("\n📊 Decision: {}", decision.action.value)
+    logger.info("   Confidence: {:.1%}", decision.confidence)
+    logger.info("   Reasoning: {}", decision.reasoning)
+
+    # Validate decision with risk manager
+    is_valid, reason = risk_manager.validate_decision(
+        decision=decision,
+        account_balance=account_balance,
+        current_position=executor.current_position,
+    )
+
+    if not is_valid:
+        logger.warning("⚠️  Decision rejected: {}", reason)
+        return
+
+    # Calculate position size
+    if decision.action in TRADE_ACTIONS:
+        current_price = strategy.market_data.get_current_price()
+        position_size = risk_manager.calculate_position_size(
+            account_balance=account_balance,
+            entry_price=current_price,
+            stop_loss_pct=decision.stop_loss_pct,
+        )
+
+        # Execute trade
+        logger.info("\n💰 Executing {}...", decision.action.value)
+        result = executor.execute_decision(decision, position_size)
+
+        if result["status"] == "success":
+            logger.success("✅ Trade executed successfully!")
+            logger.info("   Price: ${:,.2f}", result["price"])
+            logger.info("   Size: {:.8f}", result["size"])
+
+            strategy.update_position(
+                action=decision.action.value,
+                entry_price=result["price"],
+                size=result["size"],
+            )
+        else:
+            logger.error("❌ Trade execution failed: {}", result.get("message"))
+
+    # Show current position
+    # Positional/lazy args: nothing is formatted (or fetched) unless INFO is enabled
+    position = executor.current_position
+    if position:
+        logger.info("\n📍 Current Position:")
+        logger.info("   Type: {}", position.action)
+        logger.info("   Entry: ${:,.2f}", position.entry_price)
+        logger.info("   Size: {:.8f}", position.size)
+        logger.opt(lazy=True).info("   Unrealized P&L: ${:+,.2f}", executor.get_position_pnl)
+
+    # Show risk status
+    risk_status = risk_manager.get_risk_status()
+    logger.info("\n⚖️  Risk Status:")
+    logger.info("   Daily P&L: ${:+,.2f}", risk_status.daily_pnl)
+    logger.info("   Consecutive Losses: {}", risk_status.consecutive_losses)
+    logger.info("   Trading Halted: {}", risk_status.trading_halted)
+
+
+def _record_close(
+    result: dict,
+    strategy: LLMTradingStrategy,
+    risk_manager: RiskManager,
+):
+    """Feed a closed position's P&L to the risk manager and the strategy's trade history."""
+    risk_manager.update_daily_pnl(result["pnl"])
+    strategy.record_trade(
+        action=ACTION_CLOSE,
+        entry_price=result["entry_price"],
+        exit_price=result["exit_price"],
+        pnl=result["pnl"],
+    )
+    strategy.update_position(
+        action=ACTION_CLOSE,
+        entry_price=result["entry_price"],
+        size=0.0,
+    )
+
+
 def main():
     """Entry point."""
     try:
@@ -214,6 +309,10 @@ def main():
         logger.exception(f"Fatal error: {e}")
         sys.exit(1)
 
+    finally:
+        # Flush queued file-log records before the process exits
+        logger.complete()
+
 
 if __name__ == "__main__":
     main()
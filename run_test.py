@@ -1,18 +1,12 @@
 #!/usr/bin/env python3
 """
-Test runner that properly sets up Python path.
+Gemini connection test runner.
 Run this from project root: python run_test.py
+(Python puts the script's directory - the project root - on sys.path, so `src` imports resolve.)
 """
 
-import sys
-from pathlib import Path
-
-# Add project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-
 if __name__ == "__main__":
-    # Now we can import from src
+    # Project root is sys.path[0] when run as a script
     from src.llm.gemini_client import GeminiClient
 
     print("Testing Gemini Client...")
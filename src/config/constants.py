@@ -3,6 +3,10 @@ Constants used throughout the trading system.
 """
 
 from enum import Enum
+from types import MappingProxyType
+from typing import Any, Final
+
+import orjson
 
 
 class TradingMode(str, Enum):
@@ -43,6 +47,15 @@ class TradingAction(str, Enum):
     CLOSE = "CLOSE"
 
 
+# Plain-str action values for hot comparisons (skip Enum attribute lookups)
+ACTION_BUY: Final[str] = TradingAction.BUY.value
+ACTION_SELL: Final[str] = TradingAction.SELL.value
+ACTION_HOLD: Final[str] = TradingAction.HOLD.value
+ACTION_CLOSE: Final[str] = TradingAction.CLOSE.value
+# Actions that open/flip a position; TradingAction members hash and compare equal to these
+TRADE_ACTIONS: Final[frozenset[str]] = frozenset({ACTION_BUY, ACTION_SELL})
+
+
 class Timeframe(str, Enum):
     """Timeframes for candlestick data."""
     MINUTE_1 = "1m"
@@ -57,7 +70,7 @@ class Timeframe(str, Enum):
     MONTH_1 = "1M"
 
 
-# Technical Indicator Parameters
+# Technical Indicator Parameters (read-only, frozen below)
 INDICATOR_PARAMS = {
     "RSI": {
         "period": 14,
@@ -93,6 +106,32 @@ INDICATOR_PARAMS = {
         "oversold": 20,
     },
 }
+INDICATOR_PARAMS = MappingProxyType(
+    {name: MappingProxyType(params) for name, params in INDICATOR_PARAMS.items()}
+)
+
+# Optional C backend for indicators - TA-Lib if installed, otherwise pandas/ta
+# INDICATOR_FUNCS는 INDICATOR_PARAMS와 같은 키를 사용 (+ 파라미터 없는 OBV/MFI)
+try:
+    import talib
+
+    _backend = "talib"
+    INDICATOR_FUNCS = MappingProxyType({
+        "RSI": talib.RSI,
+        "MACD": talib.MACD,
+        "BOLLINGER_BANDS": talib.BBANDS,
+        "ATR": talib.ATR,
+        "SMA": talib.SMA,
+        "EMA": talib.EMA,
+        "STOCHASTIC": talib.STOCH,
+        "OBV": talib.OBV,
+        "MFI": talib.MFI,
+    })
+except ImportError:
+    _backend = "pandas"
+    INDICATOR_FUNCS = MappingProxyType({})
+INDICATOR_BACKEND: Final[str] = _backend
+del _backend
 
 # Performance Metrics Thresholds
 PERFORMANCE_THRESHOLDS = {
@@ -110,6 +149,23 @@ API_CONFIG = {
     "rate_limit_per_minute": 1200,
 }
 
+# Binance public WebSocket market streams (keyed by settings.market_type)
+BINANCE_WS_URLS = {
+    "spot": "wss://stream.binance.com:9443/ws",
+    "futures": "wss://fstream.binance.com/ws",
+}
+
+# JSON codec shared by hot data paths (orjson: bytes in, C-level parse)
+JSON_LOADS = orjson.loads
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to a JSON str with orjson (indent=True: 2-space pretty print)."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode()
+
+
+JSON_DUMPS = _json_dumps
+
 # Database
 DATABASE_CONFIG = {
     "pool_size": 5,
@@ -1,278 +1,420 @@
 """
-Settings management using Pydantic for type-safe configuration.
+Settings management using a frozen dataclass loaded from environment variables / .env.
 """
 
-from typing import Optional, Literal
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import os
+import re
+import sys
+import threading
+from dataclasses import MISSING, dataclass, field, fields
+from functools import lru_cache
+from typing import Any, Callable, Optional, Literal, Union, get_args, get_origin
 from datetime import datetime
 
+from dotenv import dotenv_values
+
+
+# Marker used by .env.example for unset credentials
+_PLACEHOLDER = "your_"
+
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS: frozenset[str] = frozenset(_LOG_LEVELS)
+
+# String fields interned after validation
+_INTERNED_FIELDS = (
+    "trading_symbol",
+    "trading_timeframe",
+    "trading_mode",
+    "market_type",
+    "margin_mode",
+    "gemini_model",
+    "log_level",
+)
+
+# Accepted boolean spellings (same set pydantic accepted)
+_TRUE_STRINGS = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_STRINGS = frozenset({"0", "false", "f", "no", "n", "off"})
+
+
+_BANNER = "=" * 60
+
+# print_summary() layout, formatted with s=settings
+_SUMMARY_TEMPLATE = (
+    f"{_BANNER}\n"
+    "🤖 Auto Trading Bot - Configuration Summary\n"
+    f"{_BANNER}\n"
+    "Trading Mode:     {trading_mode} ({mode_label})\n"
+    "Market Type:      {market_type}\n"
+    "{futures}"
+    "Symbol:           {s.trading_symbol}\n"
+    "Timeframe:        {s.trading_timeframe}\n"
+    "Risk per Trade:   {s.risk_per_trade:.1%}\n"
+    "Max Position:     {s.max_position_size:.1%}\n"
+    "Stop Loss:        {s.default_stop_loss_pct:.1%}\n"
+    "Take Profit:      {s.default_take_profit_pct:.1%}\n"
+    "Min Confidence:   {s.min_confidence}\n"
+    "LLM Model:        {s.gemini_model}\n"
+    f"{_BANNER}\n"
+)
+_SUMMARY_FUTURES_TEMPLATE = (
+    "Leverage:         {s.leverage}x\n"
+    "Margin Mode:      {margin_mode}\n"
+)
+
+
+def _is_placeholder(key: Optional[str]) -> bool:
+    """Check whether a credential still holds the .env.example placeholder."""
+    return key is not None and _PLACEHOLDER in key.casefold()
+
+
+# validate_settings() rules: (check, message template formatted with s=settings), in report order
+_WARNING_RULES = (
+    # Live trading
+    (lambda s: s.is_live_trading,
+     "⚠️  WARNING: TRADING_MODE=live. Real money at risk!"),
+    # Risk settings
+    (lambda s: s.risk_per_trade > 0.05,
+     "⚠️  High risk per trade: {s.risk_per_trade:.1%} (recommended: ≤5%)"),
+    (lambda s: s.max_position_size > 0.20,
+     "⚠️  Large max position size: {s.max_position_size:.1%} (recommended: ≤20%)"),
+    (lambda s: s.min_confidence < 0.60,
+     "⚠️  Low confidence threshold: {s.min_confidence} (recommended: ≥0.6)"),
+    # API keys
+    (lambda s: s.is_demo_mode and not (s.binance_demo_api_key and s.binance_demo_api_secret),
+     "❌ ERROR: Demo API keys not configured!"),
+    (lambda s: s.is_demo_mode and bool(s.binance_demo_api_secret) and _is_placeholder(s.binance_demo_api_key),
+     "❌ ERROR: Demo API key not configured!"),
+    (lambda s: s.is_live_trading and not (s.binance_api_key and s.binance_api_secret),
+     "❌ ERROR: Binance live API keys not configured!"),
+    (lambda s: s.is_live_trading and bool(s.binance_api_secret) and _is_placeholder(s.binance_api_key),
+     "❌ ERROR: Binance live API key not configured!"),
+    (lambda s: _is_placeholder(s.gemini_api_key),
+     "❌ ERROR: Gemini API key not configured!"),
+    # Futures trading
+    (lambda s: s.market_type == "futures",
+     "⚠️  FUTURES TRADING ENABLED - Higher risk of liquidation!"),
+    (lambda s: s.market_type == "futures" and s.leverage > 10,
+     "⚠️  HIGH LEVERAGE: {s.leverage}x - Extreme risk!"),
+    (lambda s: s.market_type == "futures" and s.margin_mode == "cross",
+     "⚠️  CROSS MARGIN - Entire account balance at risk!"),
+)
+
+
+@lru_cache(maxsize=16)
+def _parse_date(value: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD date (cached; datetimes are immutable).
+
+    Args:
+        value: Date string
+
+    Returns:
+        Parsed datetime
+
+    Raises:
+        ValueError: If value is not a YYYY-MM-DD date
+    """
+    # fromisoformat is C-accelerated but also accepts other ISO forms (e.g. 2024-W01-1)
+    if _DATE_RE.fullmatch(value) is None:
+        raise ValueError(f"Invalid date: {value!r}")
+    return datetime.fromisoformat(value)
+
 
-class Settings(BaseSettings):
+def _setting(
+    default: Any = MISSING,
+    *,
+    ge: Optional[float] = None,
+    le: Optional[float] = None,
+    description: str = "",
+):
+    """Declare a settings field with optional inclusive bounds."""
+    return field(default=default, metadata={"ge": ge, "le": le, "description": description})
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Settings:
     """
     Application settings loaded from environment variables.
+    Immutable after construction; derived flags and warnings are computed once.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
     # ============================================
     # Binance API Configuration
     # ============================================
-    binance_api_key: Optional[str] = Field(default=None, description="Binance live API key")
-    binance_api_secret: Optional[str] = Field(default=None, description="Binance live API secret")
-    binance_demo_api_key: Optional[str] = Field(default=None, description="Binance demo API key")
-    binance_demo_api_secret: Optional[str] = Field(default=None, description="Binance demo API secret")
+    binance_api_key: Optional[str] = _setting(None, description="Binance live API key")
+    binance_api_secret: Optional[str] = _setting(None, description="Binance live API secret")
+    binance_demo_api_key: Optional[str] = _setting(None, description="Binance demo API key")
+    binance_demo_api_secret: Optional[str] = _setting(None, description="Binance demo API secret")
 
     # ============================================
     # Google Gemini API Configuration
     # ============================================
-    gemini_api_key: str = Field(..., description="Gemini API key")
-    gemini_model: str = Field(
-        default="gemini-3-flash-preview",
-        description="Gemini model to use"
+    gemini_api_key: str = _setting(description="Gemini API key")
+    gemini_model: str = _setting("gemini-3-flash-preview", description="Gemini model to use")
+    gemini_max_tokens: int = _setting(4096, description="Max tokens per request")
+    gemini_temperature: float = _setting(
+        0.7, ge=0.0, le=2.0, description="Temperature for response generation"
+    )
+    gemini_cache_ttl: int = _setting(
+        0, ge=0, le=86400,
+        description="TTL (s) of the Gemini context cache holding the system prompt (0 = disabled)",
+    )
+    gemini_response_cache_ttl: int = _setting(
+        300, ge=0, le=86400,
+        description="Seconds a temperature-0 response is reused for an identical prompt (0 = disabled)",
+    )
+    semantic_cache_enabled: bool = _setting(
+        False, description="Reuse responses of near-duplicate prompts (numbers rounded) at any temperature"
     )
-    gemini_max_tokens: int = Field(default=4096, description="Max tokens per request")
-    gemini_temperature: float = Field(
-        default=0.7,
-        ge=0.0,
-        le=2.0,
-        description="Temperature for response generation"
+    semantic_cache_digits: int = _setting(
+        3, ge=1, le=10, description="Significant digits kept per number when matching near-duplicate prompts"
+    )
+    gemini_early_hold: bool = _setting(
+        True, description="Stop the Gemini response stream as soon as a HOLD decision is decoded"
+    )
+    gemini_stream_fastpath: bool = _setting(
+        False,
+        description="Stop the Gemini response stream once any action and its confidence are decoded "
+        "(stop loss, take profit and size then use their defaults)",
+    )
+    gemini_max_concurrency: int = _setting(
+        4, ge=1, le=32, description="Maximum concurrent Gemini requests when analyzing several symbols"
+    )
+    gemini_rpm: int = _setting(
+        15, ge=0, le=10000, description="Gemini requests per minute allowed by the client-side pacer (0 = unpaced)"
+    )
+    gemini_breaker_cooldown: int = _setting(
+        60, ge=0, le=3600,
+        description="Seconds Gemini is not called after repeated rate limits (0 = no circuit breaker)",
     )
 
     # ============================================
     # Trading Configuration
     # ============================================
-    trading_symbol: str = Field(default="BTC/USDT", description="Trading pair")
-    market_type: Literal["spot", "futures"] = Field(
-        default="spot",
-        description="Market type (spot or futures)"
-    )
-    leverage: int = Field(
-        default=1,
-        ge=1,
-        le=125,
-        description="Leverage for futures trading (1-125x)"
+    trading_symbol: str = _setting("BTC/USDT", description="Trading pair")
+    market_type: Literal["spot", "futures"] = _setting(
+        "spot", description="Market type (spot or futures)"
     )
-    margin_mode: Literal["isolated", "cross"] = Field(
-        default="isolated",
-        description="Margin mode for futures"
+    leverage: int = _setting(1, ge=1, le=125, description="Leverage for futures trading (1-125x)")
+    margin_mode: Literal["isolated", "cross"] = _setting(
+        "isolated", description="Margin mode for futures"
     )
-    trading_mode: Literal["live", "demo", "backtest"] = Field(
-        default="demo",
-        description="Trading mode: live (real money), demo (Binance Demo Trading), backtest"
+    trading_mode: Literal["live", "demo", "backtest"] = _setting(
+        "demo", description="Trading mode: live (real money), demo (Binance Demo Trading), backtest"
     )
-    trading_timeframe: str = Field(default="1h", description="Timeframe for analysis")
+    trading_timeframe: str = _setting("1h", description="Timeframe for analysis")
 
     # ============================================
     # Risk Management
     # ============================================
-    risk_per_trade: float = Field(
-        default=0.02,
-        ge=0.001,
-        le=0.10,
-        description="Risk per trade (0.02 = 2%)"
-    )
-    max_position_size: float = Field(
-        default=0.05,
-        ge=0.01,
-        le=1.0,
-        description="Max position size (0.05 = 5%)"
+    risk_per_trade: float = _setting(0.02, ge=0.001, le=0.10, description="Risk per trade (0.02 = 2%)")
+    max_position_size: float = _setting(0.05, ge=0.01, le=1.0, description="Max position size (0.05 = 5%)")
+    max_daily_loss: float = _setting(0.10, ge=0.01, le=0.50, description="Max daily loss (0.10 = 10%)")
+    max_open_positions: int = _setting(1, ge=1, le=10, description="Max open positions")
+    default_stop_loss_pct: float = _setting(
+        0.02, ge=0.005, le=0.20, description="Default stop loss percentage"
     )
-    max_daily_loss: float = Field(
-        default=0.10,
-        ge=0.01,
-        le=0.50,
-        description="Max daily loss (0.10 = 10%)"
+    default_take_profit_pct: float = _setting(
+        0.05, ge=0.01, le=0.50, description="Default take profit percentage"
     )
-    max_open_positions: int = Field(
-        default=1,
-        ge=1,
-        le=10,
-        description="Max open positions"
+    min_confidence: float = _setting(
+        0.70, ge=0.0, le=1.0, description="Minimum confidence for LLM decisions"
     )
-    default_stop_loss_pct: float = Field(
-        default=0.02,
-        ge=0.005,
-        le=0.20,
-        description="Default stop loss percentage"
+    decision_ttl: int = _setting(
+        0, ge=0, le=86400,
+        description="Seconds a decision is reused while the quantized market state is unchanged (0 = disabled)",
     )
-    default_take_profit_pct: float = Field(
-        default=0.05,
-        ge=0.01,
-        le=0.50,
-        description="Default take profit percentage"
+    maker_only_confidence_threshold: float = _setting(
+        0.90, ge=0.0, le=1.0, description="Min confidence for post-only limit entries at the best bid/ask"
     )
-    min_confidence: float = Field(
-        default=0.70,
-        ge=0.0,
-        le=1.0,
-        description="Minimum confidence for LLM decisions"
+    maker_order_timeout: float = _setting(
+        0.5, ge=0.1, le=30.0, description="Seconds a post-only entry may rest before the rest goes market"
     )
 
     # ============================================
     # Backtesting Configuration
     # ============================================
-    backtest_initial_capital: float = Field(
-        default=10000,
-        ge=100,
-        description="Initial capital for backtesting"
-    )
-    backtest_start_date: str = Field(
-        default="2024-01-01",
-        description="Backtest start date (YYYY-MM-DD)"
-    )
-    backtest_end_date: str = Field(
-        default="now",
-        description="Backtest end date (YYYY-MM-DD or 'now')"
-    )
-    trading_fee: float = Field(
-        default=0.001,
-        ge=0.0,
-        le=0.01,
-        description="Trading fee (0.001 = 0.1%)"
-    )
-    slippage: float = Field(
-        default=0.0005,
-        ge=0.0,
-        le=0.01,
-        description="Slippage (0.0005 = 0.05%)"
-    )
+    backtest_initial_capital: float = _setting(10000, ge=100, description="Initial capital for backtesting")
+    backtest_start_date: str = _setting("2024-01-01", description="Backtest start date (YYYY-MM-DD)")
+    backtest_end_date: str = _setting("now", description="Backtest end date (YYYY-MM-DD or 'now')")
+    trading_fee: float = _setting(0.001, ge=0.0, le=0.01, description="Trading fee (0.001 = 0.1%)")
+    slippage: float = _setting(0.0005, ge=0.0, le=0.01, description="Slippage (0.0005 = 0.05%)")
 
     # ============================================
     # Database Configuration
     # ============================================
-    database_url: str = Field(
-        default="sqlite:///data/trading.db",
-        description="Database connection URL"
-    )
+    database_url: str = _setting("sqlite:///data/trading.db", description="Database connection URL")
 
     # ============================================
     # Monitoring & Notifications
     # ============================================
-    telegram_bot_token: Optional[str] = Field(default=None, description="Telegram bot token")
-    telegram_chat_id: Optional[str] = Field(default=None, description="Telegram chat ID")
-    enable_telegram: bool = Field(default=False, description="Enable Telegram notifications")
+    telegram_bot_token: Optional[str] = _setting(None, description="Telegram bot token")
+    telegram_chat_id: Optional[str] = _setting(None, description="Telegram chat ID")
+    enable_telegram: bool = _setting(False, description="Enable Telegram notifications")
 
-    email_enabled: bool = Field(default=False, description="Enable email notifications")
-    email_host: Optional[str] = Field(default=None, description="Email SMTP host")
-    email_port: Optional[int] = Field(default=587, description="Email SMTP port")
-    email_username: Optional[str] = Field(default=None, description="Email username")
-    email_password: Optional[str] = Field(default=None, description="Email password")
-    email_to: Optional[str] = Field(default=None, description="Email recipient")
+    email_enabled: bool = _setting(False, description="Enable email notifications")
+    email_host: Optional[str] = _setting(None, description="Email SMTP host")
+    email_port: Optional[int] = _setting(587, description="Email SMTP port")
+    email_username: Optional[str] = _setting(None, description="Email username")
+    email_password: Optional[str] = _setting(None, description="Email password")
+    email_to: Optional[str] = _setting(None, description="Email recipient")
 
     # ============================================
     # Logging Configuration
     # ============================================
-    log_level: str = Field(default="INFO", description="Log level")
-    log_file: str = Field(default="logs/trading.log", description="Log file path")
-    log_max_size: int = Field(default=10, description="Max log file size (MB)")
-    log_backup_count: int = Field(default=5, description="Number of backup log files")
+    log_level: str = _setting("INFO", description="Log level")
+    log_file: str = _setting("logs/trading.log", description="Log file path")
+    log_max_size: int = _setting(10, description="Max log file size (MB)")
+    log_backup_count: int = _setting(5, description="Number of backup log files")
 
     # ============================================
     # Advanced Settings
     # ============================================
-    api_rate_limit: int = Field(
-        default=1200,
-        ge=60,
-        description="API rate limit (requests per minute)"
+    api_rate_limit: int = _setting(1200, ge=60, description="API rate limit (requests per minute)")
+    api_retry_attempts: int = _setting(3, ge=1, le=10, description="Retry attempts for failed API calls")
+    api_timeout: int = _setting(30, ge=5, le=120, description="API timeout (seconds)")
+    connection_pool_size: int = _setting(
+        10, ge=1, le=100, description="Keep-alive HTTP connections pooled per host"
     )
-    api_retry_attempts: int = Field(
-        default=3,
-        ge=1,
-        le=10,
-        description="Retry attempts for failed API calls"
+    keepalive_interval: int = _setting(
+        60, ge=0, le=300, description="Idle seconds before a keep-alive ping on pooled HTTP connections (0 = off)"
     )
-    api_timeout: int = Field(
-        default=30,
-        ge=5,
-        le=120,
-        description="API timeout (seconds)"
+    cache_expiration: int = _setting(60, ge=0, description="Cache expiration for market data (seconds)")
+    ws_recv_timeout: int = _setting(
+        30, ge=5, le=300, description="Seconds without a WebSocket frame before reconnecting"
     )
-    cache_expiration: int = Field(
-        default=60,
-        ge=0,
-        description="Cache expiration for market data (seconds)"
+    protective_orders_enabled: bool = _setting(
+        True, description="Futures: place reduce-only STOP_MARKET/TAKE_PROFIT_MARKET orders on entry"
     )
-    debug: bool = Field(default=False, description="Enable debug mode")
+    price_stream_enabled: bool = _setting(
+        True, description="Stream the trading symbol's price over WebSocket (REST when the stream is stale)"
+    )
+    debug: bool = _setting(False, description="Enable debug mode")
 
     # ============================================
-    # Validators
+    # Derived (filled in __post_init__)
     # ============================================
+    is_live_trading: bool = field(init=False)
+    is_demo_mode: bool = field(init=False)
+    binance_base_url: str = field(init=False)
+    telegram_enabled_valid: bool = field(init=False)
+    email_enabled_valid: bool = field(init=False)
+    _warnings: tuple[str, ...] = field(init=False, repr=False)
+    _backtest_end_is_now: bool = field(init=False, repr=False)
 
-    @field_validator("trading_symbol")
-    @classmethod
-    def validate_symbol(cls, v: str) -> str:
-        """Validate trading symbol format."""
-        if "/" not in v:
-            raise ValueError("Trading symbol must be in format 'BASE/QUOTE' (e.g., 'BTC/USDT')")
-        return v.upper()
-
-    @field_validator("backtest_start_date", "backtest_end_date")
     @classmethod
-    def validate_date(cls, v: str) -> str:
-        """Validate date format."""
-        if v.lower() != "now":
-            try:
-                datetime.strptime(v, "%Y-%m-%d")
-            except ValueError:
-                raise ValueError("Date must be in format YYYY-MM-DD or 'now'")
-        return v
+    def from_env(cls, env_file: Optional[str] = ".env") -> "Settings":
+        """
+        Load settings from `env_file` and the process environment (environment wins).
+        Variable names are matched case-insensitively against field names.
 
-    @field_validator("log_level")
-    @classmethod
-    def validate_log_level(cls, v: str) -> str:
-        """Validate log level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"Log level must be one of {valid_levels}")
-        return v_upper
+        Args:
+            env_file: Path to a dotenv file (None or missing file = environment only)
 
-    # ============================================
-    # Computed Properties
-    # ============================================
+        Returns:
+            Settings instance
 
-    @property
-    def is_live_trading(self) -> bool:
-        """Check if running in live trading mode."""
-        return self.trading_mode == "live"
-
-    @property
-    def is_demo_mode(self) -> bool:
-        """Check if using Binance Demo Trading."""
-        return self.trading_mode == "demo"
-
-    @property
-    def binance_base_url(self) -> str:
-        """Get Binance API base URL."""
-        if self.trading_mode == "demo":
-            return "https://demo-api.binance.com"
-        return "https://api.binance.com"
-
-    @property
-    def telegram_enabled_valid(self) -> bool:
-        """Check if Telegram is properly configured."""
-        return (
+        Raises:
+            ValueError: If a value is missing, malformed or out of range
+        """
+        raw = {}
+        if env_file and os.path.isfile(env_file):
+            raw.update(
+                (key.lower(), value)
+                for key, value in dotenv_values(env_file, encoding="utf-8").items()
+                if value is not None
+            )
+        raw.update((key.lower(), value) for key, value in os.environ.items())
+
+        values = {}
+        errors = []
+        for name, (convert, required) in _ENV_FIELDS.items():
+            text = raw.get(name)
+            if text is None:
+                if required:
+                    errors.append(f"{name}: field required")
+                continue
+            try:
+                values[name] = convert(text)
+            except ValueError:
+                errors.append(f"{name}: invalid value {text!r}")
+        if errors:
+            raise ValueError("Invalid settings:\n  " + "\n  ".join(errors))
+
+        return cls(**values)
+
+    def __post_init__(self):
+        """Validate and normalize fields, then compute derived flags once."""
+        # frozen, so assign through object.__setattr__
+        set_ = object.__setattr__
+        errors = []
+
+        for f in fields(self):
+            if not f.init:
+                continue
+            value = getattr(self, f.name)
+            choices = _LITERAL_CHOICES.get(f.name)
+            if choices is not None and value not in choices:
+                errors.append(f"{f.name}: must be one of {list(choices)}")
+            if value is None:
+                continue
+            ge, le = f.metadata["ge"], f.metadata["le"]
+            if ge is not None and value < ge:
+                errors.append(f"{f.name}: must be >= {ge}")
+            if le is not None and value > le:
+                errors.append(f"{f.name}: must be <= {le}")
+
+        if "/" not in self.trading_symbol:
+            errors.append("trading_symbol: must be in format 'BASE/QUOTE' (e.g., 'BTC/USDT')")
+        set_(self, "trading_symbol", self.trading_symbol.upper())
+
+        for name in ("backtest_start_date", "backtest_end_date"):
+            date = getattr(self, name)
+            if date.lower() != "now":
+                try:
+                    _parse_date(date)
+                except ValueError:
+                    errors.append(f"{name}: must be in format YYYY-MM-DD or 'now'")
+
+        log_level = self.log_level.upper()
+        if log_level not in _VALID_LOG_LEVELS:
+            errors.append(f"log_level: must be one of {list(_LOG_LEVELS)}")
+        set_(self, "log_level", log_level)
+
+        if errors:
+            raise ValueError("Invalid settings:\n  " + "\n  ".join(errors))
+
+        # Intern strings that are compared/hashed repeatedly (symbol keys, mode checks)
+        for name in _INTERNED_FIELDS:
+            set_(self, name, sys.intern(getattr(self, name)))
+
+        set_(self, "is_live_trading", self.trading_mode == "live")
+        set_(self, "is_demo_mode", self.trading_mode == "demo")
+        set_(
+            self,
+            "binance_base_url",
+            "https://demo-api.binance.com" if self.is_demo_mode else "https://api.binance.com",
+        )
+        set_(
+            self,
+            "telegram_enabled_valid",
             self.enable_telegram
             and self.telegram_bot_token is not None
-            and self.telegram_chat_id is not None
+            and self.telegram_chat_id is not None,
         )
-
-    @property
-    def email_enabled_valid(self) -> bool:
-        """Check if email is properly configured."""
-        return (
+        set_(
+            self,
+            "email_enabled_valid",
             self.email_enabled
             and self.email_host is not None
             and self.email_username is not None
             and self.email_password is not None
-            and self.email_to is not None
+            and self.email_to is not None,
         )
+        set_(self, "_backtest_end_is_now", self.backtest_end_date.lower() == "now")
+        set_(self, "_warnings", tuple(self._compute_warnings()))
 
     # ============================================
     # Methods
@@ -280,106 +422,127 @@ class Settings(BaseSettings):
 
     def get_backtest_end_datetime(self) -> datetime:
         """Get backtest end date as datetime object."""
-        if self.backtest_end_date.lower() == "now":
+        if self._backtest_end_is_now:
             return datetime.now()
-        return datetime.strptime(self.backtest_end_date, "%Y-%m-%d")
+        return _parse_date(self.backtest_end_date)
 
     def get_backtest_start_datetime(self) -> datetime:
         """Get backtest start date as datetime object."""
-        return datetime.strptime(self.backtest_start_date, "%Y-%m-%d")
+        return _parse_date(self.backtest_start_date)
 
     def validate_settings(self) -> list[str]:
         """
         Validate all settings and return list of warnings/errors.
+        Result is computed when the settings are built.
 
         Returns:
             List of warning/error messages
         """
-        warnings = []
-
-        # Check for live trading warnings
-        if self.is_live_trading:
-            warnings.append("⚠️  WARNING: TRADING_MODE=live. Real money at risk!")
-
-        # Check risk settings
-        if self.risk_per_trade > 0.05:
-            warnings.append(f"⚠️  High risk per trade: {self.risk_per_trade*100}% (recommended: ≤5%)")
-
-        if self.max_position_size > 0.20:
-            warnings.append(f"⚠️  Large max position size: {self.max_position_size*100}% (recommended: ≤20%)")
-
-        if self.min_confidence < 0.60:
-            warnings.append(f"⚠️  Low confidence threshold: {self.min_confidence} (recommended: ≥0.6)")
-
-        # Check API keys
-        if self.trading_mode == "demo":
-            if not self.binance_demo_api_key or not self.binance_demo_api_secret:
-                warnings.append("❌ ERROR: Demo API keys not configured!")
-            elif "your_" in self.binance_demo_api_key.lower():
-                warnings.append("❌ ERROR: Demo API key not configured!")
-        elif self.trading_mode == "live":
-            if not self.binance_api_key or not self.binance_api_secret:
-                warnings.append("❌ ERROR: Binance live API keys not configured!")
-            elif "your_" in self.binance_api_key.lower():
-                warnings.append("❌ ERROR: Binance live API key not configured!")
-
-        if "your_" in self.gemini_api_key.lower():
-            warnings.append("❌ ERROR: Gemini API key not configured!")
-
-        # Check futures trading warnings
-        if self.market_type == "futures":
-            warnings.append("⚠️  FUTURES TRADING ENABLED - Higher risk of liquidation!")
-            if self.leverage > 10:
-                warnings.append(f"⚠️  HIGH LEVERAGE: {self.leverage}x - Extreme risk!")
-            if self.margin_mode == "cross":
-                warnings.append("⚠️  CROSS MARGIN - Entire account balance at risk!")
-
-        return warnings
+        return list(self._warnings)
+
+    def _compute_warnings(self) -> list[str]:
+        """Build the warning/error list for validate_settings()."""
+        return [message.format(s=self) for check, message in _WARNING_RULES if check(self)]
 
     def print_summary(self) -> None:
-        """Print configuration summary."""
-        print("=" * 60)
-        print("🤖 Auto Trading Bot - Configuration Summary")
-        print("=" * 60)
-        print(f"Trading Mode:     {self.trading_mode.upper()} ({'Binance Demo Trading' if self.is_demo_mode else 'LIVE TRADING' if self.is_live_trading else 'Backtest'})")
-        print(f"Market Type:      {self.market_type.upper()}")
-        if self.market_type == "futures":
-            print(f"Leverage:         {self.leverage}x")
-            print(f"Margin Mode:      {self.margin_mode.upper()}")
-        print(f"Symbol:           {self.trading_symbol}")
-        print(f"Timeframe:        {self.trading_timeframe}")
-        print(f"Risk per Trade:   {self.risk_per_trade*100}%")
-        print(f"Max Position:     {self.max_position_size*100}%")
-        print(f"Stop Loss:        {self.default_stop_loss_pct*100}%")
-        print(f"Take Profit:      {self.default_take_profit_pct*100}%")
-        print(f"Min Confidence:   {self.min_confidence}")
-        print(f"LLM Model:        {self.gemini_model}")
-        print("=" * 60)
+        """Print configuration summary (one buffered stdout write)."""
+        mode_label = (
+            "Binance Demo Trading" if self.is_demo_mode
+            else "LIVE TRADING" if self.is_live_trading
+            else "Backtest"
+        )
+        futures = (
+            _SUMMARY_FUTURES_TEMPLATE.format(s=self, margin_mode=self.margin_mode.upper())
+            if self.market_type == "futures"
+            else ""
+        )
+        text = _SUMMARY_TEMPLATE.format(
+            s=self,
+            trading_mode=self.trading_mode.upper(),
+            mode_label=mode_label,
+            market_type=self.market_type.upper(),
+            futures=futures,
+        )
 
         # Print warnings
         warnings = self.validate_settings()
         if warnings:
-            print("\n⚠️  Warnings:")
-            for warning in warnings:
-                print(f"  {warning}")
-            print()
+            text += "\n⚠️  Warnings:\n" + "".join(f"  {warning}\n" for warning in warnings) + "\n"
+
+        sys.stdout.write(text)
+
 
+def _parse_bool(text: str) -> bool:
+    """Parse a boolean environment value."""
+    lowered = text.strip().lower()
+    if lowered in _TRUE_STRINGS:
+        return True
+    if lowered in _FALSE_STRINGS:
+        return False
+    raise ValueError(f"Invalid boolean: {text!r}")
 
-# Singleton instance
-_settings: Optional[Settings] = None
 
+def _optional(convert: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Treat an empty value as None for optional non-string fields."""
+    return lambda text: convert(text) if text.strip() else None
 
+
+def _env_converter(annotation: Any) -> Callable[[str], Any]:
+    """
+    Build the str -> value converter for a field annotation.
+
+    Args:
+        annotation: Field type (str, int, float, bool, Optional[...] or Literal[...])
+
+    Returns:
+        Converter callable
+    """
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return str
+    if origin is Union:
+        inner = next(arg for arg in get_args(annotation) if arg is not type(None))
+        convert = _env_converter(inner)
+        return convert if convert is str else _optional(convert)
+    if annotation is bool:
+        return _parse_bool
+    return annotation
+
+
+# Built once from the class definition: field name -> (converter, required)
+_ENV_FIELDS = {
+    f.name: (_env_converter(f.type), f.default is MISSING)
+    for f in fields(Settings)
+    if f.init
+}
+_LITERAL_CHOICES = {
+    f.name: get_args(f.type)
+    for f in fields(Settings)
+    if get_origin(f.type) is Literal
+}
+
+
+# Serializes the first build so concurrent first calls share one instance
+_settings_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _load_settings() -> Settings:
+    """Parse and validate the environment."""
+    return Settings.from_env()
+
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get or create settings singleton.
+    After the first call this is a single C-level lru_cache hit (no lock, no branch).
 
     Returns:
         Settings instance
     """
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    with _settings_lock:
+        return _load_settings()
 
 
 def reload_settings() -> Settings:
@@ -389,9 +552,10 @@ def reload_settings() -> Settings:
     Returns:
         New Settings instance
     """
-    global _settings
-    _settings = Settings()
-    return _settings
+    with _settings_lock:
+        _load_settings.cache_clear()
+        get_settings.cache_clear()
+    return get_settings()
 
 
 if __name__ == "__main__":
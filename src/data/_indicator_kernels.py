@@ -0,0 +1,241 @@
+"""
+Numba kernels for indicators that sweep the price arrays sequentially.
+Compiled only when numba is installed (NUMBA_AVAILABLE); otherwise `njit` is a no-op so the
+kernels stay importable as plain Python (too slow for production use, fine for checking numerics).
+Results follow the `ta` library conventions (same warm-up NaNs, adjust=False EMAs).
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator: return the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, nogil=True)
+def compute_trend_momentum(
+    close: np.ndarray,
+    sma_windows: np.ndarray,
+    ema_windows: np.ndarray,
+    rsi_period: int,
+    macd_fast: int,
+    macd_slow: int,
+    macd_signal: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    SMAs, EMAs, RSI and MACD in a single pass over `close`.
+
+    Args:
+        close: Close prices (float64, no NaN)
+        sma_windows: SMA windows (int64)
+        ema_windows: EMA spans (int64)
+        rsi_period: RSI period (Wilder smoothing, alpha = 1/period)
+        macd_fast: MACD fast EMA span
+        macd_slow: MACD slow EMA span
+        macd_signal: MACD signal EMA span
+
+    Returns:
+        (sma[len(sma_windows), n], ema[len(ema_windows), n], rsi, macd, macd_signal, macd_diff)
+    """
+    n = close.shape[0]
+    n_sma = sma_windows.shape[0]
+    n_ema = ema_windows.shape[0]
+
+    sma = np.full((n_sma, n), np.nan)
+    ema = np.full((n_ema, n), np.nan)
+    rsi = np.full(n, np.nan)
+    macd = np.full(n, np.nan)
+    signal = np.full(n, np.nan)
+    diff = np.full(n, np.nan)
+
+    sma_sums = np.zeros(n_sma)
+    ema_state = np.zeros(n_ema)
+    ema_alpha = 2.0 / (ema_windows + 1.0)
+
+    rsi_alpha = 1.0 / rsi_period
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    fast_alpha = 2.0 / (macd_fast + 1.0)
+    slow_alpha = 2.0 / (macd_slow + 1.0)
+    signal_alpha = 2.0 / (macd_signal + 1.0)
+    fast = 0.0
+    slow = 0.0
+    sig = 0.0
+    # The signal EMA starts at the first defined MACD value
+    macd_start = max(macd_fast, macd_slow) - 1
+
+    for i in range(n):
+        x = close[i]
+
+        # SMA: running sum, add newest / drop oldest
+        for j in range(n_sma):
+            w = sma_windows[j]
+            sma_sums[j] += x
+            if i >= w:
+                sma_sums[j] -= close[i - w]
+            if i >= w - 1:
+                sma[j, i] = sma_sums[j] / w
+
+        # EMA: s = a*x + (1-a)*s, seeded with the first value
+        for j in range(n_ema):
+            if i == 0:
+                ema_state[j] = x
+            else:
+                ema_state[j] = ema_alpha[j] * x + (1.0 - ema_alpha[j]) * ema_state[j]
+            if i >= ema_windows[j] - 1:
+                ema[j, i] = ema_state[j]
+
+        # RSI: Wilder averages of gains/losses (first bar counts as no change)
+        change = x - close[i - 1] if i > 0 else 0.0
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        if i == 0:
+            avg_gain = gain
+            avg_loss = loss
+        else:
+            avg_gain = rsi_alpha * gain + (1.0 - rsi_alpha) * avg_gain
+            avg_loss = rsi_alpha * loss + (1.0 - rsi_alpha) * avg_loss
+        if i >= rsi_period - 1:
+            if avg_loss == 0.0:
+                rsi[i] = 100.0
+            else:
+                rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+        # MACD: fast/slow EMAs, then signal EMA of their difference
+        if i == 0:
+            fast = x
+            slow = x
+        else:
+            fast = fast_alpha * x + (1.0 - fast_alpha) * fast
+            slow = slow_alpha * x + (1.0 - slow_alpha) * slow
+        if i >= macd_start:
+            m = fast - slow
+            macd[i] = m
+            if i == macd_start:
+                sig = m
+            else:
+                sig = signal_alpha * m + (1.0 - signal_alpha) * sig
+            if i >= macd_start + macd_signal - 1:
+                signal[i] = sig
+                diff[i] = m - sig
+
+    return sma, ema, rsi, macd, signal, diff
+
+
+@njit(cache=True, nogil=True)
+def ewma(values: np.ndarray, alpha: float, out: np.ndarray) -> np.ndarray:
+    """
+    Recursive EWMA `s = a*x + (1-a)*s` (pandas ewm(adjust=False)), one pass.
+    Leading NaNs are skipped; the recursion starts at the first valid value.
+
+    Args:
+        values: Input series (float64)
+        alpha: Smoothing factor (2/(span+1) for EMA, 1/period for Wilder)
+        out: Output buffer of the same length (may be a column view)
+
+    Returns:
+        `out`
+    """
+    n = values.shape[0]
+    start = 0
+    while start < n and np.isnan(values[start]):
+        out[start] = np.nan
+        start += 1
+    if start == n:
+        return out
+    state = values[start]
+    out[start] = state
+    for i in range(start + 1, n):
+        state = alpha * values[i] + (1.0 - alpha) * state
+        out[i] = state
+    return out
+
+
+@njit(cache=True, nogil=True)
+def compute_volatility(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    bb_period: int,
+    bb_std_dev: float,
+    atr_period: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bollinger Bands and ATR in a single pass over high/low/close.
+
+    Args:
+        high: High prices (float64, no NaN)
+        low: Low prices (float64, no NaN)
+        close: Close prices (float64, no NaN)
+        bb_period: Bollinger window
+        bb_std_dev: Bollinger band width in population standard deviations
+        atr_period: ATR period (Wilder smoothing)
+
+    Returns:
+        (bb_upper, bb_middle, bb_lower, atr); ATR is 0 during warm-up, as in `ta`
+    """
+    n = close.shape[0]
+
+    upper = np.full(n, np.nan)
+    middle = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    atr = np.zeros(n)
+
+    mean = 0.0
+    ssqdm = 0.0  # Sum of squared deviations from the window mean
+    nobs = 0
+    same_run = 0  # Consecutive equal closes (a flat window has exactly zero std)
+    tr_sum = 0.0
+
+    for i in range(n):
+        x = close[i]
+
+        # Bollinger: Welford mean/variance, newest value added and oldest removed
+        nobs += 1
+        delta = x - mean
+        mean += delta / nobs
+        ssqdm += delta * (x - mean)
+        if i >= bb_period:
+            old = close[i - bb_period]
+            nobs -= 1
+            delta = old - mean
+            mean -= delta / nobs
+            ssqdm -= delta * (old - mean)
+        same_run = same_run + 1 if i > 0 and x == close[i - 1] else 1
+        if i >= bb_period - 1:
+            if same_run >= bb_period:
+                mid = x
+                std = 0.0
+            else:
+                mid = mean
+                std = np.sqrt(max(ssqdm / nobs, 0.0))
+            middle[i] = mid
+            upper[i] = mid + bb_std_dev * std
+            lower[i] = mid - bb_std_dev * std
+
+        # ATR: true range, seeded with the mean of the first `atr_period` values
+        if i == 0:
+            tr = high[0] - low[0]
+        else:
+            prev_close = close[i - 1]
+            tr = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+        if i < atr_period:
+            tr_sum += tr
+            if i == atr_period - 1:
+                atr[i] = tr_sum / atr_period
+        else:
+            atr[i] = (atr[i - 1] * (atr_period - 1) + tr) / atr_period
+
+    return upper, middle, lower, atr
@@ -3,19 +3,99 @@ Binance API client wrapper using CCXT.
 Handles connection, authentication, and API calls with rate limiting and error handling.
 """
 
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import ccxt
-from typing import Optional, Dict, List, Any
-from datetime import datetime, timedelta
+from requests import Response
+from requests.adapters import HTTPAdapter
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from datetime import datetime
 from loguru import logger
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-)
 
 from src.config.settings import get_settings
-from src.config.constants import OrderSide, OrderType
+from src.config.constants import OrderSide, OrderType, JSON_DUMPS, JSON_LOADS
+from src.data.ohlcv_cache import OHLCVCache
+from src.data.ticker_stream import TickerStream
+
+
+# Market metadata cache (per demo/live and market type)
+_MARKETS_CACHE_DIR = Path.home() / ".cache" / "autotrading"
+
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def ohlcv_to_array(ohlcv: List[List]) -> np.ndarray:
+    """
+    Convert CCXT OHLCV rows to a contiguous (n, 6) float64 array in one C-level cast.
+
+    Args:
+        ohlcv: List of [timestamp, open, high, low, close, volume]
+
+    Returns:
+        Array with columns timestamp (ms), open, high, low, close, volume
+    """
+    return np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+
+
+def ohlcv_to_frame(ohlcv: Union[List[List], np.ndarray]) -> pd.DataFrame:
+    """
+    Convert CCXT OHLCV rows to a columnar DataFrame in one bulk cast.
+
+    Args:
+        ohlcv: List of [timestamp, open, high, low, close, volume] (or an ohlcv_to_array result)
+
+    Returns:
+        DataFrame indexed by candle open time ("timestamp") with float64 OHLCV columns
+    """
+    values = ohlcv_to_array(ohlcv)
+    index = pd.to_datetime(values[:, 0].astype(np.int64), unit="ms")
+    index.name = "timestamp"
+    return pd.DataFrame(values[:, 1:], index=index, columns=list(OHLCV_COLUMNS), copy=False)
+
+
+_TIMEFRAME_UNITS = {
+    "m": 60,
+    "h": 3600,
+    "d": 86400,
+    "w": 604800,
+    "M": 2592000,  # Approximate
+}
+
+
+@lru_cache(maxsize=32)
+def timeframe_to_seconds(timeframe: str) -> int:
+    """Convert timeframe string to seconds (memoized; only a handful of timeframes exist)."""
+    return int(timeframe[:-1]) * _TIMEFRAME_UNITS.get(timeframe[-1], 60)
+
+
+# Upper bound for an honoured Retry-After (Binance 418 bans can ask for much longer)
+_MAX_RETRY_AFTER = 120
+_MAX_BACKOFF = 10
+# RateLimitExceeded / DDoSProtection (429, 418) are NetworkError subclasses, so they retry too
+_RETRYABLE_ERRORS = (ccxt.NetworkError, ccxt.ExchangeNotAvailable)
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value of the failed response (None if absent)
+
+    Returns:
+        Seconds to wait (capped at _MAX_RETRY_AFTER), or None if absent or not a number
+    """
+    try:
+        return min(float(value), _MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return None
 
 
 class BinanceClient:
@@ -23,6 +103,19 @@ class BinanceClient:
     Wrapper around CCXT Binance exchange with error handling and rate limiting.
     """
 
+    # Max parallel REST requests for OHLCV pages / order cancels (also capped by connection_pool_size)
+    REQUEST_CONCURRENCY = 8
+    # Binance futures batchOrders accepts at most 5 orders per request
+    BATCH_ORDER_LIMIT = 5
+    # Streamed prices older than this fall back to REST (@ticker pushes every second)
+    PRICE_MAX_AGE = 2.0
+    # check_connection() result reuse (seconds)
+    HEALTH_TTL = 5.0
+    UNHEALTHY_TTL = 0.5
+    # Fees and market metadata rarely change intraday
+    FEE_CACHE_TTL = 3600
+    MARKETS_CACHE_TTL = 24 * 3600
+
     def __init__(self, demo_mode: Optional[bool] = None):
         """
         Initialize Binance client.
@@ -33,12 +126,45 @@ class BinanceClient:
         self.settings = get_settings()
         self.demo_mode = demo_mode if demo_mode is not None else self.settings.is_demo_mode
 
+        # Settings are frozen, so per-call defaults are resolved once here
+        self._default_symbol = self.settings.trading_symbol
+        self._default_tf = self.settings.trading_timeframe
+
+        # Per-thread Retry-After of the last response and when any response last arrived,
+        # recorded by the session's response hook (see _on_http_response)
+        self._local = threading.local()
+        self._last_response_at = time.monotonic()
+
         # Initialize CCXT exchange
         self.exchange = self._init_exchange()
 
+        # symbol -> (expires_at monotonic, fees)
+        self._fee_cache: Dict[str, tuple] = {}
+
+        # (checked_at monotonic, healthy) of the last check_connection()
+        self._last_health: tuple = (float("-inf"), False)
+
+        # Closed candles persisted across runs (opened on first use)
+        self.ohlcv_cache = OHLCVCache()
+
+        # symbol -> (last price, received_at monotonic), fed by start_ticker_stream()
+        self._last_price: Dict[str, tuple] = {}
+        self._ticker_streams: Dict[str, threading.Thread] = {}
+
+        # Set by close(); stops the keep-alive thread and ticker streams
+        self._closing = threading.Event()
+
+        # Idle pooled connections get closed server-side; ping periodically to keep them warm
+        if self.settings.keepalive_interval > 0:
+            threading.Thread(
+                target=self._keepalive_loop,
+                name="binance-keepalive",
+                daemon=True,
+            ).start()
+
         logger.info(
             f"BinanceClient initialized (demo_mode={self.demo_mode}, "
-            f"symbol={self.settings.trading_symbol})"
+            f"symbol={self._default_symbol})"
         )
 
     def _init_exchange(self) -> ccxt.binance:
@@ -102,21 +228,90 @@ class BinanceClient:
 
         exchange = ccxt.binance(config)
 
+        # CCXT sync는 requests.Session을 재사용 - 풀 크기만 설정값에 맞춤
+        pool_size = self.settings.connection_pool_size
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        exchange.session.mount("https://", adapter)
+        exchange.session.headers.update({
+            "Connection": "keep-alive",
+            "Keep-Alive": "timeout=90, max=1000",
+        })
+        exchange.session.hooks["response"].append(self._on_http_response)
+
         # Load markets
         try:
-            exchange.load_markets()
-            logger.info(f"Loaded {len(exchange.markets)} markets from Binance")
+            self._load_markets(exchange)
         except Exception as e:
             logger.error(f"Failed to load markets: {e}")
             raise
 
         return exchange
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((ccxt.NetworkError, ccxt.ExchangeNotAvailable)),
-    )
+    def _load_markets(self, exchange: ccxt.binance) -> None:
+        """
+        Load markets from the on-disk cache if fresh, otherwise from Binance (and cache them).
+
+        Args:
+            exchange: CCXT exchange to populate
+        """
+        cache_file = _MARKETS_CACHE_DIR / (
+            f"markets_{'demo' if self.demo_mode else 'live'}_{self.settings.market_type}.json"
+        )
+        try:
+            if time.time() - cache_file.stat().st_mtime < self.MARKETS_CACHE_TTL:
+                cached = JSON_LOADS(cache_file.read_bytes())
+                exchange.set_markets(cached["markets"], cached["currencies"] or None)
+                # fetch_markets normally syncs the clock offset; do it explicitly when skipped
+                if exchange.options.get("adjustForTimeDifference"):
+                    exchange.load_time_difference()
+                logger.info(f"Loaded {len(exchange.markets)} markets from cache ({cache_file})")
+                return
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring markets cache {cache_file}: {e}")
+
+        exchange.load_markets()
+        logger.info(f"Loaded {len(exchange.markets)} markets from Binance")
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(
+                JSON_DUMPS({"markets": exchange.markets, "currencies": exchange.currencies}),
+                encoding="utf-8",
+            )
+        except Exception as e:
+            logger.debug(f"Could not write markets cache {cache_file}: {e}")
+
+    def _retry(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call an idempotent exchange read, retrying transient network errors.
+        Waits for the server's Retry-After on 429/418, else 1s, 2s, 4s ... capped at 10s.
+
+        Args:
+            fn: Exchange method to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Result of fn
+        """
+        attempts = self.settings.api_retry_attempts
+        for attempt in range(attempts):
+            self._local.retry_after = None
+            try:
+                return fn(*args, **kwargs)
+            except _RETRYABLE_ERRORS as e:
+                if attempt == attempts - 1:
+                    raise
+                delay = None
+                if isinstance(e, (ccxt.RateLimitExceeded, ccxt.DDoSProtection)):
+                    delay = _retry_after(self._local.retry_after)
+                if delay is None:
+                    delay = min(2 ** attempt, _MAX_BACKOFF)
+                logger.warning(f"{fn.__name__} failed ({e!r}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+
     def fetch_ticker(self, symbol: Optional[str] = None) -> Dict[str, Any]:
         """
         Fetch current ticker data.
@@ -127,57 +322,193 @@ class BinanceClient:
         Returns:
             Ticker data dictionary
         """
-        symbol = symbol or self.settings.trading_symbol
+        symbol = symbol or self._default_symbol
         try:
-            ticker = self.exchange.fetch_ticker(symbol)
+            ticker = self._retry(self.exchange.fetch_ticker, symbol)
             logger.debug(f"Fetched ticker for {symbol}: {ticker['last']}")
             return ticker
         except Exception as e:
             logger.error(f"Failed to fetch ticker for {symbol}: {e}")
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((ccxt.NetworkError, ccxt.ExchangeNotAvailable)),
-    )
+    def last_price(self, symbol: Optional[str] = None) -> float:
+        """
+        Get the last traded price.
+        Served from the ticker stream when one is running and fresh (see start_ticker_stream),
+        otherwise from the lightweight ticker/price endpoint without CCXT's ticker parsing.
+
+        Args:
+            symbol: Trading symbol (default: from settings)
+
+        Returns:
+            Last price
+        """
+        symbol = symbol or self._default_symbol
+        streamed = self._last_price.get(symbol)
+        if streamed is not None and time.monotonic() - streamed[1] < self.PRICE_MAX_AGE:
+            return streamed[0]
+
+        request = {"symbol": self.exchange.market_id(symbol)}
+        try:
+            if self.settings.market_type == "futures":
+                response = self._retry(self.exchange.fapiPublicGetTickerPrice, request)
+            else:
+                response = self._retry(self.exchange.publicGetTickerPrice, request)
+            return float(response["price"])
+        except Exception as e:
+            logger.error(f"Failed to fetch last price for {symbol}: {e}")
+            raise
+
+    def last_prices(self, symbols: Sequence[str]) -> Dict[str, float]:
+        """
+        Get the last traded prices of several symbols with at most one request.
+        Fresh streamed prices are served from memory; the rest come from a single
+        ticker/price call instead of one call per symbol.
+
+        Args:
+            symbols: Trading symbols
+
+        Returns:
+            Dictionary {symbol: last price} (symbols unknown to Binance are omitted)
+        """
+        prices: Dict[str, float] = {}
+        now = time.monotonic()
+        pending: Dict[str, str] = {}
+        for symbol in symbols:
+            streamed = self._last_price.get(symbol)
+            if streamed is not None and now - streamed[1] < self.PRICE_MAX_AGE:
+                prices[symbol] = streamed[0]
+            else:
+                pending[self.exchange.market_id(symbol)] = symbol
+        if not pending:
+            return prices
+
+        try:
+            if self.settings.market_type == "futures":
+                # No multi-symbol filter on futures: the unfiltered call returns every symbol
+                response = self._retry(self.exchange.fapiPublicGetTickerPrice)
+            else:
+                response = self._retry(
+                    self.exchange.publicGetTickerPrice,
+                    {"symbols": JSON_DUMPS(list(pending))},
+                )
+        except Exception as e:
+            logger.error(f"Failed to fetch last prices for {list(pending.values())}: {e}")
+            raise
+
+        for item in response:
+            symbol = pending.get(item["symbol"])
+            if symbol is not None:
+                prices[symbol] = float(item["price"])
+        return prices
+
+    def fetch_best_bid_ask(self, symbol: Optional[str] = None) -> Tuple[float, float]:
+        """
+        Get the top of the order book from the lightweight bookTicker endpoint.
+
+        Args:
+            symbol: Trading symbol (default: from settings)
+
+        Returns:
+            (best bid, best ask)
+        """
+        symbol = symbol or self._default_symbol
+        request = {"symbol": self.exchange.market_id(symbol)}
+        try:
+            if self.settings.market_type == "futures":
+                response = self._retry(self.exchange.fapiPublicGetTickerBookTicker, request)
+            else:
+                response = self._retry(self.exchange.publicGetTickerBookTicker, request)
+            return float(response["bidPrice"]), float(response["askPrice"])
+        except Exception as e:
+            logger.error(f"Failed to fetch book ticker for {symbol}: {e}")
+            raise
+
+    def start_ticker_stream(
+        self,
+        symbol: Optional[str] = None,
+        on_update: Optional[Callable[[str, float], None]] = None,
+    ) -> None:
+        """
+        Stream last prices over WebSocket in a background thread until close().
+        While the stream is fresh, last_price() no longer hits the REST API.
+
+        Args:
+            symbol: Trading symbol (default: from settings)
+            on_update: Optional callback(symbol, price) for every update
+        """
+        symbol = symbol or self._default_symbol
+        if symbol in self._ticker_streams:
+            return
+        stream = TickerStream(symbol)
+
+        async def consume() -> None:
+            async for price in stream.prices(stop_event=self._closing):
+                self._last_price[symbol] = (price, time.monotonic())
+                if on_update is not None:
+                    on_update(symbol, price)
+
+        thread = threading.Thread(
+            target=asyncio.run,
+            args=(consume(),),
+            name=f"ticker-{symbol}",
+            daemon=True,
+        )
+        self._ticker_streams[symbol] = thread
+        thread.start()
+
     def fetch_ohlcv(
         self,
         symbol: Optional[str] = None,
         timeframe: Optional[str] = None,
-        since: Optional[datetime] = None,
+        since: Optional[Union[datetime, int]] = None,
         limit: int = 500,
-    ) -> List[List]:
+        as_frame: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+        as_array: bool = False,
+    ) -> Union[List[List], pd.DataFrame, np.ndarray]:
         """
         Fetch OHLCV (candlestick) data.
 
         Args:
             symbol: Trading symbol (default: from settings)
             timeframe: Timeframe (default: from settings)
-            since: Start time (default: 500 periods ago)
+            since: Start time as datetime or epoch ms (default: 500 periods ago)
             limit: Number of candles to fetch (max: 1000)
+            as_frame: Return a columnar DataFrame (see ohlcv_to_frame) instead of rows
+            params: Extra Binance request parameters (e.g. {"endTime": ms})
+            as_array: Return an (n, 6) float64 array (see ohlcv_to_array) instead of rows
 
         Returns:
-            List of [timestamp, open, high, low, close, volume]
+            List of [timestamp, open, high, low, close, volume], DataFrame if as_frame,
+            or ndarray if as_array
         """
-        symbol = symbol or self.settings.trading_symbol
-        timeframe = timeframe or self.settings.trading_timeframe
+        symbol = symbol or self._default_symbol
+        timeframe = timeframe or self._default_tf
 
         since_ms = None
-        if since:
+        if isinstance(since, datetime):
             since_ms = int(since.timestamp() * 1000)
+        elif since is not None:
+            since_ms = since
 
         try:
-            ohlcv = self.exchange.fetch_ohlcv(
+            ohlcv = self._retry(
+                self.exchange.fetch_ohlcv,
                 symbol=symbol,
                 timeframe=timeframe,
                 since=since_ms,
                 limit=limit,
+                params=params or {},
             )
             logger.debug(
                 f"Fetched {len(ohlcv)} {timeframe} candles for {symbol} "
-                f"(from {datetime.fromtimestamp(ohlcv[0][0]/1000)})"
+                f"(from {ohlcv[0][0] if ohlcv else since_ms} ms)"
             )
+            if as_frame:
+                return ohlcv_to_frame(ohlcv)
+            if as_array:
+                return ohlcv_to_array(ohlcv)
             return ohlcv
         except Exception as e:
             logger.error(
@@ -191,90 +522,149 @@ class BinanceClient:
         end_date: datetime,
         symbol: Optional[str] = None,
         timeframe: Optional[str] = None,
-    ) -> List[List]:
+        use_cache: bool = True,
+        as_frame: bool = False,
+    ) -> Union[List[List], pd.DataFrame]:
         """
         Fetch OHLCV data for a specific date range.
         Handles pagination for large date ranges.
+        With use_cache, closed candles come from the on-disk cache and only
+        the uncached head/tail of the range is downloaded.
 
         Args:
             start_date: Start date
             end_date: End date
             symbol: Trading symbol (default: from settings)
             timeframe: Timeframe (default: from settings)
+            use_cache: Read/write the persistent OHLCV cache
+            as_frame: Return a columnar DataFrame (see ohlcv_to_frame) instead of rows
 
         Returns:
-            List of [timestamp, open, high, low, close, volume]
+            List of [timestamp, open, high, low, close, volume], or DataFrame if as_frame
         """
-        symbol = symbol or self.settings.trading_symbol
-        timeframe = timeframe or self.settings.trading_timeframe
+        candles = self._fetch_ohlcv_rows(start_date, end_date, symbol, timeframe, use_cache)
+        return ohlcv_to_frame(candles) if as_frame else candles
 
-        all_candles = []
-        current_date = start_date
+    def _fetch_ohlcv_rows(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        symbol: Optional[str],
+        timeframe: Optional[str],
+        use_cache: bool,
+    ) -> List[List]:
+        """Row-based implementation of fetch_ohlcv_range()."""
+        symbol = symbol or self._default_symbol
+        timeframe = timeframe or self._default_tf
+
+        start_ts = int(start_date.timestamp() * 1000)
+        end_ts = int(end_date.timestamp() * 1000)
+        if not use_cache:
+            return self._paginate_ohlcv(start_ts, end_ts, symbol, timeframe)
+
+        timeframe_ms = self._timeframe_to_seconds(timeframe) * 1000
+        cached = self.ohlcv_cache.load(symbol, timeframe, start_ts, end_ts)
+
+        # Every stretch of the range without cached candles is fetched: the head, the tail and
+        # holes between separately cached blocks (ranges fetched earlier needn't be adjacent).
+        # Holes the exchange itself has (maintenance) are simply requested again next time.
+        gaps = []
+        expected_ts = start_ts
+        for row in cached:
+            if row[0] - expected_ts >= timeframe_ms:
+                gaps.append((expected_ts, row[0] - 1))
+            expected_ts = row[0] + timeframe_ms
+        if end_ts >= expected_ts:
+            gaps.append((expected_ts, end_ts))
+
+        logger.info(
+            f"OHLCV cache: {len(cached)} {timeframe} candles for {symbol} cached, "
+            f"{len(gaps)} range(s) to fetch"
+        )
+
+        # Only closed candles are immutable - the in-progress bar is returned but not cached
+        now_ms = int(time.time() * 1000)
+        fetched = []
+        for gap_start, gap_end in gaps:
+            candles = self._paginate_ohlcv(gap_start, gap_end, symbol, timeframe)
+            fetched.extend(candles)
+            self.ohlcv_cache.store(
+                symbol, timeframe, [c for c in candles if c[0] + timeframe_ms <= now_ms]
+            )
 
-        # Calculate approximate number of candles per request
+        if not cached:
+            return fetched
+        merged = {c[0]: c for c in cached}
+        merged.update((c[0], c) for c in fetched)
+        return [merged[ts] for ts in sorted(merged)]
+
+    def _paginate_ohlcv(
+        self,
+        start_ms: int,
+        end_timestamp: int,
+        symbol: str,
+        timeframe: str,
+    ) -> List[List]:
+        """
+        Download [start_ms, end_timestamp] from the exchange in 1000-candle pages,
+        fetched concurrently on a bounded thread pool sharing the pooled session.
+
+        Args:
+            start_ms: Start time (epoch ms)
+            end_timestamp: End time (epoch ms, inclusive)
+            symbol: Trading symbol
+            timeframe: Timeframe
+
+        Returns:
+            List of [timestamp, open, high, low, close, volume]
+        """
         timeframe_seconds = self._timeframe_to_seconds(timeframe)
         candles_per_request = 1000
 
+        # Page boundaries are known up front, so request the pages concurrently
+        window_ms = candles_per_request * timeframe_seconds * 1000
+        window_starts = list(range(start_ms, end_timestamp + 1, window_ms)) or [start_ms]
+        workers = min(self.REQUEST_CONCURRENCY, self.settings.connection_pool_size, len(window_starts))
+
         logger.info(
             f"Fetching {timeframe} candles for {symbol} "
-            f"from {start_date} to {end_date}"
+            f"from {datetime.fromtimestamp(start_ms / 1000)} to {datetime.fromtimestamp(end_timestamp / 1000)} "
+            f"({len(window_starts)} pages, {workers} workers)"
         )
 
-        while current_date < end_date:
-            try:
-                candles = self.fetch_ohlcv(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    since=current_date,
-                    limit=candles_per_request,
-                )
-
-                if not candles:
-                    break
+        fetch = self.fetch_ohlcv
 
-                all_candles.extend(candles)
-
-                # Move to next batch
-                last_timestamp = candles[-1][0]
-                current_date = datetime.fromtimestamp(last_timestamp / 1000)
-                current_date += timedelta(seconds=timeframe_seconds)
+        def fetch_page(since_ms: int) -> List[List]:
+            # endTime bounds each page server-side, so nothing past end_timestamp is returned
+            return fetch(
+                symbol=symbol,
+                timeframe=timeframe,
+                since=since_ms,
+                limit=candles_per_request,
+                params={"endTime": min(since_ms + window_ms - 1, end_timestamp)},
+            )
 
-                # Avoid fetching beyond end_date
-                if current_date >= end_date:
+        # Windows are disjoint and consumed in order, so pages concatenate already sorted
+        all_candles: List[List] = []
+        extend = all_candles.extend
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ohlcv") as pool:
+            futures = [pool.submit(fetch_page, since_ms) for since_ms in window_starts]
+            # Consume in page order; stop at the first failure so the result stays contiguous
+            for since_ms, future in zip(window_starts, futures):
+                try:
+                    candles = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching candles at {datetime.fromtimestamp(since_ms / 1000)}: {e}")
+                    for pending in futures:
+                        pending.cancel()
                     break
-
-            except Exception as e:
-                logger.error(f"Error fetching candles at {current_date}: {e}")
-                break
-
-        # Filter out candles beyond end_date
-        end_timestamp = int(end_date.timestamp() * 1000)
-        all_candles = [c for c in all_candles if c[0] <= end_timestamp]
+                extend(candles)
 
         logger.info(f"Fetched total of {len(all_candles)} candles")
         return all_candles
 
-    @staticmethod
-    def _timeframe_to_seconds(timeframe: str) -> int:
-        """Convert timeframe string to seconds."""
-        unit = timeframe[-1]
-        value = int(timeframe[:-1])
-
-        units = {
-            "m": 60,
-            "h": 3600,
-            "d": 86400,
-            "w": 604800,
-            "M": 2592000,  # Approximate
-        }
-
-        return value * units.get(unit, 60)
+    _timeframe_to_seconds = staticmethod(timeframe_to_seconds)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((ccxt.NetworkError, ccxt.ExchangeNotAvailable)),
-    )
     def fetch_balance(self, account_type: Optional[str] = None) -> Dict[str, Any]:
         """
         Fetch account balance.
@@ -286,19 +676,14 @@ class BinanceClient:
             Balance dictionary
         """
         try:
-            params = {"type": account_type} if account_type else None
-            balance = self.exchange.fetch_balance(params) if params else self.exchange.fetch_balance()
+            params = {"type": account_type} if account_type else {}
+            balance = self._retry(self.exchange.fetch_balance, params)
             logger.debug("Fetched account balance")
             return balance
         except Exception as e:
             logger.error(f"Failed to fetch balance: {e}")
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((ccxt.NetworkError, ccxt.ExchangeNotAvailable)),
-    )
     def fetch_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
         """
         Fetch order details.
@@ -310,20 +695,15 @@ class BinanceClient:
         Returns:
             Order details
         """
-        symbol = symbol or self.settings.trading_symbol
+        symbol = symbol or self._default_symbol
         try:
-            order = self.exchange.fetch_order(order_id, symbol)
+            order = self._retry(self.exchange.fetch_order, order_id, symbol)
             logger.debug(f"Fetched order {order_id} for {symbol}")
             return order
         except Exception as e:
             logger.error(f"Failed to fetch order {order_id}: {e}")
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((ccxt.NetworkError, ccxt.ExchangeNotAvailable)),
-    )
     def fetch_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Fetch open orders.
@@ -334,20 +714,41 @@ class BinanceClient:
         Returns:
             List of open orders
         """
-        symbol = symbol or self.settings.trading_symbol
+        symbol = symbol or self._default_symbol
         try:
-            orders = self.exchange.fetch_open_orders(symbol)
+            orders = self._retry(self.exchange.fetch_open_orders, symbol)
             logger.debug(f"Fetched {len(orders)} open orders for {symbol}")
             return orders
         except Exception as e:
             logger.error(f"Failed to fetch open orders: {e}")
             raise
 
+    def tradable_amount(self, amount: float, symbol: Optional[str] = None) -> float:
+        """
+        Round an order amount down to the market's lot step.
+
+        Args:
+            amount: Desired amount (in base currency)
+            symbol: Trading symbol (default: from settings)
+
+        Returns:
+            Amount the exchange accepts, or 0.0 if it is below the minimum order amount
+        """
+        symbol = symbol or self._default_symbol
+        try:
+            rounded = float(self.exchange.amount_to_precision(symbol, amount))
+        except ccxt.InvalidOrder:
+            # Rounds to 0 at the lot step
+            return 0.0
+        min_amount = self.exchange.market(symbol)["limits"]["amount"].get("min") or 0.0
+        return rounded if rounded >= min_amount else 0.0
+
     def create_market_order(
         self,
         side: OrderSide,
         amount: float,
         symbol: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Create a market order.
@@ -356,17 +757,19 @@ class BinanceClient:
             side: Order side (BUY or SELL)
             amount: Order amount (in base currency)
             symbol: Trading symbol (default: from settings)
+            params: Extra Binance order parameters (e.g. {"reduceOnly": True} on futures)
 
         Returns:
             Order details
         """
-        symbol = symbol or self.settings.trading_symbol
+        symbol = symbol or self._default_symbol
         try:
             order = self.exchange.create_order(
                 symbol=symbol,
                 type="market",
                 side=side.value,
                 amount=amount,
+                params=params or {},
             )
             mode = "[DEMO]" if self.demo_mode else "[LIVE]"
             logger.info(
@@ -383,6 +786,7 @@ class BinanceClient:
         amount: float,
         price: float,
         symbol: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Create a limit order.
@@ -392,11 +796,12 @@ class BinanceClient:
             amount: Order amount (in base currency)
             price: Limit price
             symbol: Trading symbol (default: from settings)
+            params: Extra order parameters (e.g. {"postOnly": True}: LIMIT_MAKER on spot, GTX on futures)
 
         Returns:
             Order details
         """
-        symbol = symbol or self.settings.trading_symbol
+        symbol = symbol or self._default_symbol
         try:
             order = self.exchange.create_order(
                 symbol=symbol,
@@ -404,6 +809,7 @@ class BinanceClient:
                 side=side.value,
                 amount=amount,
                 price=price,
+                params=params or {},
             )
             logger.info(
                 f"Created limit {side.value} order: {amount} {symbol} @ {price} (ID: {order['id']})"
@@ -413,6 +819,49 @@ class BinanceClient:
             logger.error(f"Failed to create limit order: {e}")
             raise
 
+    def create_orders_batch(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create several orders with as few requests as possible.
+        Futures use POST /fapi/v1/batchOrders (BATCH_ORDER_LIMIT orders per call);
+        spot has no batch endpoint, so orders are sent concurrently instead.
+
+        Args:
+            orders: Orders as {"side", "amount", "type" (default "market"),
+                "price" (limit only), "symbol" (default: from settings),
+                "params" (extra Binance parameters, e.g. stopPrice)}
+
+        Returns:
+            List of order details (same order as the input)
+        """
+        requests = [
+            {
+                "symbol": order.get("symbol") or self._default_symbol,
+                "type": order.get("type", "market"),
+                "side": order["side"].value if isinstance(order["side"], OrderSide) else order["side"],
+                "amount": order["amount"],
+                "price": order.get("price"),
+                "params": order.get("params") or {},
+            }
+            for order in orders
+        ]
+        if not requests:
+            return []
+        try:
+            if self.settings.market_type == "futures" and self.exchange.has.get("createOrders"):
+                results = []
+                for i in range(0, len(requests), self.BATCH_ORDER_LIMIT):
+                    results.extend(self.exchange.create_orders(requests[i:i + self.BATCH_ORDER_LIMIT]))
+            else:
+                workers = min(self.REQUEST_CONCURRENCY, len(requests))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="order") as pool:
+                    results = list(pool.map(lambda request: self.exchange.create_order(**request), requests))
+            mode = "[DEMO]" if self.demo_mode else "[LIVE]"
+            logger.info(f"{mode} Created {len(results)} orders in batch")
+            return results
+        except Exception as e:
+            logger.error(f"Failed to create batch orders: {e}")
+            raise
+
     def create_stop_loss_order(
         self,
         side: OrderSide,
@@ -432,7 +881,7 @@ class BinanceClient:
         Returns:
             Order details
         """
-        symbol = symbol or self.settings.trading_symbol
+        symbol = symbol or self._default_symbol
         try:
             order = self.exchange.create_order(
                 symbol=symbol,
@@ -461,7 +910,7 @@ class BinanceClient:
         Returns:
             Cancellation result
         """
-        symbol = symbol or self.settings.trading_symbol
+        symbol = symbol or self._default_symbol
         try:
             result = self.exchange.cancel_order(order_id, symbol)
             logger.info(f"Cancelled order {order_id} for {symbol}")
@@ -480,13 +929,19 @@ class BinanceClient:
         Returns:
             List of cancellation results
         """
-        symbol = symbol or self.settings.trading_symbol
+        symbol = symbol or self._default_symbol
         try:
-            open_orders = self.fetch_open_orders(symbol)
-            results = []
-            for order in open_orders:
-                result = self.cancel_order(order["id"], symbol)
-                results.append(result)
+            if self.exchange.has.get("cancelAllOrders"):
+                # One DELETE .../openOrders (allOpenOrders on futures) instead of N calls
+                results = self.exchange.cancel_all_orders(symbol)
+            else:
+                open_orders = self.fetch_open_orders(symbol)
+                workers = min(self.REQUEST_CONCURRENCY, max(len(open_orders), 1))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cancel") as pool:
+                    results = list(pool.map(
+                        lambda order: self.cancel_order(order["id"], symbol),
+                        open_orders,
+                    ))
             logger.info(f"Cancelled {len(results)} orders for {symbol}")
             return results
         except Exception as e:
@@ -495,7 +950,7 @@ class BinanceClient:
 
     def get_trading_fee(self, symbol: Optional[str] = None) -> Dict[str, float]:
         """
-        Get trading fees for symbol.
+        Get trading fees for symbol (cached for FEE_CACHE_TTL seconds).
 
         Args:
             symbol: Trading symbol (default: from settings)
@@ -503,10 +958,14 @@ class BinanceClient:
         Returns:
             Dictionary with 'maker' and 'taker' fees
         """
-        symbol = symbol or self.settings.trading_symbol
+        symbol = symbol or self._default_symbol
+        cached = self._fee_cache.get(symbol)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
         try:
             fees = self.exchange.fetch_trading_fee(symbol)
             logger.debug(f"Trading fees for {symbol}: {fees}")
+            self._fee_cache[symbol] = (time.monotonic() + self.FEE_CACHE_TTL, fees)
             return fees
         except Exception as e:
             logger.warning(f"Failed to fetch trading fees, using defaults: {e}")
@@ -516,17 +975,96 @@ class BinanceClient:
     def check_connection(self) -> bool:
         """
         Check if connection to Binance is working.
+        The result is reused for HEALTH_TTL seconds (UNHEALTHY_TTL after a failure, so recovery shows up fast).
 
         Returns:
             True if connection is working
         """
+        checked_at, healthy = self._last_health
+        ttl = self.HEALTH_TTL if healthy else self.UNHEALTHY_TTL
+        if time.monotonic() - checked_at < ttl:
+            return healthy
         try:
             self.exchange.fetch_time()
             logger.info("Binance connection OK")
-            return True
+            healthy = True
         except Exception as e:
             logger.error(f"Binance connection failed: {e}")
-            return False
+            healthy = False
+        self._last_health = (time.monotonic(), healthy)
+        return healthy
+
+    def _on_http_response(self, response: Response, *args: Any, **kwargs: Any) -> None:
+        """
+        requests response hook, run on the thread that made the request.
+        The shared exchange.last_response_headers may already belong to another thread's call,
+        so _retry reads Retry-After from here instead.
+
+        Args:
+            response: HTTP response just received
+        """
+        self._local.retry_after = response.headers.get("Retry-After")
+        self._last_response_at = time.monotonic()
+
+    def _keepalive_loop(self) -> None:
+        """Ping Binance once no response arrived for `keepalive_interval` seconds, until close()."""
+        interval = self.settings.keepalive_interval
+        api_urls = self.exchange.urls["api"]
+        ping_url = (
+            api_urls["fapiPublic"] if self.settings.market_type == "futures" else api_urls["public"]
+        ) + "/ping"
+        delay = interval
+        while not self._closing.wait(delay):
+            idle = time.monotonic() - self._last_response_at
+            if idle < interval:
+                delay = interval - idle
+                continue
+            delay = interval
+            try:
+                # Straight on the pooled session - the CCXT exchange object isn't thread-safe
+                self.exchange.session.get(ping_url, timeout=self.settings.api_timeout)
+            except Exception as e:
+                logger.debug(f"Keep-alive ping failed: {e}")
+
+    def close(self) -> None:
+        """Close the underlying HTTP session, its pooled connections and the OHLCV cache."""
+        self._closing.set()
+        self.exchange.session.close()
+        self.ohlcv_cache.close()
+        # A closed client must not be handed out again by get_client()
+        with _clients_lock:
+            for key, client in list(_CLIENTS.items()):
+                if client is self:
+                    del _CLIENTS[key]
+        logger.debug("BinanceClient session closed")
+
+
+# One client per (demo_mode, market_type): each ccxt instance owns a connection pool,
+# loaded markets and a clock offset, so building one per call is slow and leaks sockets.
+_CLIENTS: Dict[tuple, BinanceClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(demo_mode: Optional[bool] = None) -> BinanceClient:
+    """
+    Get the shared BinanceClient (created on first use).
+    Application code should use this instead of constructing BinanceClient directly.
+
+    Args:
+        demo_mode: Use demo mode (None = use setting from config)
+
+    Returns:
+        Cached BinanceClient for the resolved (demo_mode, market_type)
+    """
+    settings = get_settings()
+    if demo_mode is None:
+        demo_mode = settings.is_demo_mode
+    key = (demo_mode, settings.market_type)
+    with _clients_lock:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = _CLIENTS[key] = BinanceClient(demo_mode=demo_mode)
+        return client
 
 
 if __name__ == "__main__":
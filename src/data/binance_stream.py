@@ -0,0 +1,91 @@
+"""
+Base for Binance public WebSocket streams.
+Owns the connection, the recv timeout and reconnect backoff; subclasses pick the stream and filter payloads.
+"""
+
+import asyncio
+import random
+import threading
+from typing import Optional, Dict, Any, AsyncIterator
+
+import websockets
+from loguru import logger
+
+from src.config.settings import get_settings
+from src.config.constants import BINANCE_WS_URLS, JSON_LOADS
+
+
+class BinanceStream:
+    """
+    Long-lived connection to a single `wss://.../ws/<stream_name>` stream.
+    """
+
+    # Frames buffered while the consumer is busy
+    MAX_QUEUE = 256
+    # Reconnect backoff: RECONNECT_DELAY * 2^n capped at RECONNECT_MAX_DELAY, plus jitter
+    RECONNECT_DELAY = 5
+    RECONNECT_MAX_DELAY = 300
+    RECONNECT_JITTER = 5
+
+    def __init__(self, stream_name: str):
+        """
+        Initialize stream.
+
+        Args:
+            stream_name: Binance stream name (e.g. "btcusdt@kline_1h")
+        """
+        self.settings = get_settings()
+        self.stream_name = stream_name
+        # 캔들/시세는 demo/live 동일하므로 public 스트림을 사용
+        self.url = f"{BINANCE_WS_URLS[self.settings.market_type]}/{stream_name}"
+
+    async def messages(
+        self,
+        stop_event: Optional[threading.Event] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield every decoded frame of the stream.
+        Reconnects on disconnect or when no frame arrives within `ws_recv_timeout`,
+        backing off exponentially (with jitter) while the failures continue.
+
+        Args:
+            stop_event: Stops the stream once set (checked on every frame and during reconnect waits)
+
+        Yields:
+            Decoded JSON payload
+        """
+        stop_event = stop_event or threading.Event()
+        retry_count = 0
+        while not stop_event.is_set():
+            try:
+                async with websockets.connect(self.url, max_queue=self.MAX_QUEUE) as ws:
+                    logger.info(f"Stream connected: {self.stream_name}")
+                    while not stop_event.is_set():
+                        raw = await asyncio.wait_for(
+                            ws.recv(),
+                            timeout=self.settings.ws_recv_timeout,
+                        )
+                        retry_count = 0  # Stream is healthy again
+                        yield JSON_LOADS(raw)
+            except (asyncio.TimeoutError, websockets.ConnectionClosed, OSError) as e:
+                delay = self._reconnect_delay(retry_count)
+                retry_count += 1
+                logger.warning(
+                    f"Stream {self.stream_name} interrupted ({e!r}), "
+                    f"reconnecting in {delay:.1f}s (attempt {retry_count})..."
+                )
+                # Event.wait returns as soon as shutdown is requested
+                await asyncio.to_thread(stop_event.wait, delay)
+
+    def _reconnect_delay(self, retry_count: int) -> float:
+        """
+        Exponential backoff with jitter so reconnects don't hammer Binance during an outage.
+
+        Args:
+            retry_count: Consecutive failed attempts so far
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.RECONNECT_DELAY * (2 ** retry_count), self.RECONNECT_MAX_DELAY)
+        return delay + random.uniform(0, self.RECONNECT_JITTER)
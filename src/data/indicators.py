@@ -1,15 +1,180 @@
 """
 Technical indicators calculation using TA library.
 Provides common trading indicators for market analysis.
+Uses TA-Lib's C implementations when installed (see INDICATOR_BACKEND), falling back to `ta`.
 """
 
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
-from typing import Optional
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 from loguru import logger
 import ta
 
-from src.config.constants import INDICATOR_PARAMS
+from src.config.constants import INDICATOR_PARAMS, INDICATOR_BACKEND, INDICATOR_FUNCS
+from src.data._indicator_kernels import (
+    NUMBA_AVAILABLE,
+    compute_trend_momentum,
+    compute_volatility,
+    ewma,
+)
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+
+class OHLCVArrays(NamedTuple):
+    """Float64 column arrays of an OHLCV frame, extracted once and shared by all indicators."""
+
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+
+def _ohlcv_arrays(df: pd.DataFrame) -> OHLCVArrays:
+    """Extract OHLCV columns as float64 arrays (no copy when already float64)."""
+    return OHLCVArrays(*(
+        df[col].to_numpy(dtype=np.float64, copy=False)
+        for col in ("open", "high", "low", "close", "volume")
+    ))
+
+
+def _rolling(values: np.ndarray, window: int, func: Callable[..., np.ndarray]) -> np.ndarray:
+    """
+    Reduce each trailing window with `func` (e.g. np.max) over a strided view.
+
+    Args:
+        values: 1-D array
+        window: Window length
+        func: Reduction accepting axis=-1
+
+    Returns:
+        Array of len(values), NaN until the first full window (NaN inputs propagate)
+    """
+    out = np.full(values.shape[0], np.nan)
+    if values.shape[0] >= window:
+        out[window - 1:] = func(sliding_window_view(values, window), axis=-1)
+    return out
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing-window sums (NaN until the first full window) via a C-level convolution."""
+    out = np.full(values.shape[0], np.nan)
+    if values.shape[0] >= window:
+        out[window - 1:] = np.convolve(values, np.ones(window), mode="valid")
+    return out
+
+
+def _arrays_digest(arrays: OHLCVArrays) -> bytes:
+    """Content hash of the OHLCV arrays (one C-level pass, far cheaper than the indicators)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for values in arrays:
+        digest.update(np.ascontiguousarray(values))
+    return digest.digest()
+
+
+def _ema(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    EMA via the numba `ewma` kernel, with `ta`'s warm-up (NaN until `span` valid values).
+
+    Args:
+        values: Input series (float64; leading NaNs allowed)
+        span: EMA span
+
+    Returns:
+        EMA array
+    """
+    out = ewma(values, 2.0 / (span + 1.0), np.empty_like(values))
+    valid = np.flatnonzero(~np.isnan(values))
+    out[:valid[0] + span - 1 if len(valid) else len(out)] = np.nan
+    return out
+
+
+def _column_block(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Pack indicator arrays into one preallocated (n, k) float64 matrix.
+    Column-major, so each column write is contiguous and the matrix transposes straight
+    into pandas' (k, n) block layout.
+
+    Args:
+        columns: {column name: 1-D array}, all of the same length
+
+    Returns:
+        Matrix with the columns in dict order
+    """
+    values = list(columns.values())
+    block = np.empty((len(values[0]), len(values)), order="F")
+    for j, column in enumerate(values):
+        block[:, j] = column
+    return block
+
+
+def _with_block(
+    df: pd.DataFrame,
+    names: List[str],
+    block: np.ndarray,
+    dtype: np.dtype = np.float64,
+) -> pd.DataFrame:
+    """
+    Return a new frame with the `block` columns added, sharing df's existing column blocks.
+    The block is copied once on insertion (so cached blocks stay private);
+    unlike df.assign / df.copy(), the OHLCV data itself is not duplicated.
+
+    Args:
+        df: Source frame (not modified)
+        names: Column names, one per block column
+        block: (len(df), len(names)) matrix
+        dtype: Dtype of the added block
+
+    Returns:
+        New DataFrame
+    """
+    out = df.copy(deep=False)
+    if names:
+        out[names] = block.astype(dtype, copy=False)
+    return out
+
+
+def _with_columns(
+    df: pd.DataFrame,
+    columns: Dict[str, np.ndarray],
+    dtype: np.dtype = np.float64,
+) -> pd.DataFrame:
+    """_with_block for a {column name: array} dict."""
+    if not columns:
+        return df.copy(deep=False)
+    return _with_block(df, list(columns), _column_block(columns), dtype)
+
+
+def _bollinger_bands(
+    close: np.ndarray,
+    upper: np.ndarray,
+    middle: np.ndarray,
+    lower: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Bollinger Bands columns from the three bands (derived width/pct on ta's scales)."""
+    band = upper - lower
+    return {
+        "bb_upper": upper,
+        "bb_middle": middle,
+        "bb_lower": lower,
+        # Width in % of the middle band, pct NaN on a zero-width band
+        "bb_width": band / middle * 100,
+        "bb_pct": (close - lower) / np.where(band != 0, band, np.nan),
+    }
+
+
+def _series(values: np.ndarray) -> pd.Series:
+    """Wrap an array for the `ta` fallback (RangeIndex, no copy)."""
+    return pd.Series(values, copy=False)
 
 
 class TechnicalIndicators:
@@ -17,45 +182,163 @@ class TechnicalIndicators:
     Calculate technical indicators for trading analysis.
     """
 
+    # Indicator results kept for recently seen OHLCV inputs
+    CACHE_SIZE = 8
+    # Compute indicator groups on a thread pool for frames at least this long (backtest-sized)
+    PARALLEL_MIN_ROWS = 20_000
+    PARALLEL_WORKERS = 4
+    # Incremental updates recompute this many windows of history ahead of the new rows, so the
+    # recursive indicators (EMA/RSI/ATR) converge to the full-history value (error < 1e-15)
+    WARMUP_WINDOWS = 5
+
     def __init__(self):
         """Initialize TechnicalIndicators."""
         self.params = INDICATOR_PARAMS
-        logger.debug("TechnicalIndicators initialized")
-
-    def add_all_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        # Default periods, resolved once instead of per-call dict lookups
+        self._sma_windows = tuple(self.params["SMA"][k] for k in ("short", "medium", "long"))
+        self._ema_windows = tuple(self.params["EMA"][k] for k in ("short", "medium", "long"))
+        self._rsi_period = self.params["RSI"]["period"]
+        self._macd_periods = tuple(
+            self.params["MACD"][k] for k in ("fast_period", "slow_period", "signal_period")
+        )
+        self._bb_period = self.params["BOLLINGER_BANDS"]["period"]
+        self._bb_std_dev = self.params["BOLLINGER_BANDS"]["std_dev"]
+        self._atr_period = self.params["ATR"]["period"]
+        self._stoch_k_period = self.params["STOCHASTIC"]["k_period"]
+        self._stoch_d_period = self.params["STOCHASTIC"]["d_period"]
+        # OHLCV digest -> (column names, indicator block) (LRU, see add_all_indicators)
+        self._cache: "OrderedDict[bytes, Tuple[List[str], np.ndarray]]" = OrderedDict()
+        # Empty unless TA-Lib is installed; warm-up rows may differ slightly from `ta`
+        self._talib = INDICATOR_FUNCS
+        # Without TA-Lib, numba kernels (if installed) replace `ta` for the recursive indicators
+        self._numba = NUMBA_AVAILABLE and not self._talib
+        backend = "numba" if self._numba else INDICATOR_BACKEND
+        logger.debug(f"TechnicalIndicators initialized (backend: {backend})")
+
+    def add_all_indicators(self, df: pd.DataFrame, dtype: np.dtype = np.float64) -> pd.DataFrame:
         """
         Add all technical indicators to DataFrame.
 
         Args:
             df: DataFrame with OHLCV data
+            dtype: Dtype of the indicator columns (np.float32 halves memory for backtests;
+                indicators are always computed in float64)
 
         Returns:
-            DataFrame with added indicators
+            New DataFrame with added indicators (the input is not modified)
         """
-        logger.debug(f"Adding all indicators to {len(df)} candles")
+        arrays = _ohlcv_arrays(df)
 
-        # Make a copy to avoid modifying original
-        df = df.copy()
+        # Same candles as a recent call (e.g. the same cached range reloaded) -> reuse the columns
+        key = _arrays_digest(arrays)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            logger.debug(f"Reusing indicators for {len(df)} candles")
+            return _with_block(df, *cached, dtype)
 
-        # Trend indicators
-        df = self.add_sma(df)
-        df = self.add_ema(df)
-        df = self.add_macd(df)
+        logger.debug(f"Adding all indicators to {len(df)} candles")
+        close = arrays.close
 
-        # Momentum indicators
-        df = self.add_rsi(df)
-        df = self.add_stochastic(df)
+        # Trend + momentum indicators
+        if self._numba:
+            trend = [(self._trend_momentum_columns, close)]
+        else:
+            trend = [
+                (self._sma_columns, close),
+                (self._ema_columns, close),
+                (self._macd_columns, close),
+                (self._rsi_columns, close),
+            ]
 
         # Volatility indicators
-        df = self.add_bollinger_bands(df)
-        df = self.add_atr(df)
+        if self._numba:
+            volatility = [(self._volatility_columns, arrays)]
+        else:
+            volatility = [
+                (self._bollinger_columns, close),
+                (self._atr_columns, arrays),
+            ]
+
+        tasks = trend + [(self._stochastic_columns, arrays)] + volatility + [
+            # Volume indicators
+            (self._volume_columns, arrays),
+        ]
+
+        # Groups are independent; the numpy/pandas/TA-Lib/numba kernels release the GIL on long arrays
+        if len(df) >= self.PARALLEL_MIN_ROWS:
+            with ThreadPoolExecutor(max_workers=self.PARALLEL_WORKERS, thread_name_prefix="indicators") as pool:
+                results = list(pool.map(lambda task: task[0](task[1]), tasks))
+        else:
+            results = [func(arg) for func, arg in tasks]
+
+        columns: Dict[str, np.ndarray] = {}
+        for result in results:
+            columns.update(result)
+        names = list(columns)
+        block = _column_block(columns)
 
-        # Volume indicators
-        df = self.add_volume_indicators(df)
+        self._cache[key] = (names, block)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+        # Single insertion of all columns
+        df = _with_block(df, names, block, dtype)
 
         logger.debug(f"Added indicators, now have {len(df.columns)} columns")
         return df
 
+    def update_indicators(self, df: pd.DataFrame, n_new: int) -> pd.DataFrame:
+        """
+        Fill indicators for the last `n_new` rows of a frame whose earlier rows already have them.
+        Only a warm-up tail (WARMUP_WINDOWS * the longest indicator window) plus the new rows is
+        recomputed; windowed indicators are exact, recursive ones converge within the warm-up and
+        the cumulative OBV is re-anchored on the cached value.
+
+        Args:
+            df: DataFrame with OHLCV + indicator columns (indicators may be NaN in the new rows)
+            n_new: Number of trailing rows to (re)calculate
+
+        Returns:
+            New DataFrame with indicators filled (falls back to add_all_indicators when the
+            cached part is too short or lacks indicator columns)
+        """
+        ohlcv = ["open", "high", "low", "close", "volume"]
+        warmup = self.WARMUP_WINDOWS * self._max_window()
+        start = len(df) - n_new
+        tail_start = start - warmup
+
+        if n_new <= 0:
+            return df
+        if tail_start < 0 or "obv" not in df.columns:
+            return self.add_all_indicators(df[ohlcv])
+
+        tail = self.add_all_indicators(df[ohlcv].iloc[tail_start:])
+        indicator_cols = [c for c in tail.columns if c not in ohlcv]
+
+        fresh = tail[indicator_cols].iloc[warmup:].to_numpy(copy=True)
+        # OBV restarts at the tail: shift by the cached OBV at the first tail row
+        obv = indicator_cols.index("obv")
+        fresh[:, obv] += df["obv"].iat[tail_start] - tail["obv"].iat[0]
+
+        df = df.copy()
+        # Keep the cached dtype (e.g. float32 from add_all_indicators(dtype=np.float32))
+        df.iloc[start:, [df.columns.get_loc(c) for c in indicator_cols]] = fresh.astype(
+            df["obv"].dtype, copy=False
+        )
+
+        logger.debug(f"Updated indicators for {n_new} new candles ({warmup} warm-up rows)")
+        return df
+
+    def _max_window(self) -> int:
+        """Longest look-back among the configured indicator periods."""
+        return max(
+            value
+            for params in self.params.values()
+            for name, value in params.items()
+            if name.endswith(("period", "short", "medium", "long"))
+        )
+
     def add_sma(
         self,
         df: pd.DataFrame,
@@ -75,15 +358,7 @@ class TechnicalIndicators:
         Returns:
             DataFrame with SMA columns
         """
-        short = short or self.params["SMA"]["short"]
-        medium = medium or self.params["SMA"]["medium"]
-        long = long or self.params["SMA"]["long"]
-
-        df[f"sma_{short}"] = ta.trend.sma_indicator(df["close"], window=short)
-        df[f"sma_{medium}"] = ta.trend.sma_indicator(df["close"], window=medium)
-        df[f"sma_{long}"] = ta.trend.sma_indicator(df["close"], window=long)
-
-        return df
+        return _with_columns(df, self._sma_columns(_ohlcv_arrays(df).close, short, medium, long))
 
     def add_ema(
         self,
@@ -104,15 +379,7 @@ class TechnicalIndicators:
         Returns:
             DataFrame with EMA columns
         """
-        short = short or self.params["EMA"]["short"]
-        medium = medium or self.params["EMA"]["medium"]
-        long = long or self.params["EMA"]["long"]
-
-        df[f"ema_{short}"] = ta.trend.ema_indicator(df["close"], window=short)
-        df[f"ema_{medium}"] = ta.trend.ema_indicator(df["close"], window=medium)
-        df[f"ema_{long}"] = ta.trend.ema_indicator(df["close"], window=long)
-
-        return df
+        return _with_columns(df, self._ema_columns(_ohlcv_arrays(df).close, short, medium, long))
 
     def add_rsi(
         self,
@@ -129,9 +396,7 @@ class TechnicalIndicators:
         Returns:
             DataFrame with RSI column
         """
-        period = period or self.params["RSI"]["period"]
-        df["rsi"] = ta.momentum.rsi(df["close"], window=period)
-        return df
+        return _with_columns(df, self._rsi_columns(_ohlcv_arrays(df).close, period))
 
     def add_macd(
         self,
@@ -152,22 +417,7 @@ class TechnicalIndicators:
         Returns:
             DataFrame with MACD columns
         """
-        fast = fast or self.params["MACD"]["fast_period"]
-        slow = slow or self.params["MACD"]["slow_period"]
-        signal = signal or self.params["MACD"]["signal_period"]
-
-        macd_indicator = ta.trend.MACD(
-            df["close"],
-            window_fast=fast,
-            window_slow=slow,
-            window_sign=signal,
-        )
-
-        df["macd"] = macd_indicator.macd()
-        df["macd_signal"] = macd_indicator.macd_signal()
-        df["macd_diff"] = macd_indicator.macd_diff()
-
-        return df
+        return _with_columns(df, self._macd_columns(_ohlcv_arrays(df).close, fast, slow, signal))
 
     def add_bollinger_bands(
         self,
@@ -186,22 +436,7 @@ class TechnicalIndicators:
         Returns:
             DataFrame with Bollinger Bands columns
         """
-        period = period or self.params["BOLLINGER_BANDS"]["period"]
-        std_dev = std_dev or self.params["BOLLINGER_BANDS"]["std_dev"]
-
-        bb_indicator = ta.volatility.BollingerBands(
-            df["close"],
-            window=period,
-            window_dev=std_dev,
-        )
-
-        df["bb_upper"] = bb_indicator.bollinger_hband()
-        df["bb_middle"] = bb_indicator.bollinger_mavg()
-        df["bb_lower"] = bb_indicator.bollinger_lband()
-        df["bb_width"] = bb_indicator.bollinger_wband()
-        df["bb_pct"] = bb_indicator.bollinger_pband()
-
-        return df
+        return _with_columns(df, self._bollinger_columns(_ohlcv_arrays(df).close, period, std_dev))
 
     def add_atr(
         self,
@@ -218,14 +453,7 @@ class TechnicalIndicators:
         Returns:
             DataFrame with ATR column
         """
-        period = period or self.params["ATR"]["period"]
-        df["atr"] = ta.volatility.average_true_range(
-            df["high"],
-            df["low"],
-            df["close"],
-            window=period,
-        )
-        return df
+        return _with_columns(df, self._atr_columns(_ohlcv_arrays(df), period))
 
     def add_stochastic(
         self,
@@ -244,21 +472,7 @@ class TechnicalIndicators:
         Returns:
             DataFrame with Stochastic columns
         """
-        k_period = k_period or self.params["STOCHASTIC"]["k_period"]
-        d_period = d_period or self.params["STOCHASTIC"]["d_period"]
-
-        stoch_indicator = ta.momentum.StochasticOscillator(
-            df["high"],
-            df["low"],
-            df["close"],
-            window=k_period,
-            smooth_window=d_period,
-        )
-
-        df["stoch_k"] = stoch_indicator.stoch()
-        df["stoch_d"] = stoch_indicator.stoch_signal()
-
-        return df
+        return _with_columns(df, self._stochastic_columns(_ohlcv_arrays(df), k_period, d_period))
 
     def add_volume_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -270,45 +484,258 @@ class TechnicalIndicators:
         Returns:
             DataFrame with volume indicators
         """
-        # On-Balance Volume
-        df["obv"] = ta.volume.on_balance_volume(df["close"], df["volume"])
-
-        # Volume-Weighted Average Price (VWAP)
-        df["vwap"] = ta.volume.volume_weighted_average_price(
-            df["high"],
-            df["low"],
-            df["close"],
-            df["volume"],
+        return _with_columns(df, self._volume_columns(_ohlcv_arrays(df)))
+
+    # Column builders: take shared float64 arrays, return {column: values}
+
+    def _trend_momentum_columns(self, close: np.ndarray) -> Dict[str, np.ndarray]:
+        """SMA, EMA, MACD and RSI columns from the fused numba kernel (default periods)."""
+        sma_windows = np.array(self._sma_windows, dtype=np.int64)
+        ema_windows = np.array(self._ema_windows, dtype=np.int64)
+        sma, ema, rsi, macd, macd_signal, macd_diff = compute_trend_momentum(
+            close,
+            sma_windows,
+            ema_windows,
+            self._rsi_period,
+            *self._macd_periods,
+        )
+        columns = {f"sma_{w}": sma[j] for j, w in enumerate(sma_windows)}
+        columns.update({f"ema_{w}": ema[j] for j, w in enumerate(ema_windows)})
+        columns.update({"macd": macd, "macd_signal": macd_signal, "macd_diff": macd_diff, "rsi": rsi})
+        return columns
+
+    def _volatility_columns(self, arrays: OHLCVArrays) -> Dict[str, np.ndarray]:
+        """Bollinger Bands and ATR columns from the fused numba kernel (default periods)."""
+        upper, middle, lower, atr = compute_volatility(
+            arrays.high,
+            arrays.low,
+            arrays.close,
+            self._bb_period,
+            float(self._bb_std_dev),
+            self._atr_period,
+        )
+        columns = _bollinger_bands(arrays.close, upper, middle, lower)
+        columns["atr"] = atr
+        return columns
+
+    def _sma_columns(
+        self,
+        close: np.ndarray,
+        short: Optional[int] = None,
+        medium: Optional[int] = None,
+        long: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """SMA columns (see add_sma)."""
+        short = short or self._sma_windows[0]
+        medium = medium or self._sma_windows[1]
+        long = long or self._sma_windows[2]
+
+        if self._talib:
+            sma = self._talib["SMA"]
+            return {f"sma_{window}": sma(close, timeperiod=window) for window in (short, medium, long)}
+
+        close_s = _series(close)
+        return {
+            f"sma_{window}": ta.trend.sma_indicator(close_s, window=window).to_numpy()
+            for window in (short, medium, long)
+        }
+
+    def _ema_columns(
+        self,
+        close: np.ndarray,
+        short: Optional[int] = None,
+        medium: Optional[int] = None,
+        long: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """EMA columns (see add_ema)."""
+        short = short or self._ema_windows[0]
+        medium = medium or self._ema_windows[1]
+        long = long or self._ema_windows[2]
+
+        if self._talib:
+            ema = self._talib["EMA"]
+            return {f"ema_{window}": ema(close, timeperiod=window) for window in (short, medium, long)}
+
+        if self._numba:
+            return {f"ema_{window}": _ema(close, window) for window in (short, medium, long)}
+
+        close_s = _series(close)
+        return {
+            f"ema_{window}": ta.trend.ema_indicator(close_s, window=window).to_numpy()
+            for window in (short, medium, long)
+        }
+
+    def _rsi_columns(self, close: np.ndarray, period: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """RSI column (see add_rsi)."""
+        period = period or self._rsi_period
+        if self._talib:
+            return {"rsi": self._talib["RSI"](close, timeperiod=period)}
+        return {"rsi": ta.momentum.rsi(_series(close), window=period).to_numpy()}
+
+    def _macd_columns(
+        self,
+        close: np.ndarray,
+        fast: Optional[int] = None,
+        slow: Optional[int] = None,
+        signal: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """MACD columns (see add_macd)."""
+        fast = fast or self._macd_periods[0]
+        slow = slow or self._macd_periods[1]
+        signal = signal or self._macd_periods[2]
+
+        if self._talib:
+            # One pass returns (macd, signal, histogram)
+            macd, macd_signal, macd_diff = self._talib["MACD"](
+                close,
+                fastperiod=fast,
+                slowperiod=slow,
+                signalperiod=signal,
+            )
+            return {"macd": macd, "macd_signal": macd_signal, "macd_diff": macd_diff}
+
+        if self._numba:
+            macd = _ema(close, fast) - _ema(close, slow)
+            macd_signal = _ema(macd, signal)
+            return {"macd": macd, "macd_signal": macd_signal, "macd_diff": macd - macd_signal}
+
+        macd_indicator = ta.trend.MACD(
+            _series(close),
+            window_fast=fast,
+            window_slow=slow,
+            window_sign=signal,
         )
+        return {
+            "macd": macd_indicator.macd().to_numpy(),
+            "macd_signal": macd_indicator.macd_signal().to_numpy(),
+            "macd_diff": macd_indicator.macd_diff().to_numpy(),
+        }
 
-        # Money Flow Index
-        df["mfi"] = ta.volume.money_flow_index(
-            df["high"],
-            df["low"],
-            df["close"],
-            df["volume"],
-            window=14,
+    def _bollinger_columns(
+        self,
+        close: np.ndarray,
+        period: Optional[int] = None,
+        std_dev: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Bollinger Bands columns (see add_bollinger_bands)."""
+        period = period or self._bb_period
+        std_dev = std_dev or self._bb_std_dev
+
+        if self._talib:
+            upper, middle, lower = self._talib["BOLLINGER_BANDS"](
+                close,
+                timeperiod=period,
+                nbdevup=std_dev,
+                nbdevdn=std_dev,
+            )
+        else:
+            # Rolling mean / population std (ddof=0), as in ta; bottleneck works on the raw array
+            if bn is not None:
+                middle = bn.move_mean(close, period)
+                std = bn.move_std(close, period, ddof=0)
+            else:
+                window = _series(close).rolling(period)
+                middle = window.mean().to_numpy()
+                std = window.std(ddof=0).to_numpy()
+            upper = middle + std_dev * std
+            lower = middle - std_dev * std
+
+        return _bollinger_bands(close, upper, middle, lower)
+
+    def _atr_columns(self, arrays: OHLCVArrays, period: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """ATR column (see add_atr)."""
+        period = period or self._atr_period
+        if self._talib:
+            return {"atr": self._talib["ATR"](arrays.high, arrays.low, arrays.close, timeperiod=period)}
+        atr = ta.volatility.average_true_range(
+            _series(arrays.high),
+            _series(arrays.low),
+            _series(arrays.close),
+            window=period,
         )
+        return {"atr": atr.to_numpy()}
 
-        return df
+    def _stochastic_columns(
+        self,
+        arrays: OHLCVArrays,
+        k_period: Optional[int] = None,
+        d_period: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Stochastic Oscillator columns (see add_stochastic)."""
+        k_period = k_period or self._stoch_k_period
+        d_period = d_period or self._stoch_d_period
+
+        if self._talib:
+            # slowk_period=1 keeps %K unsmoothed, as in ta; %D is its d_period SMA
+            stoch_k, stoch_d = self._talib["STOCHASTIC"](
+                arrays.high,
+                arrays.low,
+                arrays.close,
+                fastk_period=k_period,
+                slowk_period=1,
+                slowd_period=d_period,
+            )
+            return {"stoch_k": stoch_k, "stoch_d": stoch_d}
+
+        # %K over the k_period high/low range, %D = its d_period SMA (same as ta)
+        lowest = _rolling(arrays.low, k_period, np.min)
+        highest = _rolling(arrays.high, k_period, np.max)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stoch_k = 100 * (arrays.close - lowest) / (highest - lowest)
+        return {
+            "stoch_k": stoch_k,
+            "stoch_d": _rolling(stoch_k, d_period, np.mean),
+        }
+
+    def _volume_columns(self, arrays: OHLCVArrays) -> Dict[str, np.ndarray]:
+        """OBV, VWAP and MFI columns (see add_volume_indicators)."""
+        high, low, close, volume = arrays.high, arrays.low, arrays.close, arrays.volume
 
-    def identify_trend(self, df: pd.DataFrame) -> str:
+        # Volume-Weighted Average Price over ta's 14-bar window - TA-Lib has none
+        typical_volume = (high + low + close) / 3.0 * volume
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vwap = _rolling_sum(typical_volume, 14) / _rolling_sum(volume, 14)
+
+        if self._talib:
+            return {
+                "obv": self._talib["OBV"](close, volume),
+                "vwap": vwap,
+                "mfi": self._talib["MFI"](high, low, close, volume, timeperiod=14),
+            }
+
+        # On-Balance Volume: volume signed by the close-to-close move (flat bars add, as in ta)
+        falling = np.zeros(close.shape[0], dtype=bool)
+        np.less(close[1:], close[:-1], out=falling[1:])
+
+        high_s, low_s, close_s, volume_s = map(_series, (high, low, close, volume))
+        return {
+            "obv": np.cumsum(np.where(falling, -volume, volume)),
+            "vwap": vwap,
+            # Money Flow Index
+            "mfi": ta.volume.money_flow_index(high_s, low_s, close_s, volume_s, window=14).to_numpy(),
+        }
+
+    def identify_trend(self, latest: pd.Series) -> str:
         """
         Identify current market trend.
 
         Args:
-            df: DataFrame with indicators
+            latest: Latest candle with indicators (e.g. df.iloc[-1])
 
         Returns:
-            Trend string: "uptrend", "downtrend", or "sideways"
+            Trend string: "uptrend", "downtrend", "sideways", or "unknown" before SMA 50 is defined
         """
-        if df.empty or len(df) < 50:
+        if latest.empty:
             return "unknown"
 
         # Use price vs moving averages
-        current_price = df["close"].iloc[-1]
-        sma_20 = df["sma_20"].iloc[-1] if "sma_20" in df.columns else current_price
-        sma_50 = df["sma_50"].iloc[-1] if "sma_50" in df.columns else current_price
+        current_price = latest["close"]
+        sma_20 = latest.get("sma_20", current_price)
+        sma_50 = latest.get("sma_50", current_price)
+
+        # Fewer candles than the SMA 50 window
+        if pd.isna(sma_20) or pd.isna(sma_50):
+            return "unknown"
 
         # Strong uptrend: price above both MAs and MAs in correct order
         if current_price > sma_20 > sma_50:
@@ -325,6 +752,7 @@ class TechnicalIndicators:
         self,
         df: pd.DataFrame,
         window: int = 20,
+        latest_close: Optional[float] = None,
     ) -> dict:
         """
         Identify support and resistance levels.
@@ -332,6 +760,7 @@ class TechnicalIndicators:
         Args:
             df: DataFrame with OHLCV data
             window: Lookback window
+            latest_close: Latest close if the caller already has it (default: read from df)
 
         Returns:
             Dictionary with support and resistance levels
@@ -339,18 +768,18 @@ class TechnicalIndicators:
         if df.empty or len(df) < window:
             return {"support": None, "resistance": None}
 
-        recent = df.tail(window)
+        current = df["close"].iat[-1] if latest_close is None else latest_close
 
-        # Simple support/resistance using highs and lows
-        resistance = recent["high"].max()
-        support = recent["low"].min()
+        # Simple support/resistance using highs and lows (views of the last `window` rows)
+        resistance = df["high"].to_numpy()[-window:].max()
+        support = df["low"].to_numpy()[-window:].min()
 
         return {
             "support": support,
             "resistance": resistance,
-            "current": df["close"].iloc[-1],
-            "distance_to_support_pct": (df["close"].iloc[-1] - support) / df["close"].iloc[-1] * 100,
-            "distance_to_resistance_pct": (resistance - df["close"].iloc[-1]) / df["close"].iloc[-1] * 100,
+            "current": current,
+            "distance_to_support_pct": (current - support) / current * 100,
+            "distance_to_resistance_pct": (resistance - current) / current * 100,
         }
 
     def get_indicator_summary(self, df: pd.DataFrame) -> dict:
@@ -367,18 +796,15 @@ class TechnicalIndicators:
             return {}
 
         latest = df.iloc[-1]
-        summary = {}
 
-        # Add all indicator values
-        for col in df.columns:
-            if col not in ["open", "high", "low", "close", "volume"]:
-                summary[col] = latest[col]
+        # Add all indicator values (one row read, one dict build)
+        summary = latest.drop(["open", "high", "low", "close", "volume"], errors="ignore").to_dict()
 
         # Add trend analysis
-        summary["trend"] = self.identify_trend(df)
+        summary["trend"] = self.identify_trend(latest)
 
         # Add support/resistance
-        sr = self.identify_support_resistance(df)
+        sr = self.identify_support_resistance(df, latest_close=latest["close"])
         summary.update(sr)
 
         # Add signal interpretations
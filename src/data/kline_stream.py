@@ -0,0 +1,58 @@
+"""
+Binance kline WebSocket stream.
+Pushes closed candles so the trading loop runs exactly on bar close instead of polling.
+"""
+
+import threading
+from typing import Optional, Dict, Any, AsyncIterator
+
+from loguru import logger
+
+from src.config.settings import get_settings
+from src.data.binance_stream import BinanceStream
+
+
+class KlineStream(BinanceStream):
+    """
+    Subscribes to `<symbol>@kline_<interval>` and yields each closed candle.
+    """
+
+    def __init__(
+        self,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+    ):
+        """
+        Initialize kline stream.
+
+        Args:
+            symbol: Trading symbol (default: from settings)
+            timeframe: Timeframe (default: from settings)
+        """
+        settings = get_settings()
+        self.symbol = symbol or settings.trading_symbol
+        self.timeframe = timeframe or settings.trading_timeframe
+
+        # Binance interval 문자열은 CCXT timeframe과 동일 (1m, 1h, 1d ...)
+        super().__init__(f"{self.symbol.replace('/', '').lower()}@kline_{self.timeframe}")
+
+        logger.info(f"KlineStream initialized ({self.url})")
+
+    async def candle_closes(
+        self,
+        stop_event: Optional[threading.Event] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield kline payloads for closed candles (`k.x == true`).
+
+        Args:
+            stop_event: Stops the stream once set
+
+        Yields:
+            Binance kline dictionary (`t`, `o`, `h`, `l`, `c`, `v`, ...)
+        """
+        async for message in self.messages(stop_event):
+            kline = message.get("k")
+            if kline and kline.get("x"):
+                logger.debug(f"Candle closed at {kline['T']} (close: {kline['c']})")
+                yield kline
@@ -3,6 +3,10 @@ Market data collection and management.
 Handles downloading, caching, and providing market data with technical indicators.
 """
 
+import asyncio
+import importlib.util
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 from typing import Optional, List, Dict, Any
@@ -10,10 +14,13 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from loguru import logger
 
-from src.data.binance_client import BinanceClient
+from src.data.binance_client import BinanceClient, get_client, ohlcv_to_array, ohlcv_to_frame
 from src.data.indicators import TechnicalIndicators
 from src.config.settings import get_settings
 
+# Parquet (columnar, typed, zstd) when pyarrow is installed; CSV otherwise
+CACHE_SUFFIX = ".parquet" if importlib.util.find_spec("pyarrow") else ".csv"
+
 
 class MarketData:
     """
@@ -29,11 +36,11 @@ class MarketData:
         Initialize MarketData.
 
         Args:
-            client: BinanceClient instance (creates new if None)
+            client: BinanceClient instance (shared get_client() if None)
             cache_dir: Directory for caching data
         """
         self.settings = get_settings()
-        self.client = client or BinanceClient()
+        self.client = client or get_client()
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.indicators = TechnicalIndicators()
@@ -51,9 +58,44 @@ class MarketData:
         symbol_clean = symbol.replace("/", "_")
         start_str = start_date.strftime("%Y%m%d") if start_date else "all"
         end_str = end_date.strftime("%Y%m%d") if end_date else "latest"
-        filename = f"{symbol_clean}_{timeframe}_{start_str}_{end_str}.csv"
+        filename = f"{symbol_clean}_{timeframe}_{start_str}_{end_str}{CACHE_SUFFIX}"
         return self.cache_dir / filename
 
+    @staticmethod
+    def _read_cache(cache_file: Path) -> pd.DataFrame:
+        """Read a cache file (parquet or legacy CSV, by suffix)."""
+        if cache_file.suffix == ".parquet":
+            return pd.read_parquet(cache_file)
+        return pd.read_csv(cache_file, index_col="timestamp", parse_dates=True)
+
+    @staticmethod
+    def _write_cache(df: pd.DataFrame, cache_file: Path) -> None:
+        """Write a cache file in the format given by its suffix."""
+        if cache_file.suffix == ".parquet":
+            df.to_parquet(cache_file, compression="zstd", engine="pyarrow")
+        else:
+            df.to_csv(cache_file)
+
+    def _find_cache(self, cache_file: Path) -> Optional[Path]:
+        """
+        Locate a cache file, migrating a legacy CSV copy to parquet on first read.
+
+        Args:
+            cache_file: Expected cache path (CACHE_SUFFIX)
+
+        Returns:
+            Existing cache path, or None
+        """
+        if cache_file.exists():
+            return cache_file
+        legacy = cache_file.with_suffix(".csv")
+        if cache_file.suffix == ".csv" or not legacy.exists():
+            return None
+        logger.info(f"Migrating cache {legacy.name} to parquet")
+        self._write_cache(self._read_cache(legacy), cache_file)
+        legacy.unlink()
+        return cache_file
+
     def _ohlcv_to_dataframe(self, ohlcv: List[List]) -> pd.DataFrame:
         """
         Convert OHLCV list to pandas DataFrame.
@@ -64,22 +106,17 @@ class MarketData:
         Returns:
             DataFrame with OHLCV data
         """
-        df = pd.DataFrame(
-            ohlcv,
-            columns=["timestamp", "open", "high", "low", "close", "volume"],
-        )
-        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
-        df.set_index("timestamp", inplace=True)
-
-        # Convert to numeric
-        for col in ["open", "high", "low", "close", "volume"]:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+        # One bulk float64 cast (CCXT values are already numeric)
+        values = ohlcv_to_array(ohlcv)
 
-        # Remove duplicates and sort
-        df = df[~df.index.duplicated(keep="last")]
-        df.sort_index(inplace=True)
+        # Remove duplicates and sort on the raw ms timestamps, before building the index
+        ts = values[:, 0]
+        if not (ts[1:] > ts[:-1]).all():
+            # np.unique keeps the first occurrence; search the reversed rows to keep the latest
+            _, reversed_idx = np.unique(ts[::-1], return_index=True)
+            values = values[len(ts) - 1 - reversed_idx]
 
-        return df
+        return ohlcv_to_frame(values)
 
     def fetch_latest_data(
         self,
@@ -148,9 +185,9 @@ class MarketData:
 
         # Check cache
         cache_file = self._get_cache_filename(symbol, timeframe, start_date, end_date)
-        if use_cache and cache_file.exists():
+        if use_cache and self._find_cache(cache_file):
             logger.info(f"Loading data from cache: {cache_file}")
-            df = pd.read_csv(cache_file, index_col="timestamp", parse_dates=True)
+            df = self._read_cache(cache_file)
             if with_indicators and "rsi" not in df.columns:
                 df = self.indicators.add_all_indicators(df)
             return df
@@ -166,6 +203,7 @@ class MarketData:
             end_date=end_date,
             symbol=symbol,
             timeframe=timeframe,
+            use_cache=use_cache,
         )
 
         if not ohlcv:
@@ -179,10 +217,45 @@ class MarketData:
         # Save to cache
         if use_cache:
             logger.info(f"Saving data to cache: {cache_file}")
-            df.to_csv(cache_file)
+            self._write_cache(df, cache_file)
 
         return df
 
+    async def fetch_historical_data_async(
+        self,
+        start_date: datetime,
+        end_date: Optional[datetime] = None,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        use_cache: bool = True,
+        with_indicators: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Awaitable fetch_historical_data for the asyncio trading loop / API handlers.
+        The pages are already requested concurrently on the client's thread pool, so the
+        download runs in a worker thread instead of on a second (async) exchange instance.
+
+        Args:
+            start_date: Start date
+            end_date: End date (default: now)
+            symbol: Trading symbol (default: from settings)
+            timeframe: Timeframe (default: from settings)
+            use_cache: Use cached data if available
+            with_indicators: Calculate technical indicators
+
+        Returns:
+            DataFrame with historical data
+        """
+        return await asyncio.to_thread(
+            self.fetch_historical_data,
+            start_date=start_date,
+            end_date=end_date,
+            symbol=symbol,
+            timeframe=timeframe,
+            use_cache=use_cache,
+            with_indicators=with_indicators,
+        )
+
     def update_cache(
         self,
         symbol: Optional[str] = None,
@@ -202,8 +275,11 @@ class MarketData:
         timeframe = timeframe or self.settings.trading_timeframe
 
         # Find most recent cache file
-        cache_pattern = f"{symbol.replace('/', '_')}_{timeframe}_*.csv"
-        cache_files = list(self.cache_dir.glob(cache_pattern))
+        cache_pattern = f"{symbol.replace('/', '_')}_{timeframe}_*"
+        cache_files = [
+            path for path in self.cache_dir.glob(cache_pattern)
+            if path.suffix in (".csv", ".parquet")
+        ]
 
         if not cache_files:
             logger.warning("No cache file found, fetching all data")
@@ -217,8 +293,9 @@ class MarketData:
 
         # Load most recent cache
         latest_cache = max(cache_files, key=lambda p: p.stat().st_mtime)
+        latest_cache = self._find_cache(latest_cache.with_suffix(CACHE_SUFFIX)) or latest_cache
         logger.info(f"Updating cache: {latest_cache}")
-        df_cached = pd.read_csv(latest_cache, index_col="timestamp", parse_dates=True)
+        df_cached = self._read_cache(latest_cache)
 
         # Fetch new data since last cached timestamp
         last_timestamp = df_cached.index[-1]
@@ -238,17 +315,12 @@ class MarketData:
                 df_combined = df_combined[~df_combined.index.duplicated(keep="last")]
                 df_combined.sort_index(inplace=True)
 
-                # Recalculate indicators on combined data
-                # Remove old indicator columns
-                indicator_cols = [
-                    c for c in df_combined.columns
-                    if c not in ["open", "high", "low", "close", "volume"]
-                ]
-                df_combined.drop(columns=indicator_cols, inplace=True, errors="ignore")
-                df_combined = self.indicators.add_all_indicators(df_combined)
+                # Recalculate indicators only from the first new candle onwards
+                n_new = len(df_combined) - df_combined.index.searchsorted(df_new.index[0])
+                df_combined = self.indicators.update_indicators(df_combined, n_new)
 
                 # Save updated cache
-                df_combined.to_csv(latest_cache)
+                self._write_cache(df_combined, latest_cache)
                 logger.info(f"Updated cache with {len(df_new)} new candles")
                 return df_combined
             else:
@@ -270,8 +342,7 @@ class MarketData:
             Current price
         """
         symbol = symbol or self.settings.trading_symbol
-        ticker = self.client.fetch_ticker(symbol)
-        return float(ticker["last"])
+        return self.client.last_price(symbol)
 
     def get_latest_candle(
         self,
@@ -329,10 +400,15 @@ class MarketData:
             with_indicators=True,
         )
 
-        current_price = df["close"].iloc[-1]
-        price_change_24h = (current_price - df["close"].iloc[0]) / df["close"].iloc[0] * 100
-        volume_24h = df["volume"].sum()
-        volatility = df["close"].pct_change().std() * np.sqrt(lookback)
+        closes = df["close"].to_numpy()
+        latest = df.iloc[-1]
+        current_price = closes[-1]
+        price_change_24h = (current_price - closes[0]) / closes[0] * 100
+        volume_24h = df["volume"].to_numpy().sum()
+        # Same as close.pct_change().std() (ddof=1), without the intermediate Series
+        volatility = np.nan
+        if len(closes) > 2:
+            volatility = np.std(np.diff(closes) / closes[:-1], ddof=1) * np.sqrt(lookback)
 
         summary = {
             "symbol": symbol or self.settings.trading_symbol,
@@ -340,19 +416,26 @@ class MarketData:
             "price_change_pct": price_change_24h,
             "volume_24h": volume_24h,
             "volatility": volatility,
-            "high_24h": df["high"].max(),
-            "low_24h": df["low"].min(),
-            "rsi": df["rsi"].iloc[-1] if "rsi" in df.columns else None,
-            "macd": df["macd"].iloc[-1] if "macd" in df.columns else None,
-            "macd_signal": df["macd_signal"].iloc[-1] if "macd_signal" in df.columns else None,
-            "sma_20": df["sma_20"].iloc[-1] if "sma_20" in df.columns else None,
-            "sma_50": df["sma_50"].iloc[-1] if "sma_50" in df.columns else None,
-            "atr": df["atr"].iloc[-1] if "atr" in df.columns else None,
+            "high_24h": df["high"].to_numpy().max(),
+            "low_24h": df["low"].to_numpy().min(),
         }
+        for col in ("rsi", "macd", "macd_signal", "sma_20", "sma_50", "atr"):
+            summary[col] = latest[col] if col in latest.index else None
 
         return summary
 
 
+@lru_cache(maxsize=1)
+def get_market_data() -> MarketData:
+    """
+    Get the shared MarketData (created on first use, on the shared get_client()).
+
+    Returns:
+        Process-wide MarketData instance
+    """
+    return MarketData()
+
+
 if __name__ == "__main__":
     # Test MarketData
     from loguru import logger
@@ -0,0 +1,99 @@
+"""
+Persistent OHLCV candle cache backed by SQLite.
+Closed candles never change, so ranges fetched once are served from disk afterwards.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Sequence
+
+from loguru import logger
+
+
+class OHLCVCache:
+    """
+    SQLite store of closed candles keyed by (symbol, timeframe, timestamp).
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS ohlcv (
+            symbol TEXT NOT NULL,
+            timeframe TEXT NOT NULL,
+            ts INTEGER NOT NULL,
+            open REAL NOT NULL,
+            high REAL NOT NULL,
+            low REAL NOT NULL,
+            close REAL NOT NULL,
+            volume REAL NOT NULL,
+            PRIMARY KEY (symbol, timeframe, ts)
+        ) WITHOUT ROWID
+    """
+
+    def __init__(self, db_path: str = "data/ohlcv_cache.db"):
+        """
+        Initialize OHLCV cache.
+
+        Args:
+            db_path: SQLite database file (created on first use)
+        """
+        self.db_path = Path(db_path)
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database lazily (shared across threads, guarded by self._lock)."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(self._SCHEMA)
+            logger.debug(f"OHLCV cache opened: {self.db_path}")
+        return self._conn
+
+    def load(self, symbol: str, timeframe: str, start_ts: int, end_ts: int) -> List[List]:
+        """
+        Load cached candles in [start_ts, end_ts].
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe
+            start_ts: Range start (ms, inclusive)
+            end_ts: Range end (ms, inclusive)
+
+        Returns:
+            List of [timestamp, open, high, low, close, volume] sorted by timestamp
+        """
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT ts, open, high, low, close, volume FROM ohlcv "
+                "WHERE symbol = ? AND timeframe = ? AND ts BETWEEN ? AND ? ORDER BY ts",
+                (symbol, timeframe, start_ts, end_ts),
+            ).fetchall()
+        return [list(row) for row in rows]
+
+    def store(self, symbol: str, timeframe: str, candles: Sequence[Sequence]) -> None:
+        """
+        Insert closed candles (existing timestamps are left untouched).
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe
+            candles: [timestamp, open, high, low, close, volume] rows
+        """
+        if not candles:
+            return
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO ohlcv VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    ((symbol, timeframe, *candle[:6]) for candle in candles),
+                )
+        logger.debug(f"Cached {len(candles)} {timeframe} candles for {symbol}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,48 @@
+"""
+Binance ticker WebSocket stream.
+Keeps the last price in memory so frequent price reads don't cost a REST round trip each.
+"""
+
+import threading
+from typing import Optional, AsyncIterator
+
+from loguru import logger
+
+from src.config.settings import get_settings
+from src.data.binance_stream import BinanceStream
+
+
+class TickerStream(BinanceStream):
+    """
+    Subscribes to `<symbol>@ticker` (one update per second) and yields the last price.
+    """
+
+    def __init__(self, symbol: Optional[str] = None):
+        """
+        Initialize ticker stream.
+
+        Args:
+            symbol: Trading symbol (default: from settings)
+        """
+        self.symbol = symbol or get_settings().trading_symbol
+        super().__init__(f"{self.symbol.replace('/', '').lower()}@ticker")
+
+        logger.info(f"TickerStream initialized ({self.url})")
+
+    async def prices(
+        self,
+        stop_event: Optional[threading.Event] = None,
+    ) -> AsyncIterator[float]:
+        """
+        Yield the last traded price of every ticker update.
+
+        Args:
+            stop_event: Stops the stream once set
+
+        Yields:
+            Last price
+        """
+        async for message in self.messages(stop_event):
+            price = message.get("c")
+            if price is not None:
+                yield float(price)
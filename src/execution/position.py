@@ -0,0 +1,27 @@
+"""
+Open position state tracked by the trade executor.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(slots=True)
+class Position:
+    """
+    Currently open position (slotted for fast attribute access).
+    """
+
+    action: str
+    entry_price: float
+    size: float
+    stop_loss: float
+    take_profit: float
+    timestamp_ns: int  # time.time_ns() at entry
+    order_id: Optional[str] = None
+
+    @property
+    def opened_at(self) -> datetime:
+        """Entry time as a local datetime (for display)."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
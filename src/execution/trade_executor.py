@@ -3,14 +3,32 @@ Trade execution engine.
 Handles order placement and position management.
 """
 
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, NamedTuple, Optional, Tuple
+import ccxt
 from loguru import logger
-from datetime import datetime
 
-from src.data.binance_client import BinanceClient
+from src.data.binance_client import BinanceClient, get_client
 from src.config.settings import get_settings
-from src.config.constants import TradingAction, OrderSide
+from src.config.constants import (
+    TradingAction,
+    OrderSide,
+    ACTION_BUY,
+    ACTION_SELL,
+    ACTION_CLOSE,
+)
 from src.llm.decision_parser import TradingDecision
+from src.execution.position import Position
+
+
+class EntryFill(NamedTuple):
+    """
+    What an entry actually filled (a post-only entry may fill only partly).
+    """
+
+    order: Dict[str, Any]  # Last order sent
+    filled: float
+    average: float
 
 
 class TradeExecutor:
@@ -18,19 +36,44 @@ class TradeExecutor:
     Executes trades on Binance based on decisions.
     """
 
+    # A fetched price is reused for this long (seconds), so the execute / SL-TP / P&L calls of
+    # one decision cycle share a single lookup; placing an order invalidates it
+    PRICE_TTL = 0.25
+    # Status poll interval (seconds) while a post-only entry rests on the book
+    MAKER_POLL_INTERVAL = 0.1
+    # CCXT order statuses after which an order can no longer fill
+    FINAL_ORDER_STATUSES = ("closed", "canceled", "expired", "rejected")
+    # execute_decision dispatch: action -> handler method name (HOLD has none)
+    _HANDLERS = {
+        ACTION_BUY: "_execute_buy",
+        ACTION_SELL: "_execute_sell",
+        ACTION_CLOSE: "_execute_close",
+    }
+
     def __init__(self, client: Optional[BinanceClient] = None):
         """
         Initialize trade executor.
 
         Args:
-            client: BinanceClient instance (creates new if None)
+            client: BinanceClient instance (shared get_client() if None)
         """
         self.settings = get_settings()
-        self.client = client or BinanceClient()
-        self.current_position: Optional[Dict[str, Any]] = None
+        self.client = client or get_client()
+        # Read on every order/price path
+        self._symbol = self.settings.trading_symbol
+        self._market_type = self.settings.market_type
+        self.current_position: Optional[Position] = None
+        # Exchange-side protective orders of the current futures position (see _place_protective_orders)
         self.open_orders: list = []
+        # (price, time.monotonic() of the fetch), see _current_price
+        self._price_cache: Optional[Tuple[float, float]] = None
+
+        # SL/TP checks then read the streamed price from memory (last_price falls back to REST
+        # whenever the stream is older than BinanceClient.PRICE_MAX_AGE)
+        if self.settings.trading_mode != "backtest" and self.settings.price_stream_enabled:
+            self.client.start_ticker_stream(self._symbol)
 
-        logger.info(f"TradeExecutor initialized (mode: {self.settings.trading_mode})")
+        logger.info("TradeExecutor initialized (mode: {})", self.settings.trading_mode)
 
     def execute_decision(
         self,
@@ -52,72 +95,285 @@ class TradeExecutor:
 
         # Live/Paper trading
         try:
-            if decision.action == TradingAction.BUY:
-                return self._execute_buy(decision, position_size)
-            elif decision.action == TradingAction.SELL:
-                # Spot에서는 보유 포지션 없이 SELL 불가 (공매도 불가)
-                if self.settings.market_type == "spot" and not self.current_position:
-                    logger.warning("Spot market: SELL skipped (no open BUY position to sell)")
-                    return {"status": "skipped", "message": "Spot SELL requires an open BUY position"}
-                return self._execute_sell(decision, position_size)
-            elif decision.action == TradingAction.CLOSE:
-                return self._execute_close()
-            else:  # HOLD
+            handler_name = self._HANDLERS.get(decision.action)
+            if handler_name is None:  # HOLD
                 return {
                     "status": "hold",
                     "message": "No action taken",
                 }
+            # Spot에서는 보유 포지션 없이 SELL 불가 (공매도 불가)
+            if (
+                decision.action == ACTION_SELL
+                and self._market_type == "spot"
+                and not self.current_position
+            ):
+                logger.warning("Spot market: SELL skipped (no open BUY position to sell)")
+                return {"status": "skipped", "message": "Spot SELL requires an open BUY position"}
+            return getattr(self, handler_name)(decision, position_size)
         except Exception as e:
-            logger.error(f"Execution failed: {e}")
+            logger.error("Execution failed: {}", e)
             return {
                 "status": "error",
                 "message": str(e),
             }
 
+    def _current_price(self) -> float:
+        """
+        Get the last price of the trading symbol, reusing a fetch younger than PRICE_TTL.
+
+        Returns:
+            Last price
+        """
+        now = time.monotonic()
+        cached = self._price_cache
+        if cached is not None and now - cached[1] < self.PRICE_TTL:
+            return cached[0]
+
+        price = self.client.last_price(self._symbol)
+        self._price_cache = (price, now)
+        return price
+
+    def _position_age_seconds(self) -> float:
+        """
+        Seconds since the current position was opened.
+
+        Returns:
+            Position age (0.0 when flat)
+        """
+        if not self.current_position:
+            return 0.0
+        return (time.time_ns() - self.current_position.timestamp_ns) / 1e9
+
+    def _create_entry_order(
+        self,
+        side: OrderSide,
+        amount: float,
+        confidence: float,
+        price: float,
+    ) -> EntryFill:
+        """
+        Send the order for a decision: market, or for confident decisions (maker_only_confidence_threshold)
+        a post-only limit at the best bid/ask that falls back to market for whatever is still unfilled
+        after maker_order_timeout (post-only rejections included).
+        A remainder below the market's minimum amount is left unfilled, and a failed remainder order
+        keeps the part already filled, so the position is always sized from what actually filled.
+
+        Args:
+            side: Order side
+            amount: Order amount
+            confidence: Decision confidence
+            price: Price read before the order (used when a response has no average fill price)
+
+        Returns:
+            EntryFill with the total filled amount and its average price
+        """
+        symbol = self._symbol
+        if confidence < self.settings.maker_only_confidence_threshold:
+            order = self.client.create_market_order(side=side, amount=amount, symbol=symbol)
+            return EntryFill(order, *self._market_fill(order, amount, price))
+
+        try:
+            bid, ask = self.client.fetch_best_bid_ask(symbol)
+            order = self.client.create_limit_order(
+                side=side,
+                amount=amount,
+                price=bid if side == OrderSide.BUY else ask,
+                symbol=symbol,
+                params={"postOnly": True},
+            )
+        except Exception as e:
+            logger.warning("Post-only entry not placed ({}), sending market order", e)
+            order = self.client.create_market_order(side=side, amount=amount, symbol=symbol)
+            return EntryFill(order, *self._market_fill(order, amount, price))
+
+        deadline = time.monotonic() + self.settings.maker_order_timeout
+        try:
+            while order.get("status") == "open" and time.monotonic() < deadline:
+                time.sleep(self.MAKER_POLL_INTERVAL)
+                order = self.client.fetch_order(order["id"], symbol)
+        except Exception as e:
+            logger.warning("Polling post-only entry {} failed: {}", order["id"], e)
+        finally:
+            # Never leave the post-only order resting: cancel it and confirm its final state
+            order = self._settle_post_only_order(order, symbol)
+
+        maker_filled = order.get("filled") or 0.0
+        maker_average = order.get("average") or order.get("price") or price
+        if order.get("status") == "closed":
+            return EntryFill(order, maker_filled, maker_average)
+        if order.get("status") not in self.FINAL_ORDER_STATUSES:
+            # It might still fill, so a market remainder could double the position
+            logger.error(
+                "Post-only entry {} may still be open, not sending market remainder (filled {:.8f})",
+                order["id"],
+                maker_filled,
+            )
+            return EntryFill(order, maker_filled, maker_average)
+
+        remaining = self.client.tradable_amount(amount - maker_filled, symbol)
+        if remaining <= 0:
+            if maker_filled:
+                logger.info("Post-only entry remainder below minimum order size, keeping {:.8f}", maker_filled)
+            return EntryFill(order, maker_filled, maker_average)
+
+        logger.info("Post-only entry unfilled, sending market order for {:.8f}", remaining)
+        try:
+            market_order = self.client.create_market_order(side=side, amount=remaining, symbol=symbol)
+        except Exception as e:
+            if not maker_filled:
+                raise
+            logger.error("Market order for the entry remainder failed, keeping {:.8f}: {}", maker_filled, e)
+            return EntryFill(order, maker_filled, maker_average)
+        market_filled, market_average = self._market_fill(market_order, remaining, price)
+        filled = maker_filled + market_filled
+        average = (maker_filled * maker_average + market_filled * market_average) / filled
+        return EntryFill(market_order, filled, average)
+
+    def _settle_post_only_order(self, order: Dict[str, Any], symbol: str) -> Dict[str, Any]:
+        """
+        Cancel a post-only entry that is not final yet and fetch its final state.
+
+        Args:
+            order: Last known order details
+            symbol: Trading symbol
+
+        Returns:
+            Final order details, or the last known ones if they couldn't be fetched
+        """
+        if order.get("status") in self.FINAL_ORDER_STATUSES:
+            return order
+        try:
+            self.client.cancel_order(order["id"], symbol)
+        except Exception as e:
+            logger.debug("Cancel of post-only entry failed (filled meanwhile?): {}", e)
+        try:
+            return self.client.fetch_order(order["id"], symbol)
+        except Exception as e:
+            logger.error("Final state of post-only entry {} unknown: {}", order["id"], e)
+            return order
+
+    @staticmethod
+    def _market_fill(order: Dict[str, Any], amount: float, price: float) -> Tuple[float, float]:
+        """
+        Filled amount and average price of a market order.
+        An ACK-style response (no fill reported yet) counts as fully filled at `price`.
+
+        Args:
+            order: Order details
+            amount: Amount sent
+            price: Price read before the order
+
+        Returns:
+            (filled, average)
+        """
+        return order.get("filled") or amount, order.get("average") or price
+
+    def _place_protective_orders(
+        self,
+        side: OrderSide,
+        amount: float,
+        stop_price: float,
+        take_profit_price: float,
+    ) -> None:
+        """
+        Keep stop-loss and take-profit live on Binance for a new futures position.
+        Both reduce-only orders go out together in one batchOrders request; only accepted ones
+        are kept in open_orders, and check_stop_loss_take_profit still guards the position.
+
+        Args:
+            side: Closing side (opposite of the entry)
+            amount: Position size
+            stop_price: Stop-loss trigger price
+            take_profit_price: Take-profit trigger price
+        """
+        if self._market_type != "futures" or not self.settings.protective_orders_enabled:
+            return
+        legs = ("STOP_MARKET", "TAKE_PROFIT_MARKET")
+        try:
+            results = self.client.create_orders_batch([
+                {
+                    "type": "STOP_MARKET",
+                    "side": side,
+                    "amount": amount,
+                    "params": {"stopPrice": stop_price, "reduceOnly": True},
+                },
+                {
+                    "type": "TAKE_PROFIT_MARKET",
+                    "side": side,
+                    "amount": amount,
+                    "params": {"stopPrice": take_profit_price, "reduceOnly": True},
+                },
+            ])
+        except Exception as e:
+            logger.error("Protective orders not placed, relying on SL/TP checks: {}", e)
+            return
+        # A batch doesn't raise for rejected entries: they come back without an order id
+        self.open_orders = []
+        for leg, order in zip(legs, results):
+            if order.get("id"):
+                self.open_orders.append(order)
+            else:
+                logger.error("{} rejected, relying on SL/TP checks: {}", leg, order.get("info"))
+
+    def _cancel_protective_orders(self) -> None:
+        """
+        Cancel the remaining protective orders once the position is closed.
+        Only the bot's own order ids are cancelled; other orders on the symbol are left alone.
+        """
+        for order in self.open_orders:
+            try:
+                self.client.cancel_order(order["id"], self._symbol)
+            except ccxt.OrderNotFound:
+                # Already triggered or cancelled
+                logger.debug("Protective order {} no longer open", order["id"])
+            except Exception as e:
+                logger.error("Failed to cancel protective order {}: {}", order["id"], e)
+        self.open_orders = []
+
     def _execute_buy(
         self,
         decision: TradingDecision,
         position_size: float,
     ) -> Dict[str, Any]:
         """Execute BUY order."""
-        logger.info(f"Executing BUY: {position_size:.8f} {self.settings.trading_symbol}")
+        logger.info("Executing BUY: {:.8f} {}", position_size, self._symbol)
 
         # Get current price
-        ticker = self.client.fetch_ticker(self.settings.trading_symbol)
-        current_price = float(ticker["last"])
-
-        # Place market order
-        order = self.client.create_market_order(
-            side=OrderSide.BUY,
-            amount=position_size,
-            symbol=self.settings.trading_symbol,
-        )
+        current_price = self._current_price()
+
+        # Place entry order
+        fill = self._create_entry_order(OrderSide.BUY, position_size, decision.confidence, current_price)
+        self._price_cache = None
+        if fill.filled <= 0:
+            return {"status": "error", "message": "Entry order not filled", "order": fill.order}
+        entry_price = fill.average
 
         # Set stop-loss and take-profit
-        stop_price = current_price * (1 - decision.stop_loss_pct)
-        take_profit_price = current_price * (1 + decision.take_profit_pct)
+        stop_price = entry_price * (1 - decision.stop_loss_pct)
+        take_profit_price = entry_price * (1 + decision.take_profit_pct)
 
         logger.info(
-            f"Position opened at ${current_price:,.2f} "
-            f"(SL: ${stop_price:,.2f}, TP: ${take_profit_price:,.2f})"
+            "Position opened at ${:,.2f} (SL: ${:,.2f}, TP: ${:,.2f})",
+            entry_price, stop_price, take_profit_price,
+        )
+        self._place_protective_orders(OrderSide.SELL, fill.filled, stop_price, take_profit_price)
+
+        self.current_position = Position(
+            action=ACTION_BUY,
+            entry_price=entry_price,
+            size=fill.filled,
+            stop_loss=stop_price,
+            take_profit=take_profit_price,
+            timestamp_ns=time.time_ns(),
+            order_id=fill.order.get("id"),
         )
-
-        self.current_position = {
-            "action": "BUY",
-            "entry_price": current_price,
-            "size": position_size,
-            "stop_loss": stop_price,
-            "take_profit": take_profit_price,
-            "timestamp": datetime.now(),
-            "order_id": order.get("id"),
-        }
 
         return {
             "status": "success",
-            "action": "BUY",
-            "price": current_price,
-            "size": position_size,
-            "order": order,
+            "action": ACTION_BUY,
+            "price": entry_price,
+            "size": fill.filled,
+            "order": fill.order,
         }
 
     def _execute_sell(
@@ -126,45 +382,55 @@ class TradeExecutor:
         position_size: float,
     ) -> Dict[str, Any]:
         """Execute SELL order (for spot: close long, for futures: open short)."""
-        logger.info(f"Executing SELL: {position_size:.8f} {self.settings.trading_symbol}")
+        logger.info("Executing SELL: {:.8f} {}", position_size, self._symbol)
 
-        ticker = self.client.fetch_ticker(self.settings.trading_symbol)
-        current_price = float(ticker["last"])
+        current_price = self._current_price()
 
-        order = self.client.create_market_order(
-            side=OrderSide.SELL,
-            amount=position_size,
-            symbol=self.settings.trading_symbol,
-        )
+        fill = self._create_entry_order(OrderSide.SELL, position_size, decision.confidence, current_price)
+        self._price_cache = None
+        if fill.filled <= 0:
+            return {"status": "error", "message": "Entry order not filled", "order": fill.order}
+        entry_price = fill.average
 
-        if self.settings.market_type == "futures":
+        if self._market_type == "futures":
             # For futures, SELL opens a short position
-            stop_price = current_price * (1 + decision.stop_loss_pct)
-            take_profit_price = current_price * (1 - decision.take_profit_pct)
-
-            self.current_position = {
-                "action": "SELL",
-                "entry_price": current_price,
-                "size": position_size,
-                "stop_loss": stop_price,
-                "take_profit": take_profit_price,
-                "timestamp": datetime.now(),
-                "order_id": order.get("id"),
-            }
+            stop_price = entry_price * (1 + decision.stop_loss_pct)
+            take_profit_price = entry_price * (1 - decision.take_profit_pct)
+            self._place_protective_orders(OrderSide.BUY, fill.filled, stop_price, take_profit_price)
+
+            self.current_position = Position(
+                action=ACTION_SELL,
+                entry_price=entry_price,
+                size=fill.filled,
+                stop_loss=stop_price,
+                take_profit=take_profit_price,
+                timestamp_ns=time.time_ns(),
+                order_id=fill.order.get("id"),
+            )
         else:
             # For spot, SELL closes the position
             self.current_position = None
 
         return {
             "status": "success",
-            "action": "SELL",
-            "price": current_price,
-            "size": position_size,
-            "order": order,
+            "action": ACTION_SELL,
+            "price": entry_price,
+            "size": fill.filled,
+            "order": fill.order,
         }
 
-    def _execute_close(self) -> Dict[str, Any]:
-        """Close current position."""
+    def _execute_close(
+        self,
+        decision: Optional[TradingDecision] = None,
+        position_size: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Close current position.
+
+        Args:
+            decision: CLOSE decision (unused; shared handler signature)
+            position_size: Unused; the whole position is closed
+        """
         if not self.current_position:
             return {
                 "status": "no_position",
@@ -173,37 +439,107 @@ class TradeExecutor:
 
         logger.info("Closing position")
         position = self.current_position
-        ticker = self.client.fetch_ticker(self.settings.trading_symbol)
-        current_price = float(ticker["last"])
+        current_price = self._current_price()
 
         # Determine order side
-        if position["action"] == "BUY":
+        if position.action == ACTION_BUY:
             side = OrderSide.SELL
         else:
             side = OrderSide.BUY
 
-        # Close position
-        order = self.client.create_market_order(
-            side=side,
-            amount=position["size"],
-            symbol=self.settings.trading_symbol,
-        )
+        # Close position (reduce-only while protective orders exist, so a position they already
+        # closed on the exchange can't be reopened in the opposite direction)
+        try:
+            order = self.client.create_market_order(
+                side=side,
+                amount=position.size,
+                symbol=self._symbol,
+                params={"reduceOnly": True} if self.open_orders else None,
+            )
+        except ccxt.InvalidOrder as e:
+            # -2022 "ReduceOnly Order is rejected": nothing left to close
+            if not (self.open_orders and "-2022" in str(e)):
+                raise
+            logger.warning("Position was already closed on the exchange by a protective order")
+            order = self._triggered_protective_order()
+            if order is None:
+                logger.warning("Triggered protective order not found, using last price for P&L")
+        self._price_cache = None
+        return self._close_result(position, order, current_price)
+
+    def sync_with_exchange(self) -> Optional[Dict[str, Any]]:
+        """
+        Detect a futures position closed on Binance by its protective orders.
+        The exchange can trigger them between checks (or on a wick the bot's last-price check
+        never sees); without this the bot would keep tracking a position that no longer exists.
+        Call once per iteration.
+
+        Returns:
+            Close result (as from _execute_close) if the position was closed, else None
+        """
+        if not (self.current_position and self.open_orders):
+            return None
+        order = self._triggered_protective_order()
+        if order is None:
+            return None
+        logger.warning("Position closed on the exchange by {} order {}", order.get("type"), order.get("id"))
+        return self._close_result(self.current_position, order, self._current_price())
+
+    def _triggered_protective_order(self) -> Optional[Dict[str, Any]]:
+        """
+        Find the protective order that has filled.
+
+        Returns:
+            Latest details of the filled order, or None if none has filled (or fetching failed)
+        """
+        for order in self.open_orders:
+            try:
+                latest = self.client.fetch_order(order["id"], self._symbol)
+            except Exception as e:
+                logger.warning("Could not fetch protective order {}: {}", order["id"], e)
+                continue
+            if latest.get("status") == "closed" and latest.get("filled"):
+                return latest
+        return None
+
+    def _close_result(
+        self,
+        position: Position,
+        order: Optional[Dict[str, Any]],
+        price: float,
+    ) -> Dict[str, Any]:
+        """
+        Settle a closed position: cancel what is left of its protective orders and compute P&L
+        from the closing fill.
+
+        Args:
+            position: Position that was closed
+            order: Closing order (market close or triggered protective order), None if unknown
+            price: Last price, used when the order reports no fill
+
+        Returns:
+            Close result dictionary
+        """
+        self._cancel_protective_orders()
+
+        exit_price = (order or {}).get("average") or price
+        size = (order or {}).get("filled") or position.size
 
         # Calculate P&L
-        if position["action"] == "BUY":
-            pnl = (current_price - position["entry_price"]) * position["size"]
+        if position.action == ACTION_BUY:
+            pnl = (exit_price - position.entry_price) * size
         else:
-            pnl = (position["entry_price"] - current_price) * position["size"]
+            pnl = (position.entry_price - exit_price) * size
 
-        logger.info(f"Position closed. P&L: ${pnl:+,.2f}")
+        logger.info("Position closed. P&L: ${:+,.2f}", pnl)
 
         self.current_position = None
 
         return {
             "status": "success",
-            "action": "CLOSE",
-            "entry_price": position["entry_price"],
-            "exit_price": current_price,
+            "action": ACTION_CLOSE,
+            "entry_price": position.entry_price,
+            "exit_price": exit_price,
             "pnl": pnl,
             "order": order,
         }
@@ -214,11 +550,10 @@ class TradeExecutor:
         position_size: float,
     ) -> Dict[str, Any]:
         """Simulate execution for backtesting."""
-        logger.debug(f"Simulating {decision.action.value}")
+        logger.debug("Simulating {}", decision.action.value)
 
         # Get current price
-        ticker = self.client.fetch_ticker(self.settings.trading_symbol)
-        current_price = float(ticker["last"])
+        current_price = self._current_price()
 
         return {
             "status": "simulated",
@@ -228,56 +563,61 @@ class TradeExecutor:
             "confidence": decision.confidence,
         }
 
-    def check_stop_loss_take_profit(self) -> Optional[str]:
+    def check_stop_loss_take_profit(self, price: Optional[float] = None) -> Optional[str]:
         """
         Check if stop-loss or take-profit is hit.
 
+        Args:
+            price: Current price if the caller already has it (e.g. from
+                BinanceClient.last_prices for several symbols); fetched otherwise
+
         Returns:
             "stop_loss", "take_profit", or None
         """
         if not self.current_position:
             return None
 
-        ticker = self.client.fetch_ticker(self.settings.trading_symbol)
-        current_price = float(ticker["last"])
+        current_price = self._current_price() if price is None else price
 
         position = self.current_position
 
-        if position["action"] == "BUY":
-            if current_price <= position["stop_loss"]:
-                logger.warning(f"Stop-loss hit at ${current_price:,.2f}")
+        if position.action == ACTION_BUY:
+            if current_price <= position.stop_loss:
+                logger.warning("Stop-loss hit at ${:,.2f}", current_price)
                 return "stop_loss"
-            elif current_price >= position["take_profit"]:
-                logger.info(f"Take-profit hit at ${current_price:,.2f}")
+            elif current_price >= position.take_profit:
+                logger.info("Take-profit hit at ${:,.2f}", current_price)
                 return "take_profit"
         else:  # SHORT position
-            if current_price >= position["stop_loss"]:
-                logger.warning(f"Stop-loss hit at ${current_price:,.2f}")
+            if current_price >= position.stop_loss:
+                logger.warning("Stop-loss hit at ${:,.2f}", current_price)
                 return "stop_loss"
-            elif current_price <= position["take_profit"]:
-                logger.info(f"Take-profit hit at ${current_price:,.2f}")
+            elif current_price <= position.take_profit:
+                logger.info("Take-profit hit at ${:,.2f}", current_price)
                 return "take_profit"
 
         return None
 
-    def get_position_pnl(self) -> Optional[float]:
+    def get_position_pnl(self, price: Optional[float] = None) -> Optional[float]:
         """
         Get current unrealized P&L.
 
+        Args:
+            price: Current price if the caller already has it; fetched otherwise
+
         Returns:
             Unrealized P&L or None if no position
         """
         if not self.current_position:
             return None
 
-        ticker = self.client.fetch_ticker(self.settings.trading_symbol)
-        current_price = float(ticker["last"])
+        current_price = self._current_price() if price is None else price
 
         position = self.current_position
-        if position["action"] == "BUY":
-            pnl = (current_price - position["entry_price"]) * position["size"]
+        if position.action == ACTION_BUY:
+            pnl = (current_price - position.entry_price) * position.size
         else:
-            pnl = (position["entry_price"] - current_price) * position["size"]
+            pnl = (position.entry_price - current_price) * position.size
 
         return pnl
 
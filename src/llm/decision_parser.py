@@ -3,19 +3,35 @@ Parse and validate LLM trading decisions.
 Ensures all decisions meet safety and sanity checks before execution.
 """
 
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field, field_validator
+from functools import cached_property
+from typing import Dict, Any, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from loguru import logger
 
-from src.config.constants import TradingAction
+from src.config.constants import TradingAction, JSON_DUMPS, TRADE_ACTIONS
 from src.config.settings import get_settings
 
+# Spellings the LLM uses for each action -> canonical action (upper-cased, stripped input)
+_ACTION_ALIASES: Dict[str, str] = {
+    alias: canonical
+    for canonical, aliases in {
+        "BUY": ("BUY", "LONG", "ENTER_LONG"),
+        "SELL": ("SELL", "SHORT", "ENTER_SHORT"),
+        "HOLD": ("HOLD", "WAIT", "DO_NOTHING"),
+        "CLOSE": ("CLOSE", "EXIT", "CLOSE_POSITION"),
+    }.items()
+    for alias in aliases
+}
+
 
 class TradingDecision(BaseModel):
     """
     Validated trading decision from LLM.
+    Immutable once parsed; adjustments produce a new instance via `with_updates`.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     action: TradingAction = Field(..., description="Trading action to take")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence level (0-1)")
     reasoning: str = Field(..., min_length=10, description="Explanation for the decision")
@@ -45,14 +61,7 @@ class TradingDecision(BaseModel):
         if isinstance(v, str):
             v = v.upper().strip()
             # Map common variations
-            if v in ["BUY", "LONG", "ENTER_LONG"]:
-                return "BUY"
-            elif v in ["SELL", "SHORT", "ENTER_SHORT"]:
-                return "SELL"
-            elif v in ["HOLD", "WAIT", "DO_NOTHING"]:
-                return "HOLD"
-            elif v in ["CLOSE", "EXIT", "CLOSE_POSITION"]:
-                return "CLOSE"
+            return _ACTION_ALIASES.get(v, v)
         return str(v)
 
     @field_validator("take_profit_pct")
@@ -79,33 +88,49 @@ class TradingDecision(BaseModel):
         Returns:
             True if decision should be executed
         """
-        settings = get_settings()
-        threshold = min_confidence or settings.min_confidence
-
         # HOLD and CLOSE can be executed at any confidence
         if self.action in [TradingAction.HOLD, TradingAction.CLOSE]:
             return True
 
+        threshold = min_confidence or get_settings().min_confidence
+
         # BUY and SELL need high confidence
         if self.confidence >= threshold:
             return True
 
         logger.info(
-            f"Decision confidence ({self.confidence:.2f}) below threshold ({threshold:.2f}). "
-            f"Defaulting to HOLD."
+            "Decision confidence ({:.2f}) below threshold ({:.2f}). Defaulting to HOLD.",
+            self.confidence, threshold,
         )
         return False
 
+    def with_updates(self, **update: Any) -> "TradingDecision":
+        """
+        Copy of this decision with some fields replaced (not re-validated).
+
+        Args:
+            **update: Field values to replace
+
+        Returns:
+            New TradingDecision
+        """
+        decision = self.model_copy(update=update)
+        # model_copy carries the instance __dict__, including a computed `as_dict`
+        decision.__dict__.pop("as_dict", None)
+        return decision
+
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """Dictionary form (computed once; treat as read-only)."""
+        return self.model_dump(mode="json")
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "action": self.action.value,
-            "confidence": self.confidence,
-            "reasoning": self.reasoning,
-            "stop_loss_pct": self.stop_loss_pct,
-            "take_profit_pct": self.take_profit_pct,
-            "position_size_multiplier": self.position_size_multiplier,
-        }
+        """Convert to dictionary (a fresh copy of `as_dict`)."""
+        return dict(self.as_dict)
+
+    def to_json(self) -> str:
+        """Serialize to a compact JSON string (orjson)."""
+        return JSON_DUMPS(self.as_dict)
 
 
 class DecisionParser:
@@ -118,12 +143,13 @@ class DecisionParser:
         self.settings = get_settings()
         logger.debug("DecisionParser initialized")
 
-    def parse(self, llm_response: Dict[str, Any]) -> TradingDecision:
+    def parse(self, llm_response: Union[str, bytes, Dict[str, Any]]) -> TradingDecision:
         """
         Parse LLM response into validated TradingDecision.
+        Raw JSON text is decoded and validated in a single pydantic-core pass (no dict round-trip).
 
         Args:
-            llm_response: Raw response dictionary from LLM
+            llm_response: Raw JSON text from LLM, or an already decoded dictionary
 
         Returns:
             Validated TradingDecision
@@ -132,10 +158,13 @@ class DecisionParser:
             ValueError: If response is invalid
         """
         try:
-            decision = TradingDecision(**llm_response)
+            if isinstance(llm_response, (str, bytes)):
+                decision = TradingDecision.model_validate_json(llm_response)
+            else:
+                decision = TradingDecision.model_validate(llm_response)
             logger.info(
-                f"Parsed decision: {decision.action.value} "
-                f"(confidence: {decision.confidence:.2f})"
+                "Parsed decision: {} (confidence: {:.2f})",
+                decision.action.value, decision.confidence,
             )
             return decision
         except Exception as e:
@@ -153,14 +182,22 @@ class DecisionParser:
         Returns:
             Adjusted TradingDecision
         """
+        # HOLD/CLOSE ignore position size and stop-loss: nothing to adjust
+        if decision.action not in TRADE_ACTIONS:
+            return decision
+
+        update: Dict[str, Any] = {}
+        action = decision.action
+
         # Check if confidence is too low
-        if not decision.should_execute():
+        if not decision.should_execute(self.settings.min_confidence):
             logger.warning(
-                f"Confidence {decision.confidence:.2f} too low for {decision.action}. "
-                f"Overriding to HOLD."
+                "Confidence {:.2f} too low for {}. Overriding to HOLD.",
+                decision.confidence, decision.action,
             )
-            decision.action = TradingAction.HOLD
-            decision.reasoning = (
+            action = TradingAction.HOLD
+            update["action"] = action
+            update["reasoning"] = (
                 f"[AUTO-OVERRIDE] {decision.reasoning} "
                 f"(Original action: {decision.action.value}, but confidence too low)"
             )
@@ -168,27 +205,26 @@ class DecisionParser:
         # Adjust position size based on confidence
         if decision.confidence < 0.8:
             original_size = decision.position_size_multiplier
-            decision.position_size_multiplier = min(
-                original_size,
-                decision.confidence
-            )
-            if original_size != decision.position_size_multiplier:
+            new_size = min(original_size, decision.confidence)
+            if original_size != new_size:
+                update["position_size_multiplier"] = new_size
                 logger.info(
-                    f"Reduced position size from {original_size:.2f} to "
-                    f"{decision.position_size_multiplier:.2f} based on confidence"
+                    "Reduced position size from {:.2f} to {:.2f} based on confidence",
+                    original_size, new_size,
                 )
 
         # Tighten stop-loss if confidence is low
-        if decision.confidence < 0.75 and decision.action in [TradingAction.BUY, TradingAction.SELL]:
+        if decision.confidence < 0.75 and action in [TradingAction.BUY, TradingAction.SELL]:
             original_sl = decision.stop_loss_pct
-            decision.stop_loss_pct = max(0.015, original_sl * 0.8)  # 20% tighter
-            if original_sl != decision.stop_loss_pct:
+            new_sl = max(0.015, original_sl * 0.8)  # 20% tighter
+            if original_sl != new_sl:
+                update["stop_loss_pct"] = new_sl
                 logger.info(
-                    f"Tightened stop-loss from {original_sl*100:.1f}% to "
-                    f"{decision.stop_loss_pct*100:.1f}% due to lower confidence"
+                    "Tightened stop-loss from {:.1%} to {:.1%} due to lower confidence",
+                    original_sl, new_sl,
                 )
 
-        return decision
+        return decision.with_updates(**update) if update else decision
 
     def create_hold_decision(self, reason: str = "No clear signal") -> TradingDecision:
         """
@@ -231,8 +267,6 @@ class DecisionParser:
 
 if __name__ == "__main__":
     # Test decision parser
-    import json
-
     parser = DecisionParser()
 
     # Test valid decision
@@ -247,7 +281,7 @@ if __name__ == "__main__":
     }
     decision1 = parser.parse(response1)
     decision1 = parser.apply_safety_checks(decision1)
-    print(json.dumps(decision1.to_dict(), indent=2))
+    print(JSON_DUMPS(decision1.as_dict, indent=True))
     print(f"Should execute: {decision1.should_execute()}")
 
     # Test low confidence
@@ -262,18 +296,18 @@ if __name__ == "__main__":
     }
     decision2 = parser.parse(response2)
     decision2 = parser.apply_safety_checks(decision2)
-    print(json.dumps(decision2.to_dict(), indent=2))
+    print(JSON_DUMPS(decision2.as_dict, indent=True))
     print(f"Should execute: {decision2.should_execute()}")
 
     # Test HOLD decision
     print("\n=== Test 3: HOLD Decision ===")
     decision3 = parser.create_hold_decision("Waiting for clearer signal")
-    print(json.dumps(decision3.to_dict(), indent=2))
+    print(JSON_DUMPS(decision3.as_dict, indent=True))
 
     # Test emergency close
     print("\n=== Test 4: Emergency CLOSE ===")
     decision4 = parser.create_emergency_close_decision("Max daily loss reached")
-    print(json.dumps(decision4.to_dict(), indent=2))
+    print(JSON_DUMPS(decision4.as_dict, indent=True))
 
     # Test invalid decision (will raise error)
     print("\n=== Test 5: Invalid Decision (should fail) ===")
@@ -3,19 +3,187 @@ Google Gemini API client for trading decisions.
 Uses the NEW google-genai library (v1.0+).
 """
 
-import json
-from typing import Dict, Any, Optional
+import asyncio
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from loguru import logger
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 from tenacity import (
+    RetryCallState,
     retry,
     stop_after_attempt,
-    wait_exponential,
+    stop_after_delay,
+    wait_exponential_jitter,
     retry_if_exception_type,
 )
 
 from src.config.settings import get_settings
+from src.config.constants import ACTION_HOLD, JSON_DUMPS, JSON_LOADS
+from src.llm.prompts import SYSTEM_PROMPT
+from src.llm.rate_control import CircuitBreaker, TokenBucket
+from src.llm.response_cache import CacheStats, LLMCache
+from src.llm.tokenization import count_tokens_local, is_cacheable
+
+_CACHE_DIR = Path.home() / ".cache" / "autotrading"
+
+# Streamed decision prefix up to a complete "confidence" number (keys in the prompt's order)
+_DECISION_HEAD = re.compile(
+    r'"action"\s*:\s*"(?P<action>[^"]*)"\s*,\s*"confidence"\s*:\s*(?P<confidence>[-+.eE0-9]+)\s*[,}]'
+)
+# Action spellings that mean HOLD (see _ACTION_ALIASES in decision_parser)
+_HOLD_ACTIONS = frozenset({ACTION_HOLD, "WAIT", "DO_NOTHING"})
+# Client errors worth retrying (timeout, rate limit); other 4xx fail the same way every time
+_RETRYABLE_CLIENT_CODES = frozenset({408, 429})
+# Quota / overload responses: retrying sooner than the limiter window is wasted
+_RATE_LIMIT_CODES = frozenset({429, 503})
+
+
+class GeminiError(Exception):
+    """Base for classified Gemini API failures."""
+
+
+class RetryableGeminiError(GeminiError):
+    """Transient failure (rate limit, server error, network); the call may be retried."""
+
+
+class GeminiRateLimitError(RetryableGeminiError):
+    """Rate limited (429) or overloaded (503); retried with a longer backoff."""
+
+
+class PermanentGeminiError(GeminiError):
+    """Failure that retrying won't fix (bad API key, invalid request)."""
+
+
+class GeminiCircuitOpenError(GeminiError):
+    """Not called: the circuit breaker is open after repeated rate limits."""
+
+
+_TRANSIENT_WAIT = wait_exponential_jitter(initial=0.25, max=4)
+_RATE_LIMIT_WAIT = wait_exponential_jitter(initial=2, max=8)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Back off longer after a rate limit than after a network/server glitch."""
+    if isinstance(retry_state.outcome.exception(), GeminiRateLimitError):
+        return _RATE_LIMIT_WAIT(retry_state)
+    return _TRANSIENT_WAIT(retry_state)
+
+
+def _classify_error(e: Exception) -> GeminiError:
+    """
+    Map an exception from a generate call onto the retry classes.
+
+    Args:
+        e: Exception raised by the SDK (or an empty response)
+
+    Returns:
+        GeminiRateLimitError, PermanentGeminiError or RetryableGeminiError wrapping `e`
+    """
+    if isinstance(e, GeminiError):
+        return e
+    if isinstance(e, errors.APIError):
+        if e.code in _RATE_LIMIT_CODES:
+            return GeminiRateLimitError(str(e))
+        if isinstance(e, errors.ClientError) and e.code not in _RETRYABLE_CLIENT_CODES:
+            return PermanentGeminiError(str(e))
+    # Server errors, network failures and empty responses are usually transient
+    return RetryableGeminiError(str(e))
+
+
+class _DecisionStream:
+    """
+    Collects the chunks of a streamed decision and spots a decision head worth stopping at.
+    """
+
+    __slots__ = ("chunks", "watch_head", "fastpath")
+
+    def __init__(self, early_hold: bool, fastpath: bool = False):
+        """
+        Initialize accumulator.
+
+        Args:
+            early_hold: Stop at the head of a HOLD decision
+            fastpath: Stop at the head of any decision (action and confidence only)
+        """
+        self.chunks: List[str] = []
+        self.watch_head = early_hold or fastpath
+        self.fastpath = fastpath
+
+    def feed(self, chunk: Any) -> Optional[str]:
+        """
+        Add a streamed chunk.
+
+        Args:
+            chunk: GenerateContentResponse chunk
+
+        Returns:
+            Complete decision JSON if the stream can stop here, else None
+        """
+        chunk_text = getattr(chunk, "text", None)
+        if not chunk_text:
+            return None
+        self.chunks.append(chunk_text)
+        if not self.watch_head:
+            return None
+        head = _DECISION_HEAD.search("".join(self.chunks))
+        if head is None:
+            return None
+        # The head is decided: stop looking whatever the action is
+        self.watch_head = False
+        return self._head_decision(head)
+
+    def _head_decision(self, head: re.Match) -> Optional[str]:
+        """
+        Build a complete decision from a streamed decision head.
+
+        Args:
+            head: `_DECISION_HEAD` match on the partial response
+
+        Returns:
+            Decision JSON, or None if the rest of the response is still needed
+        """
+        action = head["action"].upper().strip()
+        is_hold = action in _HOLD_ACTIONS
+        if not (is_hold or self.fastpath):
+            return None
+        try:
+            confidence = float(head["confidence"])
+        except ValueError:
+            return None
+        if is_hold:
+            return JSON_DUMPS({
+                "action": ACTION_HOLD,
+                "confidence": confidence,
+                "reasoning": "[EARLY-HOLD] Response stopped once HOLD was decoded",
+            })
+        # Stops, take profit and size fall back to the TradingDecision defaults
+        return JSON_DUMPS({
+            "action": action,
+            "confidence": confidence,
+            "reasoning": "[FAST-PATH] Response stopped once action and confidence were decoded",
+        })
+
+    def text(self) -> str:
+        """
+        Get the full response.
+
+        Returns:
+            Joined response text
+
+        Raises:
+            ValueError: If the response is empty
+        """
+        response_text = "".join(self.chunks).strip()
+        if not response_text:
+            raise ValueError("Empty response from Gemini")
+        logger.debug(f"Gemini response: {len(response_text)} chars")
+        return response_text
 
 
 class GeminiClient:
@@ -23,9 +191,25 @@ class GeminiClient:
     Wrapper around Google Gemini API for trading analysis.
     """
 
-    def __init__(self):
-        """Initialize Gemini client."""
+    # Context caches are recreated this many seconds before they expire
+    CACHE_REFRESH_MARGIN = 300
+    # Exact token counts kept (LRU, keyed by text digest)
+    TOKEN_CACHE_SIZE = 1024
+    # A successful connection test / model listing is reused from disk for this long (seconds)
+    CONNECTION_CACHE_TTL = 300
+    MODELS_CACHE_TTL = 3600
+    # Consecutive rate-limited attempts that open the circuit breaker
+    BREAKER_FAILURES = 3
+
+    def __init__(self, system_instruction: str = SYSTEM_PROMPT):
+        """
+        Initialize Gemini client.
+
+        Args:
+            system_instruction: System prompt used when a call doesn't pass its own
+        """
         self.settings = get_settings()
+        self.system_instruction = system_instruction
 
         # Create client
         self.client = genai.Client(api_key=self.settings.gemini_api_key)
@@ -37,104 +221,411 @@ class GeminiClient:
             max_output_tokens=self.settings.gemini_max_tokens,
             response_mime_type="application/json",
         )
+        # Decision configs keyed by (temperature, system prompt) -> (context cache name, config)
+        self._config_cache: Dict[
+            Tuple[float, str], Tuple[Optional[str], types.GenerateContentConfig]
+        ] = {}
+        # System prompt -> (context cache name or None if unavailable, monotonic expiry)
+        self._context_caches: Dict[str, Tuple[Optional[str], float]] = {}
+        self._token_counts: "OrderedDict[bytes, int]" = OrderedDict()
+        # Responses of deterministic (temperature 0) requests, see generate_trading_decision;
+        # with the semantic cache, near-duplicate prompts at any temperature share entries
+        self.semantic_cache = self.settings.semantic_cache_enabled
+        self.response_cache = LLMCache(
+            self.settings.gemini_response_cache_ttl,
+            significant_digits=self.settings.semantic_cache_digits if self.semantic_cache else None,
+        )
+        # Client-side quota pacing (shared by sync and async calls) and rate-limit circuit breaker
+        rpm = self.settings.gemini_rpm
+        self.pacer = TokenBucket(rate=rpm / 60, capacity=rpm) if rpm else None
+        self.breaker = CircuitBreaker(self.BREAKER_FAILURES, self.settings.gemini_breaker_cooldown)
 
         logger.info(
             f"GeminiClient initialized with model {self.model_id} "
             f"(temp={self.settings.gemini_temperature})"
         )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type(Exception),
-    )
     def generate_trading_decision(
         self,
-        system_prompt: str,
         user_prompt: str,
+        *,
+        system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
-    ) -> Dict[str, Any]:
+    ) -> str:
         """
         Generate trading decision from Gemini.
+        The response is streamed; with `gemini_early_hold` the stream is closed as soon as a HOLD
+        decision and its confidence are decoded, without waiting for the reasoning
+        (with `gemini_stream_fastpath`, any decision).
+        The JSON text is returned undecoded; `DecisionParser.parse` decodes and validates it in one pass.
+        Deterministic requests (temperature 0) repeating a recent prompt are served from
+        `response_cache` without calling the API; with `semantic_cache_enabled` any request whose
+        prompt matches a recent one after rounding its numbers is.
+        API calls are paced to `gemini_rpm`; after BREAKER_FAILURES consecutive rate limits the
+        client stops calling for `gemini_breaker_cooldown` seconds.
 
         Args:
-            system_prompt: System instructions for the model
             user_prompt: User prompt with market data
+            system_prompt: System instructions (default: the client's system_instruction)
             temperature: Override default temperature
 
         Returns:
-            Parsed JSON response as dictionary
+            Raw JSON response text
 
         Raises:
-            ValueError: If response cannot be parsed as JSON
-            Exception: For API errors
+            RetryableGeminiError: Transient failure (retried within a ~5s budget first;
+                GeminiRateLimitError waits longer between attempts)
+            PermanentGeminiError: Failure that retrying won't fix (raised immediately)
+            GeminiCircuitOpenError: Rate limited recently; not called until the cooldown ends
         """
-        try:
-            # Combine system and user prompts
-            full_prompt = f"{system_prompt}\n\n{user_prompt}"
-
-            # Override temperature if specified
-            config = self.generation_config
-            if temperature is not None:
-                config = types.GenerateContentConfig(
-                    temperature=temperature,
-                    max_output_tokens=self.settings.gemini_max_tokens,
-                    response_mime_type="application/json",
-                )
+        system_prompt, temperature, key = self._resolve_request(user_prompt, system_prompt, temperature)
+        if key is not None:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                logger.debug("Gemini response served from cache")
+                return cached
+        response_text = self._request_decision(system_prompt, user_prompt, temperature)
+        if key is not None:
+            self.response_cache.put(key, response_text)
+        return response_text
+
+    async def generate_trading_decision_async(
+        self,
+        user_prompt: str,
+        *,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+    ) -> str:
+        """
+        Async variant of generate_trading_decision (google-genai `client.aio`), so several
+        decisions can be requested concurrently from one event loop.
 
-            # Generate content
-            response = self.client.models.generate_content(
+        Args:
+            user_prompt: User prompt with market data
+            system_prompt: System instructions (default: the client's system_instruction)
+            temperature: Override default temperature
+
+        Returns:
+            Raw JSON response text
+
+        Raises:
+            RetryableGeminiError: Transient failure after retries
+            PermanentGeminiError: Failure that retrying won't fix
+            GeminiCircuitOpenError: Rate limited recently; not called until the cooldown ends
+        """
+        system_prompt, temperature, key = self._resolve_request(user_prompt, system_prompt, temperature)
+        if key is not None:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                logger.debug("Gemini response served from cache")
+                return cached
+        response_text = await self._request_decision_async(system_prompt, user_prompt, temperature)
+        if key is not None:
+            self.response_cache.put(key, response_text)
+        return response_text
+
+    def _resolve_request(
+        self,
+        user_prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+    ) -> Tuple[str, float, Optional[str]]:
+        """
+        Apply defaults to a decision request and build its response cache key.
+
+        Args:
+            user_prompt: User prompt with market data
+            system_prompt: System instructions (None = client default)
+            temperature: Temperature (None = setting)
+
+        Returns:
+            (system_prompt, temperature, cache key or None if the response isn't cacheable)
+        """
+        if system_prompt is None:
+            system_prompt = self.system_instruction
+        if temperature is None:
+            temperature = self.settings.gemini_temperature
+        # Sampled responses differ per call, so only temperature 0 is cacheable (unless opted in)
+        if not self.response_cache.enabled or (temperature > 0 and not self.semantic_cache):
+            return system_prompt, temperature, None
+        key = self.response_cache.make_key(self.model_id, system_prompt, user_prompt, temperature)
+        return system_prompt, temperature, key
+
+    def cache_stats(self) -> CacheStats:
+        """
+        Get response cache statistics.
+
+        Returns:
+            CacheStats (hits, misses, size, hit_rate)
+        """
+        return self.response_cache.stats
+
+    @retry(
+        stop=stop_after_delay(5) | stop_after_attempt(3),
+        wait=_retry_wait,
+        retry=retry_if_exception_type(RetryableGeminiError),
+        reraise=True,
+    )
+    def _request_decision(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+    ) -> str:
+        """
+        Request a decision from the API (see generate_trading_decision).
+
+        Args:
+            system_prompt: System instructions for the model
+            user_prompt: User prompt with market data
+            temperature: Sampling temperature
+
+        Returns:
+            Raw JSON response text
+        """
+        time.sleep(self._acquire_slot())
+        try:
+            # System prompt goes in as system_instruction; only the market data is sent as contents
+            stream = self.client.models.generate_content_stream(
                 model=self.model_id,
-                contents=full_prompt,
-                config=config,
+                contents=user_prompt,
+                config=self._decision_config(system_prompt, temperature),
             )
+            collected = _DecisionStream(self.settings.gemini_early_hold, self.settings.gemini_stream_fastpath)
+            response_text = None
+            try:
+                for chunk in stream:
+                    response_text = collected.feed(chunk)
+                    if response_text is not None:
+                        logger.debug("Gemini stream stopped at the decision head")
+                        break
+            finally:
+                stream.close()
+            if response_text is None:
+                response_text = collected.text()
+        except Exception as e:
+            logger.error(f"Gemini API error: {e}")
+            raise self._request_failed(e) from e
+        self.breaker.record_success()
+        return response_text
 
-            # Extract text from response
-            response_text = self._extract_text(response)
-            if not response_text:
-                raise ValueError("Empty response from Gemini")
+    @retry(
+        stop=stop_after_delay(5) | stop_after_attempt(3),
+        wait=_retry_wait,
+        retry=retry_if_exception_type(RetryableGeminiError),
+        reraise=True,
+    )
+    async def _request_decision_async(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+    ) -> str:
+        """
+        Request a decision from the async API (see _request_decision).
 
-            # Parse JSON
-            try:
-                decision = json.loads(response_text)
-                logger.debug(f"Gemini decision: {decision.get('action', 'UNKNOWN')}")
-                return decision
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON response: {response_text}")
-                raise ValueError(f"Invalid JSON response from Gemini: {e}")
+        Args:
+            system_prompt: System instructions for the model
+            user_prompt: User prompt with market data
+            temperature: Sampling temperature
 
+        Returns:
+            Raw JSON response text
+        """
+        await asyncio.sleep(self._acquire_slot())
+        try:
+            stream = await self.client.aio.models.generate_content_stream(
+                model=self.model_id,
+                contents=user_prompt,
+                config=self._decision_config(system_prompt, temperature),
+            )
+            collected = _DecisionStream(self.settings.gemini_early_hold, self.settings.gemini_stream_fastpath)
+            response_text = None
+            try:
+                async for chunk in stream:
+                    response_text = collected.feed(chunk)
+                    if response_text is not None:
+                        logger.debug("Gemini stream stopped at the decision head")
+                        break
+            finally:
+                await stream.aclose()
+            if response_text is None:
+                response_text = collected.text()
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
-            raise
+            raise self._request_failed(e) from e
+        self.breaker.record_success()
+        return response_text
+
+    def _acquire_slot(self) -> float:
+        """
+        Check the circuit breaker and take a pacing token for one API call.
+
+        Returns:
+            Seconds to wait before sending the request
+
+        Raises:
+            GeminiCircuitOpenError: If the breaker is open
+        """
+        if not self.breaker.allow():
+            raise GeminiCircuitOpenError(
+                f"Gemini circuit open after rate limits (retry in {self.breaker.remaining():.0f}s)"
+            )
+        if self.pacer is None:
+            return 0.0
+        wait = self.pacer.reserve()
+        if wait > 0:
+            logger.debug("Pacing Gemini request: waiting {:.2f}s", wait)
+        return wait
+
+    def _request_failed(self, e: Exception) -> GeminiError:
+        """
+        Classify a failed call and feed rate limits to the circuit breaker.
+
+        Args:
+            e: Exception raised by the call
+
+        Returns:
+            Classified GeminiError to raise
+        """
+        error = _classify_error(e)
+        if isinstance(error, GeminiRateLimitError) and self.breaker.record_failure():
+            logger.warning(
+                "Gemini circuit opened after {} consecutive rate limits (cooldown {}s)",
+                self.BREAKER_FAILURES,
+                self.breaker.cooldown,
+            )
+        return error
+
+    def _decision_config(
+        self,
+        system_prompt: str,
+        temperature: Optional[float] = None,
+    ) -> types.GenerateContentConfig:
+        """
+        Get the generation config for a decision call (cached per temperature and system prompt).
+
+        Args:
+            system_prompt: System instructions for the model
+            temperature: Override default temperature
+
+        Returns:
+            GenerateContentConfig referencing the context cache, or with system_instruction inline
+        """
+        if temperature is None:
+            temperature = self.settings.gemini_temperature
+        cache_name = self._context_cache(system_prompt)
+        key = (temperature, system_prompt)
+        entry = self._config_cache.get(key)
+        if entry is not None and entry[0] == cache_name:
+            return entry[1]
+
+        update: Dict[str, Any] = {"temperature": temperature}
+        if cache_name:
+            update["cached_content"] = cache_name
+        else:
+            update["system_instruction"] = system_prompt
+        config = self.generation_config.model_copy(update=update)
+        self._config_cache[key] = (cache_name, config)
+        return config
 
-    def count_tokens(self, text: str) -> int:
+    def _context_cache(self, system_prompt: str) -> Optional[str]:
+        """
+        Get the name of the context cache holding `system_prompt`, creating it on first use
+        and recreating it shortly before the TTL runs out.
+
+        Args:
+            system_prompt: System instructions for the model
+
+        Returns:
+            Cached content name, or None if caching is disabled or unavailable
+        """
+        ttl = self.settings.gemini_cache_ttl
+        if ttl <= 0:
+            return None
+
+        now = time.monotonic()
+        entry = self._context_caches.get(system_prompt)
+        if entry is not None and now < entry[1]:
+            return entry[0]
+
+        # Below the minimum cache size the create call is rejected anyway
+        if not is_cacheable(system_prompt):
+            logger.debug("System prompt too small for a context cache, sending it inline")
+            self._context_caches[system_prompt] = (None, float("inf"))
+            return None
+
+        try:
+            cache = self.client.caches.create(
+                model=self.model_id,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system_prompt,
+                    ttl=f"{ttl}s",
+                ),
+            )
+        except Exception as e:
+            # e.g. prompt below the model's minimum cache size; retry once the TTL has passed
+            logger.warning(f"Context cache unavailable, sending system prompt inline: {e}")
+            self._context_caches[system_prompt] = (None, now + ttl)
+            return None
+
+        logger.info(f"Context cache created: {cache.name} (ttl={ttl}s)")
+        refresh_at = now + max(ttl - self.CACHE_REFRESH_MARGIN, ttl / 2)
+        self._context_caches[system_prompt] = (cache.name, refresh_at)
+        return cache.name
+
+    def count_tokens(self, text: str, exact: bool = False) -> int:
         """
         Count tokens in text.
+        By default this is a local estimate (see src.llm.tokenization, no API call);
+        exact counts come from the API and are cached per text.
 
         Args:
             text: Text to count tokens for
+            exact: Ask the API for the exact count
 
         Returns:
             Number of tokens
         """
+        if not exact:
+            return count_tokens_local(text)
+
+        key = hashlib.sha1(text.encode("utf-8")).digest()
+        cached = self._token_counts.get(key)
+        if cached is not None:
+            self._token_counts.move_to_end(key)
+            return cached
+
         try:
             response = self.client.models.count_tokens(
                 model=self.model_id,
                 contents=text,
             )
-            return response.total_tokens
         except Exception as e:
             logger.warning(f"Failed to count tokens: {e}")
-            # Rough estimate: ~4 chars per token
-            return len(text) // 4
+            return count_tokens_local(text)
+
+        count = response.total_tokens
+        self._token_counts[key] = count
+        if len(self._token_counts) > self.TOKEN_CACHE_SIZE:
+            self._token_counts.popitem(last=False)
+        return count
 
     def test_connection(self) -> bool:
         """
         Test connection to Gemini API.
 
+        A success within the last CONNECTION_CACHE_TTL seconds (same model and API key)
+        is read from disk instead of calling the API again.
+
         Returns:
             True if connection works
         """
+        cached = self._read_cache("gemini_ok", self.CONNECTION_CACHE_TTL)
+        if cached is not None and cached.get("ok"):
+            logger.info("Gemini API connection OK (cached)")
+            return True
+
         try:
             response = self.client.models.generate_content(
                 model=self.model_id,
@@ -151,6 +642,7 @@ class GeminiClient:
             result = "ok" in response_text.lower()
             if result:
                 logger.info("Gemini API connection OK")
+                self._write_cache("gemini_ok", {"ok": True})
             else:
                 logger.warning(f"Unexpected test response: {response_text}")
             return result
@@ -160,20 +652,76 @@ class GeminiClient:
 
     def list_available_models(self) -> list:
         """
-        List all available Gemini models.
+        List all available Gemini models (cached on disk for MODELS_CACHE_TTL seconds).
 
         Returns:
             List of model names
         """
+        cached = self._read_cache("gemini_models", self.MODELS_CACHE_TTL)
+        if cached is not None:
+            return cached["models"]
+
         try:
             models = self.client.models.list()
             model_names = [model.name for model in models]
             logger.info(f"Found {len(model_names)} available models")
+            self._write_cache("gemini_models", {"models": model_names})
             return model_names
         except Exception as e:
             logger.error(f"Failed to list models: {e}")
             return []
 
+    def _cache_file(self, name: str) -> Path:
+        """Disk cache file for `name`, separate per model."""
+        return _CACHE_DIR / f"{name}_{self.model_id.replace('/', '_')}.json"
+
+    def _api_key_digest(self) -> str:
+        """Short digest of the API key, so a cache written with another key is ignored."""
+        return hashlib.sha1(self.settings.gemini_api_key.encode("utf-8")).hexdigest()[:16]
+
+    def _read_cache(self, name: str, ttl: float) -> Optional[Dict[str, Any]]:
+        """
+        Read a disk cache entry written by `_write_cache`.
+
+        Args:
+            name: Cache name
+            ttl: Maximum age in seconds
+
+        Returns:
+            Cached payload, or None if missing, stale or written for another API key
+        """
+        cache_file = self._cache_file(name)
+        try:
+            if time.time() - cache_file.stat().st_mtime >= ttl:
+                return None
+            cached = JSON_LOADS(cache_file.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring Gemini cache {cache_file}: {e}")
+            return None
+        if cached.get("key") != self._api_key_digest():
+            return None
+        return cached
+
+    def _write_cache(self, name: str, payload: Dict[str, Any]) -> None:
+        """
+        Write a disk cache entry (best effort).
+
+        Args:
+            name: Cache name
+            payload: JSON-serializable values
+        """
+        cache_file = self._cache_file(name)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(
+                JSON_DUMPS({**payload, "key": self._api_key_digest()}),
+                encoding="utf-8",
+            )
+        except Exception as e:
+            logger.debug(f"Could not write Gemini cache {cache_file}: {e}")
+
     @staticmethod
     def _summarize_response(response: Any) -> str:
         """Summarize a response for debugging without dumping full content."""
@@ -215,6 +763,19 @@ class GeminiClient:
         return "".join(collected).strip()
 
 
+@lru_cache(maxsize=1)
+def get_gemini_client() -> GeminiClient:
+    """
+    Get the shared GeminiClient (created on first use).
+    One client keeps one HTTP connection pool, response cache, pacer and circuit breaker
+    for the whole process, instead of one per strategy.
+
+    Returns:
+        Process-wide GeminiClient with the default system instruction
+    """
+    return GeminiClient()
+
+
 if __name__ == "__main__":
     # Test Gemini client
     import sys
@@ -252,8 +813,8 @@ Analyze the market data and respond with JSON containing:
 
 Should we trade?"""
 
-        decision = client.generate_trading_decision(system_prompt, user_prompt)
-        print(f"\nDecision: {json.dumps(decision, indent=2)}")
+        decision = client.generate_trading_decision(user_prompt, system_prompt=system_prompt)
+        print(f"\nDecision: {decision}")
 
         # List available models
         print("\n=== Available Models ===")
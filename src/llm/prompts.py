@@ -3,7 +3,9 @@ Prompt templates for LLM trading decisions.
 These prompts guide the AI to make informed trading decisions.
 """
 
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
 
@@ -50,108 +52,258 @@ IMPORTANT:
 """
 
 
-def format_market_data_prompt(
+# Static sections of the market prompt (built once, appended as-is)
+_NO_POSITION_SECTION = """
+CURRENT POSITION:
+- Status: NO OPEN POSITION
+- Looking for entry opportunity
+
+ENTRY CONSIDERATIONS:
+- Is the risk/reward favorable?
+- Are multiple indicators aligned?
+- Is this a high-probability setup?
+"""
+
+_POSITION_CONSIDERATIONS = """
+POSITION MANAGEMENT CONSIDERATIONS:
+- Should we take profit now?
+- Should we move stop-loss to break-even?
+- Is the trend still in our favor?
+"""
+
+_TASK_SECTION = """
+=== YOUR TASK ===
+Analyze all the data above and make a trading decision.
+
+Consider:
+1. Is the trend clear and strong?
+2. Are multiple indicators confirming the same direction?
+3. Is the risk/reward ratio favorable?
+4. Is volatility at a manageable level?
+5. If we have a position, should we hold, take profit, or cut losses?
+
+Respond with ONLY valid JSON (no markdown, no explanation outside JSON):
+{
+  "action": "BUY|SELL|HOLD|CLOSE",
+  "confidence": 0.85,
+  "reasoning": "Your analysis here",
+  "stop_loss_pct": 0.02,
+  "take_profit_pct": 0.05,
+  "position_size_multiplier": 0.8
+}
+"""
+
+# Bound number formatters shared by the prompt sections
+_MONEY = "${:,.2f}".format
+_PCT = "{:+.2f}%".format
+_PCT_RAW = "{:.2f}%".format
+_FLOAT1 = "{:.1f}".format
+
+# Market data / indicator keys read by the prompt, in section-builder argument order
+_MARKET_DEFAULTS = {"price_change_pct": 0, "volume_24h": 0}
+_market_get = itemgetter("price_change_pct", "high_24h", "low_24h", "volume_24h")
+
+_IND_DEFAULTS = {
+    "trend": "unknown",
+    "rsi": 50,
+    "rsi_signal": "neutral",
+    "macd": 0,
+    "macd_signal": 0,
+    "macd_signal_direction": "neutral",
+    "distance_to_support_pct": 0,
+    "distance_to_resistance_pct": 0,
+}
+_ind_get = itemgetter(
+    "trend", "rsi", "rsi_signal", "macd", "macd_signal", "macd_signal_direction",
+    "sma_20", "sma_50", "ema_12", "bb_upper", "bb_lower", "atr",
+)
+_sr_get = itemgetter("support", "resistance", "distance_to_support_pct", "distance_to_resistance_pct")
+
+# Appended when the previous response could not be parsed as a decision
+JSON_RETRY_SUFFIX = """
+NOTE: Your previous response was not valid decision JSON.
+Respond again with ONLY the JSON object described above.
+"""
+
+
+@lru_cache(maxsize=128)
+def _build_market_section(
     symbol: str,
     current_price: float,
-    market_data: Dict[str, Any],
-    indicators: Dict[str, Any],
-    current_position: Optional[Dict[str, Any]] = None,
-    recent_trades: Optional[list] = None,
+    price_change_pct: float,
+    high_24h: float,
+    low_24h: float,
+    volume_24h: float,
 ) -> str:
-    """
-    Format market data into a prompt for the LLM.
+    """CURRENT MARKET section (cached per input tuple)."""
+    return f"""
+CURRENT MARKET:
+- Symbol: {symbol}
+- Price: {_MONEY(current_price)}
+- 24h Change: {_PCT(price_change_pct)}
+- 24h High: {_MONEY(high_24h)}
+- 24h Low: {_MONEY(low_24h)}
+- 24h Volume: {_MONEY(volume_24h)}
+"""
 
-    Args:
-        symbol: Trading symbol (e.g., 'BTC/USDT')
-        current_price: Current market price
-        market_data: Dictionary with OHLCV data
-        indicators: Dictionary with technical indicators
-        current_position: Current position info (optional)
-        recent_trades: Recent trade history (optional)
 
-    Returns:
-        Formatted prompt string
-    """
+@lru_cache(maxsize=128)
+def _build_indicator_section(
+    current_price: float,
+    trend: str,
+    rsi: float,
+    rsi_signal: str,
+    macd: float,
+    macd_signal: float,
+    macd_signal_direction: str,
+    sma_20: float,
+    sma_50: float,
+    ema_12: float,
+    bb_upper: float,
+    bb_lower: float,
+    atr: float,
+) -> str:
+    """TECHNICAL INDICATORS section with interpretations (cached per input tuple)."""
+    volatility_pct = (atr / current_price) * 100
 
-    # Extract key data
-    price_change_pct = market_data.get("price_change_pct", 0)
-    volume_24h = market_data.get("volume_24h", 0)
-    high_24h = market_data.get("high_24h", current_price)
-    low_24h = market_data.get("low_24h", current_price)
-
-    # Technical indicators
-    rsi = indicators.get("rsi", 50)
-    rsi_signal = indicators.get("rsi_signal", "neutral")
-    macd = indicators.get("macd", 0)
-    macd_signal = indicators.get("macd_signal", 0)
-    macd_signal_direction = indicators.get("macd_signal_direction", "neutral")
-    trend = indicators.get("trend", "unknown")
-
-    sma_20 = indicators.get("sma_20", current_price)
-    sma_50 = indicators.get("sma_50", current_price)
-    ema_12 = indicators.get("ema_12", current_price)
-
-    bb_upper = indicators.get("bb_upper", current_price * 1.02)
-    bb_lower = indicators.get("bb_lower", current_price * 0.98)
-    bb_position = "middle"
-    if current_price > bb_upper * 0.99:
-        bb_position = "upper band"
-    elif current_price < bb_lower * 1.01:
-        bb_position = "lower band"
+    # Interpretations
+    if rsi > 70:
+        rsi_interp = "Overbought - potential sell signal"
+    elif rsi < 30:
+        rsi_interp = "Oversold - potential buy signal"
+    else:
+        rsi_interp = "Neutral zone"
 
-    atr = indicators.get("atr", current_price * 0.02)
-    volatility_pct = (atr / current_price) * 100
+    macd_interp = "Bullish momentum" if macd > macd_signal else "Bearish momentum"
 
-    # Support/Resistance
-    support = indicators.get("support", low_24h)
-    resistance = indicators.get("resistance", high_24h)
-    distance_to_support_pct = indicators.get("distance_to_support_pct", 0)
-    distance_to_resistance_pct = indicators.get("distance_to_resistance_pct", 0)
+    above_sma_20 = "ABOVE" if current_price > sma_20 else "BELOW"
+    above_sma_50 = "ABOVE" if current_price > sma_50 else "BELOW"
+    if current_price > sma_20 > sma_50:
+        ma_interp = "Strong uptrend"
+    elif current_price < sma_20 < sma_50:
+        ma_interp = "Strong downtrend"
+    else:
+        ma_interp = "Sideways/uncertain"
 
-    # Build prompt
-    prompt = f"""=== MARKET ANALYSIS REQUEST ===
-Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+    if current_price > bb_upper * 0.99:
+        bb_position, bb_interp = "upper band", "Overbought zone"
+    elif current_price < bb_lower * 1.01:
+        bb_position, bb_interp = "lower band", "Oversold zone"
+    else:
+        bb_position, bb_interp = "middle", "Normal range"
 
-CURRENT MARKET:
-- Symbol: {symbol}
-- Price: ${current_price:,.2f}
-- 24h Change: {price_change_pct:+.2f}%
-- 24h High: ${high_24h:,.2f}
-- 24h Low: ${low_24h:,.2f}
-- 24h Volume: ${volume_24h:,.2f}
+    vol_interp = (
+        "High volatility - use wider stops" if volatility_pct > 3
+        else "Low volatility - tighter stops acceptable"
+    )
 
+    return f"""
 TECHNICAL INDICATORS:
 - Trend: {trend.upper()}
-- RSI(14): {rsi:.1f} ({rsi_signal})
-  → Interpretation: {"Overbought - potential sell signal" if rsi > 70 else "Oversold - potential buy signal" if rsi < 30 else "Neutral zone"}
+- RSI(14): {_FLOAT1(rsi)} ({rsi_signal})
+  → Interpretation: {rsi_interp}
 
 - MACD: {macd:.2f}
 - MACD Signal: {macd_signal:.2f}
 - MACD Status: {macd_signal_direction.upper()}
-  → Interpretation: {"Bullish momentum" if macd > macd_signal else "Bearish momentum"}
+  → Interpretation: {macd_interp}
 
 - Moving Averages:
-  * SMA(20): ${sma_20:,.2f} - Price is {"ABOVE" if current_price > sma_20 else "BELOW"}
-  * SMA(50): ${sma_50:,.2f} - Price is {"ABOVE" if current_price > sma_50 else "BELOW"}
-  * EMA(12): ${ema_12:,.2f}
-  → Interpretation: {"Strong uptrend" if current_price > sma_20 > sma_50 else "Strong downtrend" if current_price < sma_20 < sma_50 else "Sideways/uncertain"}
+  * SMA(20): {_MONEY(sma_20)} - Price is {above_sma_20}
+  * SMA(50): {_MONEY(sma_50)} - Price is {above_sma_50}
+  * EMA(12): {_MONEY(ema_12)}
+  → Interpretation: {ma_interp}
 
 - Bollinger Bands:
-  * Upper: ${bb_upper:,.2f}
-  * Lower: ${bb_lower:,.2f}
+  * Upper: {_MONEY(bb_upper)}
+  * Lower: {_MONEY(bb_lower)}
   * Position: Price near {bb_position}
-  → Interpretation: {"Overbought zone" if bb_position == "upper band" else "Oversold zone" if bb_position == "lower band" else "Normal range"}
+  → Interpretation: {bb_interp}
 
 - Volatility:
-  * ATR: ${atr:,.2f}
-  * Volatility: {volatility_pct:.2f}%
-  → Interpretation: {"High volatility - use wider stops" if volatility_pct > 3 else "Low volatility - tighter stops acceptable"}
+  * ATR: {_MONEY(atr)}
+  * Volatility: {_PCT_RAW(volatility_pct)}
+  → Interpretation: {vol_interp}
+"""
+
 
+@lru_cache(maxsize=128)
+def _build_sr_section(
+    support: float,
+    resistance: float,
+    distance_to_support_pct: float,
+    distance_to_resistance_pct: float,
+) -> str:
+    """SUPPORT & RESISTANCE section (cached per input tuple; unchanged within a candle)."""
+    return f"""
 SUPPORT & RESISTANCE:
-- Support: ${support:,.2f} ({distance_to_support_pct:.1f}% below)
-- Resistance: ${resistance:,.2f} ({distance_to_resistance_pct:.1f}% above)
+- Support: {_MONEY(support)} ({_FLOAT1(distance_to_support_pct)}% below)
+- Resistance: {_MONEY(resistance)} ({_FLOAT1(distance_to_resistance_pct)}% above)
 """
 
+
+def format_market_data_prompt(
+    symbol: str,
+    current_price: float,
+    market_data: Dict[str, Any],
+    indicators: Dict[str, Any],
+    current_position: Optional[Dict[str, Any]] = None,
+    recent_trades: Optional[list] = None,
+    trade_stats: Optional[Tuple[int, int]] = None,
+    as_of: Optional[datetime] = None,
+) -> str:
+    """
+    Format market data into a prompt for the LLM.
+    The market, indicator and support/resistance sections are memoized on their inputs,
+    so re-prompts within a candle reuse the strings already built; sections are joined once.
+
+    Args:
+        symbol: Trading symbol (e.g., 'BTC/USDT')
+        current_price: Current market price
+        market_data: Dictionary with OHLCV data
+        indicators: Dictionary with technical indicators
+        current_position: Current position info (optional)
+        recent_trades: Recent trade history (optional)
+        trade_stats: (wins, total) kept by the caller for the win rate
+            (default: counted from recent_trades)
+        as_of: Time stamped on the prompt (default: now); pass one value for a batch of symbols
+
+    Returns:
+        Formatted prompt string
+    """
+
+    # Extract key data (defaults first, so missing keys fall back in one merge)
+    price_change_pct, high_24h, low_24h, volume_24h = _market_get({
+        **_MARKET_DEFAULTS,
+        "high_24h": current_price,
+        "low_24h": current_price,
+        **market_data,
+    })
+
+    # Technical indicators and support/resistance; price-relative defaults are per call
+    merged = {
+        **_IND_DEFAULTS,
+        "sma_20": current_price,
+        "sma_50": current_price,
+        "ema_12": current_price,
+        "bb_upper": current_price * 1.02,
+        "bb_lower": current_price * 0.98,
+        "atr": current_price * 0.02,
+        "support": low_24h,
+        "resistance": high_24h,
+        **indicators,
+    }
+
+    # Build prompt
+    parts = [
+        f"""=== MARKET ANALYSIS REQUEST ===
+Timestamp: {(as_of or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')}
+""",
+        _build_market_section(symbol, current_price, price_change_pct, high_24h, low_24h, volume_24h),
+        _build_indicator_section(current_price, *_ind_get(merged)),
+        _build_sr_section(*_sr_get(merged)),
+    ]
+
     # Add current position info
     if current_position:
         entry_price = current_position.get("entry_price", current_price)
@@ -159,70 +311,40 @@ SUPPORT & RESISTANCE:
         unrealized_pnl = current_position.get("unrealized_pnl", 0)
         unrealized_pnl_pct = ((current_price - entry_price) / entry_price) * 100
 
-        prompt += f"""
+        parts.append(f"""
 CURRENT POSITION:
 - Status: OPEN
-- Entry Price: ${entry_price:,.2f}
+- Entry Price: {_MONEY(entry_price)}
 - Size: {position_size:.8f} {symbol.split('/')[0]}
-- Current P&L: ${unrealized_pnl:+,.2f} ({unrealized_pnl_pct:+.2f}%)
+- Current P&L: ${unrealized_pnl:+,.2f} ({_PCT(unrealized_pnl_pct)})
 - Holding Time: {current_position.get('holding_time', 'N/A')}
-
-POSITION MANAGEMENT CONSIDERATIONS:
-- Should we take profit now?
-- Should we move stop-loss to break-even?
-- Is the trend still in our favor?
-"""
+""")
+        parts.append(_POSITION_CONSIDERATIONS)
     else:
-        prompt += """
-CURRENT POSITION:
-- Status: NO OPEN POSITION
-- Looking for entry opportunity
-
-ENTRY CONSIDERATIONS:
-- Is the risk/reward favorable?
-- Are multiple indicators aligned?
-- Is this a high-probability setup?
-"""
+        parts.append(_NO_POSITION_SECTION)
 
     # Add recent trade history
     if recent_trades:
-        prompt += "\nRECENT TRADING HISTORY:\n"
+        parts.append("\nRECENT TRADING HISTORY:\n")
         for i, trade in enumerate(recent_trades[-3:], 1):  # Last 3 trades
             action = trade.get("action", "UNKNOWN")
             pnl = trade.get("pnl", 0)
             pnl_pct = trade.get("pnl_pct", 0)
-            prompt += f"{i}. {action} - P&L: ${pnl:+.2f} ({pnl_pct:+.2f}%)\n"
+            parts.append(f"{i}. {action} - P&L: ${pnl:+.2f} ({_PCT(pnl_pct)})\n")
 
         # Calculate win rate
-        wins = sum(1 for t in recent_trades if t.get("pnl", 0) > 0)
-        total = len(recent_trades)
+        if trade_stats is not None:
+            wins, total = trade_stats
+        else:
+            wins = sum(1 for t in recent_trades if t.get("pnl", 0) > 0)
+            total = len(recent_trades)
         win_rate = (wins / total * 100) if total > 0 else 0
-        prompt += f"\nWin Rate: {win_rate:.1f}% ({wins}/{total})\n"
+        parts.append(f"\nWin Rate: {_FLOAT1(win_rate)}% ({wins}/{total})\n")
 
     # Final instructions
-    prompt += """
-=== YOUR TASK ===
-Analyze all the data above and make a trading decision.
-
-Consider:
-1. Is the trend clear and strong?
-2. Are multiple indicators confirming the same direction?
-3. Is the risk/reward ratio favorable?
-4. Is volatility at a manageable level?
-5. If we have a position, should we hold, take profit, or cut losses?
-
-Respond with ONLY valid JSON (no markdown, no explanation outside JSON):
-{
-  "action": "BUY|SELL|HOLD|CLOSE",
-  "confidence": 0.85,
-  "reasoning": "Your analysis here",
-  "stop_loss_pct": 0.02,
-  "take_profit_pct": 0.05,
-  "position_size_multiplier": 0.8
-}
-"""
+    parts.append(_TASK_SECTION)
 
-    return prompt
+    return "".join(parts)
 
 
 def format_quick_decision_prompt(
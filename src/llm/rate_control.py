@@ -0,0 +1,106 @@
+"""
+Client-side rate control for the Gemini API.
+A token bucket paces requests to the quota (requests per minute), and a circuit breaker stops
+calling for a cooldown after repeated rate-limit errors instead of retrying into an exhausted quota.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at a constant rate; each request takes one token.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size); the bucket starts full
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token, borrowing against future refills if the bucket is empty.
+
+        Returns:
+            Seconds to wait before the request may be sent (0.0 if a token was available)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls for `cooldown` seconds.
+    After the cooldown calls are let through again (half-open): a success closes the breaker,
+    another failure opens it for a new cooldown.
+    """
+
+    def __init__(self, failure_threshold: int, cooldown: float):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            cooldown: Seconds the breaker stays open
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """'closed', 'open' or 'half-open'."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at < self.cooldown:
+                return "open"
+            return "half-open"
+
+    def allow(self) -> bool:
+        """Whether a call may be made now."""
+        return self.state != "open"
+
+    def remaining(self) -> float:
+        """Seconds until an open breaker lets calls through (0.0 if it does already)."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+
+    def record_success(self) -> None:
+        """Close the breaker and reset the failure count."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> bool:
+        """
+        Count a failure.
+
+        Returns:
+            True if this failure opened the breaker
+        """
+        with self._lock:
+            self._failures += 1
+            if self._failures < self.failure_threshold:
+                return False
+            self._opened_at = time.monotonic()
+            return True
@@ -0,0 +1,151 @@
+"""
+In-process cache of LLM responses keyed by prompt hash.
+Deterministic requests (temperature 0) for an unchanged prompt are answered from memory.
+Optionally numbers are rounded before hashing, so near-duplicate market states share an entry.
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+
+from src.config.constants import JSON_DUMPS
+
+# Date/time stamps change every call without changing the market state
+_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?")
+# Numbers as the prompts print them ("$50,123.45", "-1.2%", "0.0042")
+_NUMBER = re.compile(r"-?\d[\d,]*(?:\.\d+)?")
+
+
+def normalize_prompt(text: str, significant_digits: int) -> str:
+    """
+    Round every number in `text` to a few significant digits and drop timestamps.
+
+    Args:
+        text: Prompt text
+        significant_digits: Digits kept per number
+
+    Returns:
+        Normalized text (only used for hashing)
+    """
+    text = _TIMESTAMP.sub("<ts>", text)
+    return _NUMBER.sub(
+        lambda m: f"{float(m.group().replace(',', '')):.{significant_digits}g}",
+        text,
+    )
+
+
+class CacheStats(NamedTuple):
+    """Response cache counters."""
+
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LLMCache:
+    """
+    LRU cache with TTL mapping a request key to the raw response text.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int = 256,
+        significant_digits: Optional[int] = None,
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            ttl: Seconds an entry stays valid (0 disables the cache)
+            maxsize: Maximum number of entries (least recently used evicted first)
+            significant_digits: Round numbers in the user prompt to this many digits
+                before hashing (near-duplicate matching); None = exact prompts only
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.significant_digits = significant_digits
+        # key -> (response, time.monotonic() of the store)
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are kept at all."""
+        return self.ttl > 0
+
+    def make_key(self, model: str, system_prompt: str, user_prompt: str, temperature: float) -> str:
+        """
+        Build the cache key of a request.
+
+        Args:
+            model: Model id
+            system_prompt: System instructions
+            user_prompt: User prompt
+            temperature: Sampling temperature
+
+        Returns:
+            SHA-256 hex digest
+        """
+        if self.significant_digits is not None:
+            user_prompt = normalize_prompt(user_prompt, self.significant_digits)
+        payload = JSON_DUMPS([model, system_prompt, user_prompt, temperature])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a response.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached response, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[1] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, response: str) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from make_key
+            response: Raw response text
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (response, time.monotonic())
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss counters and current size (use `._asdict()` for a dictionary)."""
+        return CacheStats(hits=self.hits, misses=self.misses, size=len(self._entries))
@@ -0,0 +1,54 @@
+"""
+Offline token counting for prompt-size checks.
+Uses tiktoken's cl100k_base as a proxy for the Gemini tokenizer when installed,
+otherwise ~4 UTF-8 bytes per token; exact counts need GeminiClient.count_tokens(exact=True).
+"""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Smallest prompt Gemini accepts for an explicit context cache (flash models)
+MIN_CACHE_TOKENS = 1024
+
+
+@lru_cache(maxsize=1)
+def _encoder() -> Optional[Any]:
+    """Load the proxy encoding once (None without tiktoken)."""
+    if tiktoken is None:
+        return None
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens_local(text: str) -> int:
+    """
+    Estimate the token count of text without an API call.
+
+    Args:
+        text: Text to count tokens for
+
+    Returns:
+        Approximate number of tokens
+    """
+    encoder = _encoder()
+    if encoder is not None:
+        return len(encoder.encode(text, disallowed_special=()))
+    return len(text.encode("utf-8")) // 4
+
+
+def is_cacheable(text: str, min_tokens: int = MIN_CACHE_TOKENS) -> bool:
+    """
+    Check whether text is large enough for an explicit context cache.
+
+    Args:
+        text: Prompt text
+        min_tokens: Minimum cacheable size
+
+    Returns:
+        True if the estimated token count reaches min_tokens
+    """
+    return count_tokens_local(text) >= min_tokens
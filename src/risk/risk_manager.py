@@ -2,13 +2,27 @@
 Risk management system for protecting capital.
 """
 
-from typing import Dict, Any, Optional
+from typing import Optional, NamedTuple
 from loguru import logger
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from src.config.settings import get_settings
 from src.llm.decision_parser import TradingDecision
 from src.config.constants import TradingAction
+from src.execution.position import Position
+
+
+class RiskStatus(NamedTuple):
+    """
+    Snapshot of current risk metrics.
+    """
+
+    daily_pnl: float
+    consecutive_losses: int
+    trading_halted: bool
+    max_daily_loss: float
 
 
 class RiskManager:
@@ -19,6 +33,12 @@ class RiskManager:
     def __init__(self):
         """Initialize risk manager."""
         self.settings = get_settings()
+        # Limits read on every risk check, snapshotted as plain numbers
+        self._risk_per_trade = float(self.settings.risk_per_trade)
+        self._max_position_size = float(self.settings.max_position_size)
+        self._max_daily_loss = float(self.settings.max_daily_loss)
+        self._leverage = float(self.settings.leverage)
+        self._is_futures = self.settings.market_type == "futures"
         self.daily_pnl: float = 0.0
         self.daily_reset_time: datetime = datetime.now()
         self.consecutive_losses: int = 0
@@ -30,7 +50,7 @@ class RiskManager:
         self,
         decision: TradingDecision,
         account_balance: float,
-        current_position: Optional[Dict[str, Any]] = None,
+        current_position: Optional[Position] = None,
     ) -> tuple[bool, str]:
         """
         Validate if decision passes risk checks.
@@ -52,11 +72,11 @@ class RiskManager:
 
         # Check daily loss limit
         daily_loss_pct = abs(self.daily_pnl) / account_balance
-        if daily_loss_pct >= self.settings.max_daily_loss:
+        if daily_loss_pct >= self._max_daily_loss:
             self.is_trading_halted = True
             logger.error(
                 f"Daily loss limit reached: {daily_loss_pct:.1%} "
-                f"(limit: {self.settings.max_daily_loss:.1%})"
+                f"(limit: {self._max_daily_loss:.1%})"
             )
             return False, "Daily loss limit exceeded"
 
@@ -69,7 +89,7 @@ class RiskManager:
 
         # Validate position size
         if decision.action in [TradingAction.BUY, TradingAction.SELL]:
-            max_position_value = account_balance * self.settings.max_position_size
+            max_position_value = account_balance * self._max_position_size
             # This is a simplified check - actual implementation would calculate real position size
             logger.debug(f"Max position value: ${max_position_value:,.2f}")
 
@@ -93,7 +113,7 @@ class RiskManager:
             Position size in base currency
         """
         # Risk per trade in dollars
-        risk_amount = account_balance * self.settings.risk_per_trade
+        risk_amount = account_balance * self._risk_per_trade
 
         # Position size calculation
         # risk_amount = position_size * entry_price * stop_loss_pct
@@ -102,13 +122,13 @@ class RiskManager:
 
         # Apply max position size limit
         max_position_size = (
-            account_balance * self.settings.max_position_size / entry_price
+            account_balance * self._max_position_size / entry_price
         )
         position_size = min(position_size, max_position_size)
 
         # Apply leverage if futures
-        if self.settings.market_type == "futures":
-            position_size *= self.settings.leverage
+        if self._is_futures:
+            position_size *= self._leverage
 
         logger.info(
             f"Calculated position size: {position_size:.8f} "
@@ -117,6 +137,40 @@ class RiskManager:
 
         return position_size
 
+    def calculate_position_sizes_batch(
+        self,
+        balances: np.ndarray,
+        entry_prices: np.ndarray,
+        stop_loss_pcts: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_position_size for backtests and what-if sweeps.
+        Same formula element-wise (inputs broadcast against each other), without per-call logging.
+
+        Args:
+            balances: Account balances
+            entry_prices: Entry prices
+            stop_loss_pcts: Stop loss percentages
+
+        Returns:
+            Position sizes in base currency
+        """
+        balances = np.asarray(balances, dtype=np.float64)
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)
+        stop_loss_pcts = np.asarray(stop_loss_pcts, dtype=np.float64)
+
+        risk_amounts = balances * self._risk_per_trade
+        position_sizes = np.minimum(
+            risk_amounts / (entry_prices * stop_loss_pcts),
+            balances * self._max_position_size / entry_prices,
+        )
+
+        # Apply leverage if futures
+        if self._is_futures:
+            position_sizes *= self._leverage
+
+        return position_sizes
+
     def update_daily_pnl(self, pnl: float) -> None:
         """
         Update daily P&L tracking.
@@ -147,19 +201,19 @@ class RiskManager:
             self.is_trading_halted = False
             self.daily_reset_time = now
 
-    def get_risk_status(self) -> Dict[str, Any]:
+    def get_risk_status(self) -> RiskStatus:
         """
         Get current risk status.
 
         Returns:
-            Dictionary with risk metrics
+            RiskStatus with risk metrics (use `._asdict()` for a dictionary)
         """
-        return {
-            "daily_pnl": self.daily_pnl,
-            "consecutive_losses": self.consecutive_losses,
-            "trading_halted": self.is_trading_halted,
-            "max_daily_loss": self.settings.max_daily_loss,
-        }
+        return RiskStatus(
+            daily_pnl=self.daily_pnl,
+            consecutive_losses=self.consecutive_losses,
+            trading_halted=self.is_trading_halted,
+            max_daily_loss=self._max_daily_loss,
+        )
 
 
 if __name__ == "__main__":
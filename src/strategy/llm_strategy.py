@@ -2,15 +2,21 @@
 LLM-based trading strategy integrating all components.
 """
 
+import asyncio
+import time
+from collections import deque
+from datetime import datetime
+
 import pandas as pd
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
 
-from src.llm.gemini_client import GeminiClient
-from src.llm.prompts import SYSTEM_PROMPT, format_market_data_prompt
+from src.llm.gemini_client import GeminiClient, GeminiError, get_gemini_client
+from src.llm.prompts import JSON_RETRY_SUFFIX, format_market_data_prompt
 from src.llm.decision_parser import DecisionParser, TradingDecision
-from src.data.market_data import MarketData
+from src.data.market_data import MarketData, get_market_data
 from src.config.settings import get_settings
+from src.config.constants import ACTION_CLOSE, TRADE_ACTIONS
 
 
 class LLMTradingStrategy:
@@ -18,6 +24,14 @@ class LLMTradingStrategy:
     Complete LLM-based trading strategy.
     """
 
+    # Responses requested per decision when the answer isn't valid decision JSON
+    # (re-prompted at once: waiting doesn't fix a malformed answer)
+    PARSE_ATTEMPTS = 2
+
+    # Trades kept in memory (oldest dropped first) and trades shown in the prompt
+    MAX_TRADE_HISTORY = 1000
+    PROMPT_TRADES = 3
+
     def __init__(
         self,
         market_data: Optional[MarketData] = None,
@@ -27,17 +41,23 @@ class LLMTradingStrategy:
         Initialize LLM trading strategy.
 
         Args:
-            market_data: MarketData instance (creates new if None)
-            gemini_client: GeminiClient instance (creates new if None)
+            market_data: MarketData instance (shared get_market_data() if None)
+            gemini_client: GeminiClient instance (shared get_gemini_client() if None)
         """
         self.settings = get_settings()
-        self.market_data = market_data or MarketData()
-        self.gemini_client = gemini_client or GeminiClient()
+        self.market_data = market_data or get_market_data()
+        self.gemini_client = gemini_client or get_gemini_client()
         self.parser = DecisionParser()
 
         # Trading state
         self.current_position: Optional[Dict[str, Any]] = None
-        self.trade_history: list = []
+        self.trade_history: deque = deque(maxlen=self.MAX_TRADE_HISTORY)
+        self._recent_trades: deque = deque(maxlen=self.PROMPT_TRADES)
+        # Running win/total counters over every recorded trade
+        self._wins = 0
+        self._total = 0
+        # (symbol, timeframe) -> (market state key, monotonic time, decision), see decision_ttl
+        self._last_decisions: Dict[Tuple[str, str], Tuple[tuple, float, TradingDecision]] = {}
 
         logger.info("LLMTradingStrategy initialized")
 
@@ -60,63 +80,250 @@ class LLMTradingStrategy:
         timeframe = timeframe or self.settings.trading_timeframe
 
         try:
-            # 1. Fetch latest market data
-            logger.info(f"Fetching market data for {symbol} ({timeframe})")
-            df = self.market_data.fetch_latest_data(
-                symbol=symbol,
-                timeframe=timeframe,
-                limit=200,  # Enough for all indicators
-                with_indicators=True,
-            )
+            prompt, state = self._build_prompt(symbol, timeframe)
+            reused = self._reused_decision(symbol, timeframe, state)
+            if reused is not None:
+                return reused
 
-            # 2. Get market summary
-            market_summary = self.market_data.get_market_summary(
-                symbol=symbol,
-                timeframe=timeframe,
-                lookback=100,
-            )
+            # 5-6. Get LLM decision, parse and validate
+            decision = self._request_decision(prompt)
+            return self._finish_decision(decision, (symbol, timeframe, state))
 
-            # 3. Get indicator summary
-            from src.data.indicators import TechnicalIndicators
-            indicators_module = TechnicalIndicators()
-            indicator_summary = indicators_module.get_indicator_summary(df)
-
-            # 4. Format prompt
-            current_price = market_summary["current_price"]
-            prompt = format_market_data_prompt(
-                symbol=symbol,
-                current_price=current_price,
-                market_data=market_summary,
-                indicators=indicator_summary,
-                current_position=self.current_position,
-                recent_trades=self.trade_history[-5:] if self.trade_history else None,
-            )
+        except Exception as e:
+            return self._fallback_decision(e)
 
-            # 5. Get LLM decision
-            logger.info("Requesting decision from Gemini...")
-            llm_response = self.gemini_client.generate_trading_decision(
-                system_prompt=SYSTEM_PROMPT,
-                user_prompt=prompt,
-            )
+    async def analyze_and_decide_async(
+        self,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        as_of: Optional[datetime] = None,
+    ) -> TradingDecision:
+        """
+        Async variant of analyze_and_decide; market data is fetched in a worker thread
+        and the Gemini call runs on the event loop.
 
-            # 6. Parse and validate
-            decision = self.parser.parse(llm_response)
-            decision = self.parser.apply_safety_checks(decision)
+        Args:
+            symbol: Trading symbol (default: from settings)
+            timeframe: Timeframe (default: from settings)
+            as_of: Prompt timestamp (default: now)
 
-            logger.info(
-                f"Decision: {decision.action.value} "
-                f"(confidence: {decision.confidence:.2f})"
-            )
-            logger.info(f"Reasoning: {decision.reasoning}")
+        Returns:
+            TradingDecision
+        """
+        symbol = symbol or self.settings.trading_symbol
+        timeframe = timeframe or self.settings.trading_timeframe
 
-            return decision
+        try:
+            prompt, state = await asyncio.to_thread(self._build_prompt, symbol, timeframe, as_of)
+            reused = self._reused_decision(symbol, timeframe, state)
+            if reused is not None:
+                return reused
+
+            decision = await self._request_decision_async(prompt)
+            return self._finish_decision(decision, (symbol, timeframe, state))
 
         except Exception as e:
-            logger.error(f"Error in analyze_and_decide: {e}")
-            # Return safe default
+            return self._fallback_decision(e)
+
+    async def analyze_symbols(
+        self,
+        symbols: List[str],
+        timeframe: Optional[str] = None,
+    ) -> Dict[str, TradingDecision]:
+        """
+        Analyze several symbols concurrently.
+        At most `gemini_max_concurrency` symbols are in flight at once, to stay under the API rate limit.
+
+        Args:
+            symbols: Trading symbols
+            timeframe: Timeframe (default: from settings)
+
+        Returns:
+            Dict of symbol -> TradingDecision (HOLD for symbols that failed)
+        """
+        semaphore = asyncio.Semaphore(self.settings.gemini_max_concurrency)
+        # One timestamp for the whole batch
+        as_of = datetime.now()
+
+        async def analyze(symbol: str) -> TradingDecision:
+            async with semaphore:
+                return await self.analyze_and_decide_async(symbol, timeframe, as_of)
+
+        decisions = await asyncio.gather(*(analyze(symbol) for symbol in symbols))
+        return dict(zip(symbols, decisions))
+
+    def _build_prompt(
+        self,
+        symbol: str,
+        timeframe: str,
+        as_of: Optional[datetime] = None,
+    ) -> Tuple[str, tuple]:
+        """
+        Fetch market data and format the decision prompt (blocking I/O).
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe
+            as_of: Prompt timestamp (default: now)
+
+        Returns:
+            (market data prompt, quantized market state used to reuse decisions)
+        """
+        # 1. Fetch latest market data
+        logger.info(f"Fetching market data for {symbol} ({timeframe})")
+        df = self.market_data.fetch_latest_data(
+            symbol=symbol,
+            timeframe=timeframe,
+            limit=200,  # Enough for all indicators
+            with_indicators=True,
+        )
+
+        # 2. Get market summary
+        market_summary = self.market_data.get_market_summary(
+            symbol=symbol,
+            timeframe=timeframe,
+            lookback=100,
+        )
+
+        # 3. Get indicator summary
+        from src.data.indicators import TechnicalIndicators
+        indicators_module = TechnicalIndicators()
+        indicator_summary = indicators_module.get_indicator_summary(df)
+
+        # 4. Format prompt
+        # Position and trade history belong to the traded symbol only
+        own_symbol = symbol == self.settings.trading_symbol
+        position = self.current_position if own_symbol else None
+        current_price = market_summary["current_price"]
+        prompt = format_market_data_prompt(
+            symbol=symbol,
+            current_price=current_price,
+            market_data=market_summary,
+            indicators=indicator_summary,
+            current_position=position,
+            recent_trades=(list(self._recent_trades) or None) if own_symbol else None,
+            trade_stats=(self._wins, self._total) if own_symbol else None,
+            as_of=as_of,
+        )
+        # Price to 5 significant digits: ~$1 on BTC, and as fine relative to price on cheap symbols
+        state = (
+            float(f"{current_price:.5g}"),
+            round(indicator_summary.get("rsi", 50), 1),
+            indicator_summary.get("trend"),
+            indicator_summary.get("macd_signal_direction"),
+            position is not None,
+        )
+        return prompt, state
+
+    def _reused_decision(self, symbol: str, timeframe: str, state: tuple) -> Optional[TradingDecision]:
+        """
+        Get the last decision for a symbol if the market state hasn't moved since.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe
+            state: Quantized market state from _build_prompt
+
+        Returns:
+            Previous TradingDecision, or None if Gemini should be asked
+        """
+        last = self._last_decisions.get((symbol, timeframe))
+        if last is None or last[0] != state:
+            return None
+        if time.monotonic() - last[1] >= self.settings.decision_ttl:
+            return None
+        logger.info("Decision reused from state-hash cache: {} ({})", last[2].action.value, symbol)
+        return last[2]
+
+    def _finish_decision(
+        self,
+        decision: TradingDecision,
+        cache_key: Optional[Tuple[str, str, tuple]] = None,
+    ) -> TradingDecision:
+        """Apply safety checks to a parsed decision, log it and remember it for (symbol, timeframe, state)."""
+        decision = self.parser.apply_safety_checks(decision)
+        if cache_key is not None and self.settings.decision_ttl > 0:
+            symbol, timeframe, state = cache_key
+            self._last_decisions[(symbol, timeframe)] = (state, time.monotonic(), decision)
+
+        logger.info(
+            f"Decision: {decision.action.value} "
+            f"(confidence: {decision.confidence:.2f})"
+        )
+        logger.info(f"Reasoning: {decision.reasoning}")
+
+        return decision
+
+    def _fallback_decision(self, error: Exception) -> TradingDecision:
+        """Safe HOLD decision for a failed analysis."""
+        if isinstance(error, GeminiError):
+            # Retries exhausted or permanent failure: hold and keep trading
+            logger.warning(f"Gemini unavailable ({type(error).__name__}), holding")
             return self.parser.create_hold_decision(
-                reason=f"Error occurred: {str(e)[:100]}"
+                reason=f"Gemini unavailable: {str(error)[:100]}"
             )
+        logger.error(f"Error in analyze_and_decide: {error}")
+        # Return safe default
+        return self.parser.create_hold_decision(
+            reason=f"Error occurred: {str(error)[:100]}"
+        )
+
+    def _request_decision(self, prompt: str) -> TradingDecision:
+        """
+        Ask Gemini for a decision and parse it, re-prompting immediately on unparseable output.
+
+        Args:
+            prompt: Market data prompt
+
+        Returns:
+            Parsed TradingDecision
+
+        Raises:
+            ValueError: If no response parsed within PARSE_ATTEMPTS
+            GeminiError: If the API call fails
+        """
+        logger.info("Requesting decision from Gemini...")
+        user_prompt = prompt
+        for attempt in range(1, self.PARSE_ATTEMPTS + 1):
+            # SYSTEM_PROMPT is bound once as the client's system instruction
+            llm_response = self.gemini_client.generate_trading_decision(user_prompt=user_prompt)
+            try:
+                return self.parser.parse(llm_response)
+            except ValueError:
+                if attempt == self.PARSE_ATTEMPTS:
+                    raise
+                logger.warning("Unparseable decision, re-prompting ({}/{})", attempt, self.PARSE_ATTEMPTS)
+                user_prompt = prompt + JSON_RETRY_SUFFIX
+
+    async def _request_decision_async(self, prompt: str) -> TradingDecision:
+        """
+        Async variant of _request_decision.
+
+        Args:
+            prompt: Market data prompt
+
+        Returns:
+            Parsed TradingDecision
+
+        Raises:
+            ValueError: If no response parsed within PARSE_ATTEMPTS
+            GeminiError: If the API call fails
+        """
+        user_prompt = prompt
+        for attempt in range(1, self.PARSE_ATTEMPTS + 1):
+            llm_response = await self.gemini_client.generate_trading_decision_async(user_prompt=user_prompt)
+            try:
+                return self.parser.parse(llm_response)
+            except ValueError:
+                if attempt == self.PARSE_ATTEMPTS:
+                    raise
+                logger.warning("Unparseable decision, re-prompting ({}/{})", attempt, self.PARSE_ATTEMPTS)
+                user_prompt = prompt + JSON_RETRY_SUFFIX
+
+    @property
+    def win_rate(self) -> float:
+        """Share of recorded trades with positive P&L (0.0 before the first trade)."""
+        return self._wins / self._total if self._total else 0.0
 
     def update_position(
         self,
@@ -125,14 +332,14 @@ class LLMTradingStrategy:
         size: float,
     ) -> None:
         """Update current position state."""
-        if action in ["BUY", "SELL"]:
+        if action in TRADE_ACTIONS:
             self.current_position = {
                 "action": action,
                 "entry_price": entry_price,
                 "size": size,
                 "timestamp": pd.Timestamp.now(),
             }
-        elif action == "CLOSE":
+        elif action == ACTION_CLOSE:
             self.current_position = None
 
     def record_trade(
@@ -152,6 +359,9 @@ class LLMTradingStrategy:
             "timestamp": pd.Timestamp.now(),
         }
         self.trade_history.append(trade)
+        self._recent_trades.append(trade)
+        self._total += 1
+        self._wins += pnl > 0
         logger.info(f"Trade recorded: {action} P&L: ${pnl:+.2f}")
 
 
@@ -0,0 +1,148 @@
+"""
+TradeExecutor protective-order tests against a stub BinanceClient (no network).
+"""
+
+import ccxt
+import pytest
+
+from src.config.constants import OrderSide
+from src.config.settings import reload_settings
+from src.execution.trade_executor import TradeExecutor
+from src.llm.decision_parser import TradingDecision
+
+
+ENTRY_PRICE = 100.0
+SETTINGS_ENV = {
+    "GEMINI_API_KEY": "test-key",
+    "TRADING_MODE": "demo",
+    "MARKET_TYPE": "futures",
+    "PRICE_STREAM_ENABLED": "false",
+    "PROTECTIVE_ORDERS_ENABLED": "true",
+    # Market entries only (no post-only polling)
+    "MAKER_ONLY_CONFIDENCE_THRESHOLD": "1.0",
+}
+
+
+class StubClient:
+    """
+    Stands in for BinanceClient: fills market orders at `price` and records every call.
+    """
+
+    def __init__(self):
+        self.price = ENTRY_PRICE
+        self.batch_results = [
+            {"id": "sl-1", "type": "STOP_MARKET", "status": "open"},
+            {"id": "tp-1", "type": "TAKE_PROFIT_MARKET", "status": "open"},
+        ]
+        # order id -> fetch_order response (unknown ids are open and unfilled)
+        self.orders = {}
+        # Raised by reduce-only market orders when set
+        self.reduce_only_error = None
+        self.market_orders = []
+        self.cancelled = []
+
+    def start_ticker_stream(self, symbol=None):
+        pass
+
+    def last_price(self, symbol=None):
+        return self.price
+
+    def tradable_amount(self, amount, symbol=None):
+        return amount
+
+    def create_market_order(self, side, amount, symbol=None, params=None):
+        self.market_orders.append({"side": side, "amount": amount, "params": params})
+        if self.reduce_only_error is not None and (params or {}).get("reduceOnly"):
+            raise self.reduce_only_error
+        return {"id": f"m-{len(self.market_orders)}", "status": "closed", "filled": amount, "average": self.price}
+
+    def create_orders_batch(self, orders):
+        return self.batch_results
+
+    def fetch_order(self, order_id, symbol=None):
+        return self.orders.get(order_id, {"id": order_id, "status": "open", "filled": 0.0})
+
+    def cancel_order(self, order_id, symbol=None):
+        if self.orders.get(order_id, {}).get("status") == "closed":
+            raise ccxt.OrderNotFound(f'binance {{"code":-2011,"msg":"Unknown order sent."}} {order_id}')
+        self.cancelled.append(order_id)
+        return {"id": order_id, "status": "canceled"}
+
+
+@pytest.fixture
+def client():
+    return StubClient()
+
+
+@pytest.fixture
+def executor(monkeypatch, client):
+    for name, value in SETTINGS_ENV.items():
+        monkeypatch.setenv(name, value)
+    reload_settings()
+    return TradeExecutor(client=client)
+
+
+def _decision(action: str) -> TradingDecision:
+    return TradingDecision(action=action, confidence=0.8, reasoning="test decision for the executor")
+
+
+def _open_long(executor: TradeExecutor) -> None:
+    result = executor.execute_decision(_decision("BUY"), 1.0)
+    assert result["status"] == "success"
+
+
+def _trigger(client: StubClient, order_id: str, average: float) -> None:
+    client.orders[order_id] = {"id": order_id, "type": "STOP_MARKET", "status": "closed", "filled": 1.0, "average": average}
+
+
+def test_rejected_batch_leg_is_not_tracked(executor, client):
+    client.batch_results[1] = {"id": None, "info": {"code": -2021, "msg": "Order would immediately trigger."}}
+
+    _open_long(executor)
+
+    assert [order["id"] for order in executor.open_orders] == ["sl-1"]
+    assert executor.current_position.size == 1.0
+
+
+def test_reduce_only_rejection_settles_from_triggered_order(executor, client):
+    _open_long(executor)
+    _trigger(client, "sl-1", average=95.0)
+    client.reduce_only_error = ccxt.InvalidOrder('binance {"code":-2022,"msg":"ReduceOnly Order is rejected."}')
+    client.price = 97.0
+
+    result = executor.execute_decision(_decision("CLOSE"), 1.0)
+
+    assert client.market_orders[-1]["side"] == OrderSide.SELL
+    assert client.market_orders[-1]["params"] == {"reduceOnly": True}
+    assert result["status"] == "success"
+    assert result["exit_price"] == 95.0
+    assert result["pnl"] == pytest.approx(-5.0)
+    assert executor.current_position is None
+    assert executor.open_orders == []
+    assert client.cancelled == ["tp-1"]
+
+
+def test_sync_with_exchange_picks_up_triggered_stop(executor, client):
+    _open_long(executor)
+    assert executor.sync_with_exchange() is None
+
+    _trigger(client, "sl-1", average=95.0)
+    result = executor.sync_with_exchange()
+
+    assert result["pnl"] == pytest.approx(-5.0)
+    assert result["order"]["id"] == "sl-1"
+    assert executor.current_position is None
+    assert client.cancelled == ["tp-1"]
+    assert executor.sync_with_exchange() is None
+
+
+def test_close_cancels_only_own_protective_orders(executor, client):
+    # An order placed outside the bot on the same symbol
+    client.orders["manual-1"] = {"id": "manual-1", "status": "open", "filled": 0.0}
+    _open_long(executor)
+
+    result = executor.execute_decision(_decision("CLOSE"), 1.0)
+
+    assert result["status"] == "success"
+    assert client.cancelled == ["sl-1", "tp-1"]
+    assert executor.open_orders == []